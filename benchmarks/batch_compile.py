@@ -0,0 +1,76 @@
+import sys
+import time
+from collections.abc import Callable
+
+from src import language_tables
+from src.batch import compile_batch, compile_source
+from src.parser.cfg import CFG
+from src.scanner.compiled_dfa import CompiledDFA
+from src.scanner.scanner import Scanner
+from src.scanner.tokens import Tokens
+from src.scanner.transition_table import TransitionTable
+
+from .source import generate_source
+
+
+def thawed_tables() -> None:
+    """Thaw a private copy of the scanner tables and grammar, as every file did."""
+    artifact = language_tables.load()
+    for cls, name in [
+        (Tokens, "tokens"),
+        (TransitionTable, "automaton"),
+        (CompiledDFA, "dfa"),
+        (CFG, "cfg"),
+    ]:
+        language_tables.thaw(cls.__new__(cls), artifact[name])
+
+
+def shared_tables() -> None:
+    """Get the shared, read-only scanner tables and grammar."""
+    Scanner(source="")
+    CFG()
+
+
+def measure(compile_all: Callable, repeat: int = 3) -> float:
+    """
+    Measure the best time taken to compile every source.
+
+    Args:
+        compile_all (Callable): Function that compiles every source
+        repeat (int): Number of repetitions
+
+    Returns:
+        float: Fastest time, in seconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = compile_all()
+        best = min(best, time.perf_counter() - start)
+    assert all(result.success for result in results)
+    return best
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    sources = {
+        f"source{n}.cmm": generate_source(5_000, seed=n) for n in range(count)
+    }
+
+    setups = 1_000
+    for setup in [thawed_tables, shared_tables]:
+        start = time.perf_counter()
+        for _ in range(setups):
+            setup()
+        elapsed = (time.perf_counter() - start) / setups * 1e6
+        print(f"{setup.__name__:18}{elapsed:10.1f} us per source")
+
+    cfg = CFG()
+    serial = measure(
+        lambda: [compile_source(source, cfg) for source in sources.items()]
+    )
+    print(f"Compiled {count} sources")
+    print(f"{'serial':18}{count / serial:10,.0f} sources/s")
+    for workers in [1, 2, 4, 8]:
+        elapsed = measure(lambda: compile_batch(sources, workers=workers))
+        print(f"{f'{workers} threads':18}{count / elapsed:10,.0f} sources/s")
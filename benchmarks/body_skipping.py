@@ -0,0 +1,67 @@
+import sys
+import time
+
+from src.scanner.scanner import Scanner
+
+from .source import generate_source
+
+DOCUMENTED_TEMPLATE = """/* {text} */
+{function}write "{text}";
+"""
+
+
+def generate_documented_source(size: int) -> str:
+    """
+    Generate a C-- program where most characters are inside comments and strings.
+
+    Args:
+        size (int): Approximate number of characters of the generated program
+
+    Returns:
+        str: Source code of the generated program
+    """
+    text = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20
+    parts = []
+    length = 0
+    seed = 0
+    while length < size:
+        function = generate_source(1, seed=seed).rsplit("void main", 1)[0]
+        part = DOCUMENTED_TEMPLATE.format(text=text, function=function)
+        parts.append(part)
+        length += len(part)
+        seed += 1
+    return "".join(parts)
+
+
+def measure(source: str, chunk_size: int, keep_comments: bool = True) -> float:
+    """
+    Scan a source and compute the scanner throughput.
+
+    Args:
+        source (str): Source code to be scanned
+        chunk_size (int): Number of characters read at a time
+        keep_comments (bool): Whether to save comments to their symbol table
+
+    Returns:
+        float: Characters scanned per second
+    """
+    scanner = Scanner(
+        source=source, chunk_size=chunk_size, keep_comments=keep_comments
+    )
+    start = time.perf_counter()
+    scanner.scan()
+    return len(source) / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    source = generate_documented_source(size)
+
+    # Blocks of one character leave no body to search, like the old loop
+    stepped = measure(source, chunk_size=1)
+    skipped = measure(source, chunk_size=64 * 1024)
+    dropped = measure(source, chunk_size=64 * 1024, keep_comments=False)
+    print(f"Scanned {len(source):,} characters, mostly comments and strings")
+    print(f"character by character {stepped:12,.0f} chars/s")
+    print(f"skipped bodies         {skipped:12,.0f} chars/s{skipped / stepped:8.2f}x")
+    print(f"dropped comments       {dropped:12,.0f} chars/s{dropped / stepped:8.2f}x")
@@ -0,0 +1,45 @@
+import sys
+import time
+
+from src.parser.cfg import CFG
+from src.parser.parser import DescentParser, Parser
+from src.scanner.scanner import Scanner
+
+from .source import generate_source
+
+
+def measure(scanner: Scanner, parser_class: type, repeat: int = 5) -> float:
+    """
+    Parse the output of a scanner and measure the best time taken.
+
+    Args:
+        scanner (Scanner): Scanner whose output is parsed
+        parser_class (type): Table-driven or recursive descent parser
+        repeat (int): Number of parses
+
+    Returns:
+        float: Tokens parsed per second
+    """
+    cfg = CFG()
+    best = float("inf")
+    for _ in range(repeat):
+        parser = parser_class(scanner, cfg)
+        start = time.perf_counter()
+        assert parser.parse()
+        best = min(best, time.perf_counter() - start)
+    return len(scanner.output) / best
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    scanner = Scanner(source=generate_source(size))
+    scanner.scan()
+
+    # Warm up, so the generated parser is loaded before it is timed
+    measure(scanner, DescentParser, repeat=1)
+    print(f"Parsed {len(scanner.output):,} tokens")
+    table = measure(scanner, Parser)
+    descent = measure(scanner, DescentParser)
+    print(f"{'table':18}{table:12,.0f} tokens/s")
+    print(f"{'recursive descent':18}{descent:12,.0f} tokens/s")
+    print(f"{'speedup':18}{descent / table:12.2f}x")
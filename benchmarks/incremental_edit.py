@@ -0,0 +1,30 @@
+import sys
+import time
+
+from src.scanner.incremental import IncrementalScanner
+
+from .source import write_source
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    path = write_source(size, unique=False)
+
+    try:
+        scanner = IncrementalScanner(path)
+        start = time.perf_counter()
+        scanner.scan()
+        full = time.perf_counter() - start
+    finally:
+        path.unlink()
+
+    # Type a statement character by character in the middle of the source
+    offset = scanner.text.index("    i = 0;\n", len(scanner.text) // 2)
+    statement = "    i = i + total;\n"
+    start = time.perf_counter()
+    for idx, char in enumerate(statement):
+        scanner.edit(offset + idx, offset + idx, char)
+    edits = (time.perf_counter() - start) / len(statement)
+
+    print(f"Scanned {size:,} characters")
+    print(f"full scan   {full * 1000:10.2f} ms")
+    print(f"per edit    {edits * 1000:10.2f} ms{full / edits:10.0f}x")
@@ -0,0 +1,46 @@
+import sys
+import time
+import tracemalloc
+
+from src.scanner.scanner import Scanner
+
+from .source import generate_source
+
+
+def measure(source: str, span_tables: bool) -> tuple[float, int]:
+    """
+    Scan a source and measure the time taken and the memory held by the scanner.
+
+    Args:
+        source (str): Source code to be scanned
+        span_tables (bool): Whether strings and comments are saved as spans
+
+    Returns:
+        tuple[float, int]: Characters scanned per second, and bytes held by the
+                           string and comment symbol tables after scanning
+    """
+    scanner = Scanner(source=source, span_tables=span_tables)
+    start = time.perf_counter()
+    scanner.scan()
+    speed = len(source) / (time.perf_counter() - start)
+
+    tracemalloc.start()
+    scanner = Scanner(source=source, span_tables=span_tables)
+    before = tracemalloc.get_traced_memory()[0]
+    scanner.scan()
+    del scanner.output[:]
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return speed, held
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    source = generate_source(size)
+
+    copies = measure(source, span_tables=False)
+    spans = measure(source, span_tables=True)
+    print(f"Scanned {len(source):,} characters")
+    print(f"{'':14}{'chars/s':>14}{'tables (bytes)':>16}")
+    print(f"{'copied text':14}{copies[0]:>14,.0f}{copies[1]:>16,}")
+    print(f"{'span tables':14}{spans[0]:>14,.0f}{spans[1]:>16,}")
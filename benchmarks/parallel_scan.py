@@ -0,0 +1,47 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+from src.scanner.parallel import ParallelScanner
+from src.scanner.scanner import Scanner
+
+from .source import write_source
+
+
+def measure(path: Path, workers: int) -> float:
+    """
+    Scan a file with a number of worker processes and time it.
+
+    Args:
+        path (Path): Path of the file to be scanned
+        workers (int): Number of worker processes, or 1 for a serial scan
+
+    Returns:
+        float: Seconds taken by the scan
+    """
+    if workers > 1:
+        scanner = ParallelScanner(path, workers=workers)
+    else:
+        scanner = Scanner(path)
+    start = time.perf_counter()
+    scanner.scan()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000_000
+    cpus = os.cpu_count() or 1
+    path = write_source(size, unique=False)
+
+    try:
+        serial = measure(path, 1)
+        print(f"Scanned {size:,} characters, {cpus} CPUs available")
+        print(f"{1:3} worker  {serial:8.2f} s")
+        workers = 2
+        while workers <= max(cpus, 2):
+            elapsed = measure(path, workers)
+            print(f"{workers:3} workers {elapsed:8.2f} s{serial / elapsed:8.2f}x")
+            workers *= 2
+    finally:
+        path.unlink()
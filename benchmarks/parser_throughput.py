@@ -0,0 +1,46 @@
+import os
+import sys
+import time
+
+from src.parser.cfg import CFG
+from src.parser.parser import Parser
+from src.parser.tracing import LEVELS, FileWriter, Tracer
+from src.scanner.scanner import Scanner
+
+from .source import generate_source
+
+
+def measure(scanner: Scanner, level: str, repeat: int = 5) -> float:
+    """
+    Parse the output of a scanner and measure the best time taken.
+
+    Traced events are written to the null device.
+
+    Args:
+        scanner (Scanner): Scanner whose output is parsed
+        level (str): Tracing level
+        repeat (int): Number of parses
+
+    Returns:
+        float: Tokens parsed per second
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        tracer = Tracer(level, FileWriter(os.devnull))
+        parser = Parser(scanner, CFG(), tracer)
+        start = time.perf_counter()
+        parser.parse()
+        best = min(best, time.perf_counter() - start)
+    return len(scanner.output) / best
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    scanner = Scanner(source=generate_source(size))
+    scanner.scan()
+
+    # Warm up, so the first level is not charged for growing the heap
+    measure(scanner, "off", repeat=1)
+    print(f"Parsed {len(scanner.output):,} tokens")
+    for level in LEVELS:
+        print(f"trace {level:12}{measure(scanner, level):12,.0f} tokens/s")
@@ -0,0 +1,46 @@
+import sys
+import time
+from pathlib import Path
+
+from src.scanner.scanner import Scanner
+
+from .source import write_source
+
+
+def measure(path: Path, backend: str, repeat: int = 3) -> float:
+    """
+    Scan a file with a backend and compute the best scanner throughput.
+
+    Args:
+        path (Path): Path of the file to be scanned
+        backend (str): Scanner backend to be measured
+        repeat (int): Number of scans, the fastest one is kept
+
+    Returns:
+        float: Characters scanned per second
+    """
+    size = len(path.read_text(encoding="utf-8"))
+    elapsed = float("inf")
+
+    for _ in range(repeat):
+        scanner = Scanner(path, backend=backend)
+        start = time.perf_counter()
+        scanner.scan()
+        elapsed = min(elapsed, time.perf_counter() - start)
+
+    return size / elapsed
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    path = write_source(size, unique=False)
+
+    try:
+        results = {backend: measure(path, backend) for backend in Scanner.backends}
+    finally:
+        path.unlink()
+
+    print(f"Scanned {size:,} characters")
+    for backend, throughput in results.items():
+        speedup = throughput / results["table"]
+        print(f"{backend:10}{throughput:14,.0f} chars/s{speedup:8.2f}x")
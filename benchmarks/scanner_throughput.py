@@ -0,0 +1,44 @@
+import sys
+import time
+from pathlib import Path
+
+from src.scanner.scanner import Scanner
+
+from .source import write_source
+
+
+def measure(path: Path, chunk_size: int) -> float:
+    """
+    Scan a file and compute the scanner throughput.
+
+    Args:
+        path (Path): Path of the file to be scanned
+        chunk_size (int): Number of characters read from the file at a time
+
+    Returns:
+        float: Characters scanned per second
+    """
+    scanner = Scanner(path, chunk_size=chunk_size)
+    size = len(path.read_text(encoding="utf-8"))
+
+    start = time.perf_counter()
+    scanner.scan()
+    elapsed = time.perf_counter() - start
+    return size / elapsed
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    path = write_source(size, unique=False)
+
+    try:
+        # A chunk size of 1 issues one read call per character, like the old loop
+        before = measure(path, chunk_size=1)
+        after = measure(path, chunk_size=64 * 1024)
+    finally:
+        path.unlink()
+
+    print(f"Scanned {size:,} characters")
+    print(f"read(1) per character: {before:12,.0f} chars/s")
+    print(f"64 KiB block buffer:   {after:12,.0f} chars/s")
+    print(f"Speedup:               {after / before:12.2f}x")
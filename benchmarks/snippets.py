@@ -0,0 +1,41 @@
+import sys
+import time
+
+from src.scanner.scanner import Scanner
+
+from .source import generate_source, write_text
+
+
+def measure(snippets: list, in_memory: bool) -> float:
+    """
+    Scan many small sources, from memory or through temporary files.
+
+    Args:
+        snippets (list[str]): Source code of every snippet
+        in_memory (bool): Whether to scan the strings instead of writing files
+
+    Returns:
+        float: Snippets scanned per second
+    """
+    start = time.perf_counter()
+    for text in snippets:
+        if in_memory:
+            Scanner(source=text).scan()
+        else:
+            path = write_text(text)
+            try:
+                Scanner(path).scan()
+            finally:
+                path.unlink()
+    return len(snippets) / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    snippets = [generate_source(100, seed=seed) for seed in range(count)]
+
+    files = measure(snippets, in_memory=False)
+    memory = measure(snippets, in_memory=True)
+    print(f"Scanned {count:,} snippets of {len(snippets[0]):,} characters")
+    print(f"temporary files {files:12,.0f} snippets/s")
+    print(f"in memory       {memory:12,.0f} snippets/s{memory / files:8.2f}x")
@@ -0,0 +1,100 @@
+import random
+import tempfile
+from pathlib import Path
+
+FUNCTION_TEMPLATE = """/* Function number {n}, generated for benchmarking.
+   It reads an array, scales it and writes it back. */
+float {name}(int {arr}[], float factor) {{
+    int i;
+    float total;
+    string label;
+    i = 0;
+    total = 0.5;
+    while (i < {size}) {{
+        if ({arr}[i] >= {limit}) {{
+            total = total + {arr}[i] * factor / 2.25;
+        }}
+        else {{
+            {arr}[i] = ({arr}[i] - 1) * {limit};
+        }}
+        label = "{name} step";
+        i = i + 1;
+    }}
+    return total;
+}}
+
+"""
+
+MAIN_TEMPLATE = """void main(void) {
+    int values[10];
+    string label;
+    read values;
+    label = "done";
+    return;
+}
+"""
+
+
+def generate_source(size: int, unique: bool = True, seed: int = 0) -> str:
+    """
+    Generate a syntactically valid C-- program of roughly `size` characters.
+
+    Args:
+        size (int): Approximate number of characters of the generated program
+        unique (bool): Whether every function uses its own identifiers
+        seed (int): Seed for the pseudo random constants
+
+    Returns:
+        str: Source code of the generated program
+    """
+    rng = random.Random(seed)
+    parts = []
+    length = 0
+    n = 0
+
+    while length < size:
+        suffix = n if unique else n % 10
+        function = FUNCTION_TEMPLATE.format(
+            n=n,
+            name=f"scale{suffix}",
+            arr=f"data{suffix}",
+            size=rng.randint(1, 1000),
+            limit=rng.randint(1, 100),
+        )
+        parts.append(function)
+        length += len(function)
+        n += 1
+
+    parts.append(MAIN_TEMPLATE)
+    return "".join(parts)
+
+
+def write_text(text: str) -> Path:
+    """
+    Write C-- source code to a temporary file.
+
+    Args:
+        text (str): Source code to be written
+
+    Returns:
+        Path: Path of the temporary file holding the source code
+    """
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".cmm", delete=False, encoding="utf-8"
+    ) as file:
+        file.write(text)
+    return Path(file.name)
+
+
+def write_source(size: int, unique: bool = True) -> Path:
+    """
+    Write a generated C-- program to a temporary file.
+
+    Args:
+        size (int): Approximate number of characters of the generated program
+        unique (bool): Whether every function uses its own identifiers
+
+    Returns:
+        Path: Path of the temporary file holding the program
+    """
+    return write_text(generate_source(size, unique))
@@ -0,0 +1,77 @@
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+
+from src import language_tables
+from src.parser.cfg import CFG
+from src.scanner.compiled_dfa import CompiledDFA
+from src.scanner.scanner import Scanner
+from src.scanner.tokens import Tokens
+from src.scanner.transition_table import TransitionTable
+
+FIRST_TOKEN = (
+    "from src.scanner.scanner import Scanner; from src.parser.cfg import CFG; "
+    "Scanner(source='int x;').scan(); CFG()"
+)
+
+
+def from_sources() -> None:
+    """Build the scanner tables and grammar from the data files."""
+    token_helper = Tokens()
+    automaton = TransitionTable()
+    CompiledDFA(automaton, token_helper)
+    CFG(precompiled=False)
+
+
+def from_artifact() -> None:
+    """Load the scanner tables and grammar from the language tables artifact."""
+    Scanner(source="")
+    CFG()
+
+
+def measure(setup: Callable, count: int) -> float:
+    """
+    Measure the average time taken to set up the language tables.
+
+    Args:
+        setup (Callable): Function that builds or loads the tables
+        count (int): Number of repetitions
+
+    Returns:
+        float: Milliseconds per repetition
+    """
+    start = time.perf_counter()
+    for _ in range(count):
+        setup()
+    return (time.perf_counter() - start) / count * 1e3
+
+
+def fresh_process(code: str, count: int) -> float:
+    """
+    Measure the best time taken by a new interpreter to run some code.
+
+    Args:
+        code (str): Code to be run
+        count (int): Number of processes started
+
+    Returns:
+        float: Fastest time, in milliseconds
+    """
+    times = []
+    for _ in range(count):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1e3
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    language_tables.load()
+
+    print(f"Setting up the language tables {count:,} times")
+    print(f"from data files {measure(from_sources, count):10.3f} ms")
+    print(f"from artifact   {measure(from_artifact, count):10.3f} ms")
+    print(f"new interpreter {fresh_process('pass', 10):10.1f} ms")
+    print(f"first token     {fresh_process(FIRST_TOKEN, 10):10.1f} ms")
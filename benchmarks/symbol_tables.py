@@ -0,0 +1,38 @@
+import sys
+import time
+
+from src.scanner.scanner import Scanner
+
+from .source import write_text
+
+
+def measure(count: int) -> float:
+    """
+    Scan a file declaring `count` distinct identifiers.
+
+    Args:
+        count (int): Number of distinct identifiers in the file
+
+    Returns:
+        float: Seconds spent scanning the file
+    """
+    path = write_text("".join(f"int v{n};\n" for n in range(count)))
+
+    try:
+        scanner = Scanner(path)
+        start = time.perf_counter()
+        scanner.scan()
+        return time.perf_counter() - start
+    finally:
+        path.unlink()
+
+
+if __name__ == "__main__":
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    for count in (largest // 4, largest // 2, largest):
+        elapsed = measure(count)
+        print(
+            f"{count:>9,} identifiers: {elapsed:7.3f} s "
+            f"({elapsed / count * 1e6:6.2f} us per identifier)"
+        )
@@ -0,0 +1,48 @@
+import sys
+import time
+import tracemalloc
+
+from src.parser.cfg import CFG
+from src.parser.parser import Parser
+from src.scanner.scanner import Scanner
+
+from .source import generate_source
+
+
+def measure(scanner: Scanner, tree: str | None) -> tuple[float, int, int]:
+    """
+    Parse the output of a scanner, building a syntax tree, and measure it.
+
+    Args:
+        scanner (Scanner): Scanner whose output is parsed
+        tree (str | None): Syntax tree to be built, or None to only check syntax
+
+    Returns:
+        tuple[float, int, int]: Tokens parsed per second, nodes of the tree and
+                                bytes held by the tree after parsing
+    """
+    parser = Parser(scanner, CFG())
+    start = time.perf_counter()
+    parser.parse(tree=tree)
+    speed = len(scanner.output) / (time.perf_counter() - start)
+
+    tracemalloc.start()
+    parser = Parser(scanner, CFG())
+    before = tracemalloc.get_traced_memory()[0]
+    parser.parse(tree=tree)
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return speed, len(parser.tree or ()), held
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    scanner = Scanner(source=generate_source(size))
+    scanner.scan()
+
+    print(f"Parsed {len(scanner.output):,} tokens")
+    print(f"{'':10}{'tokens/s':>12}{'nodes':>12}{'bytes':>14}{'bytes/node':>12}")
+    for tree in [None, "concrete", "abstract"]:
+        speed, nodes, held = measure(scanner, tree)
+        per_node = f"{held / nodes:12.1f}" if nodes else f"{'':12}"
+        print(f"{tree or 'none':10}{speed:12,.0f}{nodes:12,}{held:14,}{per_node}")
@@ -0,0 +1,56 @@
+import sys
+import tracemalloc
+from collections import deque
+from pathlib import Path
+
+from src.scanner.scanner import Scanner
+
+from .source import write_source
+
+
+def measure(path: Path, mode: str) -> tuple[int, int]:
+    """
+    Scan a file and trace the memory allocated while doing so.
+
+    Args:
+        path (Path): Path of the file to be scanned
+        mode (str): Either "discard" to drop the tokens, "list" to save them to a
+                    list or "stream" to save them to a TokenStream
+
+    Returns:
+        tuple[int, int]: Memory retained after scanning and peak memory, in bytes
+    """
+    tracemalloc.start()
+    scanner = Scanner(path, token_stream=mode == "stream")
+    if mode == "discard":
+        deque(scanner.tokens(), maxlen=0)
+    else:
+        scanner.scan()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, peak
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    path = write_source(size, unique=False)
+
+    try:
+        scanner = Scanner(path)
+        count = len(scanner.scan()[0])
+        floor, floor_peak = measure(path, "discard")
+        results = {mode: measure(path, mode) for mode in ("list", "stream")}
+    finally:
+        path.unlink()
+
+    print(f"Scanned {size:,} characters into {count:,} tokens")
+    print(f"Scanner state without output: {floor:,} bytes (peak {floor_peak:,})")
+    print(f"{'':14}{'output':>14}{'per token':>12}{'peak':>14}")
+    for mode, (current, peak) in results.items():
+        output = current - floor
+        print(f"{mode:14}{output:>14,}{output / count:>12.1f}{peak:>14,}")
+
+    list_output = results["list"][0] - floor
+    stream_output = results["stream"][0] - floor
+    print(f"Output reduction: {list_output / stream_output:.1f}x")
+    print(f"Peak reduction:   {results['list'][1] / results['stream'][1]:.1f}x")
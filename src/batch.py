@@ -0,0 +1,177 @@
+import os
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+
+from .parser.cfg import CFG
+from .parser.parser import DescentParser, Parser
+from .scanner.errors import ScanError
+from .scanner.scanner import Scanner
+
+
+class BatchResult:
+    """Class to represent the result of compiling one source of a batch."""
+
+    def __init__(
+        self, name: str, scanner: Scanner, parser: Parser | None = None
+    ) -> None:
+        """
+        Initialize constructor for BatchResult class.
+
+        Args:
+            name (str): Filename, or name given to the in-memory source
+            scanner (Scanner): Scanner of the source, with its tokens and tables
+            parser (Parser | None): Parser of the tokens, None if the scan failed
+
+        Properties:
+            name (str): Filename, or name given to the in-memory source
+            scanner (Scanner): Scanner of the source, with its tokens and tables
+            parser (Parser | None): Parser of the tokens, None if the scan failed
+            success (bool): Whether the source was scanned and parsed successfully
+            errors (list): Lexical or syntax errors found in the source
+        """
+        self.name = name
+        self.scanner = scanner
+        self.parser = parser
+        self.success = False
+        self.errors = []
+
+    def __repr__(self) -> str:
+        """Describe the result by its source, and number of errors."""
+        errors = len(self.errors)
+        return f"BatchResult({self.name!r}, success={self.success}, errors={errors})"
+
+
+def check_parser(parser: str, max_errors: int) -> None:
+    """
+    Check that the parser can report the number of errors asked for.
+
+    Args:
+        parser (str): Parser, `table` or the generated `descent` parser
+        max_errors (int): Syntax errors reported per source, or 0 to stop at the
+                          first one
+
+    Raises:
+        ValueError: Raised if the parser is unknown
+        ValueError: Raised if errors are to be recovered from by the `descent`
+                    parser, which stops at the first one
+    """
+    if parser not in ("table", "descent"):
+        raise ValueError(f"Unknown parser '{parser}', expected 'table' or 'descent'")
+    if parser == "descent" and max_errors:
+        raise ValueError(
+            "The 'descent' parser stops at the first error, use the 'table' parser "
+            "to recover from errors"
+        )
+
+
+def compile_source(
+    source: str | os.PathLike | tuple,
+    cfg: CFG,
+    backend: str = "table",
+    parser: str = "table",
+    max_errors: int = 0,
+) -> BatchResult:
+    """
+    Scan and parse one source, reporting its errors instead of raising them.
+
+    Args:
+        source (str | os.PathLike | tuple): Filename in the examples directory,
+                                            path to a file, or a pair of a name
+                                            and in-memory source code
+        cfg (CFG): Grammar shared by every parse
+        backend (str): Scanner backend, one of `Scanner.backends`
+        parser (str): Parser, `table` or the generated `descent` parser
+        max_errors (int): Syntax errors reported before the parse stops, or 0 to
+                          stop at the first one, only supported by the `table`
+                          parser
+
+    Raises:
+        ValueError: Raised if errors are to be recovered from by the `descent`
+                    parser, which stops at the first one
+
+    Returns:
+        BatchResult: Result of the source, with the errors of files that cannot
+                     be read, scanned or parsed
+    """
+    check_parser(parser, max_errors)
+    if isinstance(source, tuple):
+        name, text = source
+        cmm_scanner = Scanner(name, backend=backend, spans=True, source=text)
+    else:
+        cmm_scanner = Scanner(source, backend=backend, spans=True)
+        name = str(source)
+
+    result = BatchResult(name, cmm_scanner)
+    try:
+        cmm_scanner.scan()
+    except (ScanError, OSError, UnicodeDecodeError) as error:
+        result.errors.append(str(error))
+        return result
+
+    if parser == "descent":
+        result.parser = DescentParser(cmm_scanner, cfg)
+    else:
+        result.parser = Parser(cmm_scanner, cfg)
+    try:
+        if parser == "descent":
+            parse_result = result.parser.parse()
+        else:
+            parse_result = result.parser.parse(max_errors=max_errors)
+    except Exception as error:
+        result.errors.append(str(error))
+        return result
+
+    result.errors.extend(result.parser.diagnostics)
+    result.success = bool(parse_result)
+    if not result.success and not result.errors:
+        result.errors.append("Error: Expected the end of the program.")
+    return result
+
+
+def compile_batch(
+    sources: Iterable[str | os.PathLike] | Mapping[str, str | bytes],
+    workers: int | None = None,
+    backend: str = "table",
+    parser: str = "table",
+    max_errors: int = 0,
+) -> list:
+    """
+    Scan and parse many sources on a pool of threads, against one set of tables.
+
+    The language tables and the grammar are loaded once, read-only, and shared by
+    every scanner and parser, so no source pays to load or copy them. Every other
+    piece of state belongs to the scanner and parser of each source. Scanning and
+    parsing hold the GIL, so threads mostly overlap reading files, while sources
+    are compiled without any process start-up or pickling.
+
+    Results are not exported to the output directory, since `export_to_file`
+    redirects standard output, which is shared by every thread.
+
+    Args:
+        sources (Iterable[str | os.PathLike] | Mapping[str, str | bytes]): Files to
+            be compiled, see `Scanner`, or in-memory source code by name
+        workers (int | None): Number of threads, defaults to that of
+                              `ThreadPoolExecutor`
+        backend (str): Scanner backend, one of `Scanner.backends`
+        parser (str): Parser, `table` or the generated `descent` parser
+        max_errors (int): Syntax errors reported per source, or 0 to stop at the
+                          first one, only supported by the `table` parser
+
+    Raises:
+        ValueError: Raised if errors are to be recovered from by the `descent`
+                    parser, which stops at the first one
+
+    Returns:
+        list[BatchResult]: Result of every source, in the order given, with the
+                           errors of files that cannot be read, scanned or parsed
+    """
+    check_parser(parser, max_errors)
+    if isinstance(sources, Mapping):
+        sources = list(sources.items())
+    cfg = CFG()
+
+    def compile_one(source: str | os.PathLike | tuple) -> BatchResult:
+        return compile_source(source, cfg, backend, parser, max_errors)
+
+    with ThreadPoolExecutor(workers) as pool:
+        return list(pool.map(compile_one, sources))
@@ -0,0 +1,51 @@
+import threading
+import types
+from collections.abc import Callable
+from pathlib import Path
+
+_loaded: dict = {}
+_lock = threading.Lock()
+
+
+def load(name: str, path: Path, expected: str, generate: Callable) -> types.ModuleType:
+    """
+    Load a generated module, regenerating it if its inputs changed.
+
+    The saved module is reused if it records the `SOURCE_HASH` of the inputs it is
+    generated from, otherwise it is generated again and saved to `path`, if the
+    directory is writable. Every module is loaded once per process, even by many
+    threads at once.
+
+    Args:
+        name (str): Qualified name of the generated module
+        path (Path): Path where the generated module is saved
+        expected (str): Hash of the inputs the module is generated from
+        generate (Callable): Function returning the source code of the module
+
+    Returns:
+        types.ModuleType: The generated module
+    """
+    key = (path, expected)
+    if key in _loaded:
+        return _loaded[key]
+
+    # Another thread may have loaded it while this one waited
+    with _lock:
+        if key in _loaded:
+            return _loaded[key]
+
+        source = ""
+        if path.exists():
+            source = path.read_text(encoding="utf-8")
+        if f'SOURCE_HASH = "{expected}"' not in source:
+            source = generate()
+            try:
+                path.write_text(source, encoding="utf-8")
+            except OSError:
+                pass
+
+        module = types.ModuleType(name)
+        module.__file__ = str(path)
+        exec(compile(source, str(path), "exec"), module.__dict__)
+        _loaded[key] = module
+    return module
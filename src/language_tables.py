@@ -0,0 +1,299 @@
+import hashlib
+import marshal
+import sys
+import threading
+from array import array
+from pathlib import Path
+
+from .scanner.compiled_dfa import CompiledDFA
+from .scanner.tokens import Tokens
+from .scanner.transition_table import TransitionTable
+
+# Bump whenever the layout of the artifact changes, to force a rebuild
+ARTIFACT_VERSION = 1
+ARTIFACT_PATH = Path.cwd().joinpath("data", "language_tables.marshal")
+DATA_FILES = ["transitions.csv", "grammar.txt"]
+# Modules whose code decides what the tables hold
+BUILDER_FILES = [
+    "scanner/tokens.py",
+    "scanner/transition_table.py",
+    "scanner/compiled_dfa.py",
+    "parser/analysis.py",
+    "parser/cfg.py",
+    "language_tables.py",
+]
+DICT_KEYS = type({}.keys())
+
+_loaded: dict = {}
+_lock = threading.Lock()
+
+
+def read_only(instance: object, *args: object, **kwargs: object) -> None:
+    """
+    Refuse to change a read-only table.
+
+    Args:
+        instance (object): Table that was going to be changed
+        *args (object): Arguments of the method, ignored
+        **kwargs (object): Keyword arguments of the method, ignored
+
+    Raises:
+        TypeError: Always raised, since shared tables cannot change
+    """
+    raise TypeError(f"'{type(instance).__name__}' object is read-only")
+
+
+class ReadOnlyList(list):
+    """Class for a list that refuses every change, shared between parses."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = read_only
+
+    def __reduce__(self) -> tuple:
+        """Copy and pickle as a new read-only list with the same items."""
+        return type(self), (list(self),)
+
+
+class ReadOnlyDict(dict):
+    """Class for a dictionary that refuses every change, shared between parses."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = read_only
+    clear = pop = popitem = setdefault = update = read_only
+
+    def __reduce__(self) -> tuple:
+        """Copy and pickle as a new read-only dictionary with the same items."""
+        return type(self), (dict(self),)
+
+
+class ReadOnlyArray(array):
+    """Class for an array that refuses every change, shared between parses."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = read_only
+    append = extend = insert = pop = remove = reverse = byteswap = read_only
+    frombytes = fromfile = fromlist = fromunicode = read_only
+
+
+def sources_hash() -> str:
+    """
+    Hash every file the language tables are built from, and the Python version.
+
+    Marshal data is only guaranteed to load in the Python version that wrote it,
+    so the version is part of the key as well.
+
+    Returns:
+        str: Hexadecimal SHA-256 digest of the data files and builder modules
+    """
+    digest = hashlib.sha256(
+        repr((ARTIFACT_VERSION, marshal.version, sys.version_info[:2])).encode()
+    )
+    data = Path.cwd().joinpath("data")
+    package = Path(__file__).parent
+    for path in [data / name for name in DATA_FILES] + [
+        package / name for name in BUILDER_FILES
+    ]:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def freeze(instance: object) -> bytes:
+    """
+    Serialize the attributes of an object with `marshal`.
+
+    Arrays, dictionary keys views and paths, which marshal does not support, are
+    saved tagged with their type so `thaw` can restore them.
+
+    Args:
+        instance (object): Object whose attributes are saved
+
+    Returns:
+        bytes: Marshal data of the tagged attributes
+    """
+    state = {}
+    for name, value in vars(instance).items():
+        if isinstance(value, array):
+            state[name] = ("array", value.typecode, value.tobytes())
+        elif isinstance(value, DICT_KEYS):
+            state[name] = ("keys", list(value))
+        elif isinstance(value, Path):
+            state[name] = ("path", str(value))
+        else:
+            state[name] = ("value", value)
+    return marshal.dumps(state)
+
+
+def thaw(instance: object, data: bytes) -> object:
+    """
+    Restore the attributes of an object saved by `freeze`.
+
+    Every call unmarshals new containers, so objects thawed from the same data
+    never share mutable state.
+
+    Args:
+        instance (object): Object whose attributes are restored
+        data (bytes): Marshal data of the tagged attributes
+
+    Returns:
+        object: The same object, with its attributes restored
+    """
+    for name, (kind, *value) in marshal.loads(data).items():
+        if kind == "array":
+            value = array(value[0], value[1])
+        elif kind == "keys":
+            value = dict.fromkeys(value[0]).keys()
+        elif kind == "path":
+            value = Path(value[0])
+        else:
+            value = value[0]
+        setattr(instance, name, value)
+    return instance
+
+
+def seal(value: object, memo: dict | None = None) -> object:
+    """
+    Make a read-only copy of a table, and of every table inside it.
+
+    Lists, dictionaries and arrays keep their type as a base class, so they
+    compare, print and index the same, and sets become frozen sets.
+
+    Args:
+        value (object): Table, or any other value, which is kept as it is
+        memo (dict | None): Copies already made, so shared tables stay shared
+
+    Returns:
+        object: Read-only copy
+    """
+    if memo is None:
+        memo = {}
+    if id(value) in memo:
+        return memo[id(value)]
+
+    if isinstance(value, dict):
+        sealed = ReadOnlyDict(
+            (seal(key, memo), seal(item, memo)) for key, item in value.items()
+        )
+    elif isinstance(value, list):
+        sealed = ReadOnlyList(seal(item, memo) for item in value)
+    elif isinstance(value, tuple):
+        sealed = tuple(seal(item, memo) for item in value)
+    elif isinstance(value, (set, frozenset)):
+        sealed = frozenset(value)
+    elif isinstance(value, array):
+        sealed = ReadOnlyArray(value.typecode, value)
+    else:
+        return value
+    memo[id(value)] = sealed
+    return sealed
+
+
+def share(instance: object, name: str) -> object:
+    """
+    Give an object the read-only tables of the artifact, shared by every object.
+
+    The tables are thawed and sealed once per process, so objects are cheap to
+    create, and can be used by many threads at once.
+
+    Args:
+        instance (object): Object whose attributes are set
+        name (str): Name of the frozen object in the artifact, see `build`
+
+    Returns:
+        object: The same object, with its attributes set
+    """
+    key = f"shared {name}"
+    if key not in _loaded:
+        artifact = load()
+        with _lock:
+            if key not in _loaded:
+                thawed = thaw(type(instance).__new__(type(instance)), artifact[name])
+                memo = {}
+                _loaded[key] = {
+                    attribute: seal(value, memo)
+                    for attribute, value in vars(thawed).items()
+                }
+    for attribute, value in _loaded[key].items():
+        setattr(instance, attribute, value)
+    return instance
+
+
+def build() -> dict:
+    """
+    Build the language tables from the data files.
+
+    Returns:
+        dict: Artifact with the sources hash and the frozen token helper, transition
+              table, compiled automaton and grammar
+    """
+    # The grammar loads its tables from here, so it is only imported when building
+    from .parser.cfg import CFG
+
+    token_helper = Tokens()
+    automaton = TransitionTable()
+    return {
+        "hash": sources_hash(),
+        "tokens": freeze(token_helper),
+        "automaton": freeze(automaton),
+        "dfa": freeze(CompiledDFA(automaton, token_helper)),
+        "cfg": freeze(CFG(precompiled=False)),
+    }
+
+
+def load() -> dict:
+    """
+    Load the language tables artifact, rebuilding it if any of its sources changed.
+
+    The artifact is checked and loaded once per process, even when many threads
+    ask for it at once. It is saved to `data` when it has to be rebuilt, if the
+    directory is writable.
+
+    Returns:
+        dict: Artifact with the frozen language tables, see `build`
+    """
+    if "artifact" in _loaded:
+        return _loaded["artifact"]
+
+    with _lock:
+        if "artifact" not in _loaded:
+            _loaded["artifact"] = read_artifact()
+    return _loaded["artifact"]
+
+
+def read_artifact() -> dict:
+    """
+    Read the language tables artifact, rebuilding and saving it if it is stale.
+
+    Returns:
+        dict: Artifact with the frozen language tables, see `build`
+    """
+    expected = sources_hash()
+
+    artifact = None
+    if ARTIFACT_PATH.exists():
+        try:
+            artifact = marshal.loads(ARTIFACT_PATH.read_bytes())
+        except (EOFError, ValueError, TypeError):
+            artifact = None
+    if not isinstance(artifact, dict) or artifact.get("hash") != expected:
+        artifact = build()
+        try:
+            ARTIFACT_PATH.write_bytes(marshal.dumps(artifact))
+        except OSError:
+            pass
+    return artifact
+
+
+def scanner_tables() -> tuple:
+    """
+    Get a token helper, transition table and compiled automaton.
+
+    Returns:
+        tuple[Tokens, TransitionTable, CompiledDFA]: Scanner tables, with the
+                                                     read-only tables shared by
+                                                     every scanner, see `share`
+    """
+    return (
+        share(Tokens.__new__(Tokens), "tokens"),
+        share(TransitionTable.__new__(TransitionTable), "automaton"),
+        share(CompiledDFA.__new__(CompiledDFA), "dfa"),
+    )
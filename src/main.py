@@ -1,18 +1,39 @@
-import sys
+import argparse
+from pathlib import Path
 
 from .parser.cfg import CFG
-from .parser.parser import Parser
+from .parser.parser import DescentParser, Parser
+from .parser.tracing import LEVELS, FileWriter, RingBuffer, Tracer
+from .scanner.parallel import ParallelScanner
 from .scanner.scanner import Scanner
 
 
-def scan_and_parse(filename: str) -> None:
+def scan_and_parse(
+    filename: str,
+    backend: str = "table",
+    workers: int = 1,
+    tracer: Tracer | None = None,
+    max_errors: int = 0,
+    parser: str = "table",
+    cfg: CFG | None = None,
+) -> None:
     """Scan input and parse the tokens to check for syntactic errors."""
-    cfg = CFG()
-    cmm_scanner = Scanner(filename)
+    cfg = CFG() if cfg is None else cfg
+    if workers > 1:
+        cmm_scanner = ParallelScanner(
+            filename, workers=workers, backend=backend, spans=True
+        )
+    else:
+        cmm_scanner = Scanner(filename, backend=backend, spans=True)
     lexical_output = cmm_scanner.scan()
-    cmm_parser = Parser(cmm_scanner, cfg)
-    
-    parse_result = cmm_parser.parse()
+    if parser == "descent":
+        cmm_parser = DescentParser(cmm_scanner, cfg, tracer)
+        parse_result = cmm_parser.parse()
+    else:
+        cmm_parser = Parser(cmm_scanner, cfg, tracer)
+        parse_result = cmm_parser.parse(max_errors=max_errors)
+    for message in cmm_parser.diagnostics:
+        print(message)
     
     if parse_result:
         outfile = cmm_scanner.export_to_file(
@@ -23,16 +44,88 @@ def scan_and_parse(filename: str) -> None:
         return None
 
 if __name__ == "__main__":
-    filenames = sys.argv[1:]
+    arg_parser = argparse.ArgumentParser(description="C-- scanner and parser.")
+    arg_parser.add_argument("filenames", nargs="*", help="files in test/examples")
+    arg_parser.add_argument(
+        "--backend",
+        choices=Scanner.backends,
+        default="table",
+        help="scanner backend used to recognize tokens",
+    )
+    arg_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="number of processes used to scan large files",
+    )
+    arg_parser.add_argument(
+        "--trace",
+        choices=LEVELS,
+        default="off",
+        help="parser events to trace: the result, every token or every prediction",
+    )
+    arg_parser.add_argument(
+        "--trace-file",
+        help="file the trace is written to, instead of the terminal",
+    )
+    arg_parser.add_argument(
+        "--trace-last",
+        type=int,
+        help="only keep the last N trace events, and show them on errors, in the trace"
+        " file if given",
+    )
+    arg_parser.add_argument(
+        "--max-errors",
+        type=int,
+        default=0,
+        help="recover from syntax errors and report up to N of them",
+    )
+    arg_parser.add_argument(
+        "--parser",
+        choices=["table", "descent"],
+        default="table",
+        help="table-driven parser, or the recursive descent parser generated from it",
+    )
+    args = arg_parser.parse_args()
+
+    # The trace file is opened once, so the events of every file are kept in it
+    trace_file = None
+    if args.trace_file:
+        trace_file = Path(args.trace_file).open(
+            "w", encoding="utf-8", buffering=1 << 16
+        )
+
+    # The grammar is read-only, so every file is parsed against the same one
+    cfg = CFG()
     try:
-        for filename in filenames:
-            outfile = scan_and_parse(filename)
-            print(
-                f"Scan output file for '{filename}' can be found at /output/{outfile}"
+        for filename in args.filenames:
+            if args.trace_last:
+                sink = RingBuffer(args.trace_last, trace_file)
+            elif trace_file:
+                sink = FileWriter(trace_file)
+            else:
+                sink = None
+            tracer = Tracer(args.trace, sink)
+            outfile = scan_and_parse(
+                filename,
+                args.backend,
+                args.workers,
+                tracer,
+                args.max_errors,
+                args.parser,
+                cfg,
             )
+            if outfile is not None:
+                print(
+                    f"Scan output file for '{filename}' can be found at "
+                    f"/output/{outfile}"
+                )
 
     except FileNotFoundError:
         print(
             f"No such file or directory: '{filename}'. File could not be found in test"
             f" folder. Please try again."
         )
+    finally:
+        if trace_file:
+            trace_file.close()
@@ -0,0 +1,317 @@
+import sys
+from pathlib import Path
+
+EPSILON = "ε"
+END = "$"
+
+
+class GrammarAnalysis:
+    """Class to compute the FIRST, FOLLOW and FIRST+ sets of a grammar."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        """
+        Initialize constructor for GrammarAnalysis class.
+
+        Productions are numbered from 1 in the order they appear, and symbols are
+        coded as integers: every terminal is a bit in the sets, so the sets are
+        plain integers and the fixpoint iterations only use bitwise operations.
+
+        Args:
+            path (Path | None): Grammar file, with one non terminal per line and
+                                its alternatives separated by `|`, defaults to
+                                `data/grammar.txt`
+
+        Properties:
+            non_terminals (list): Non terminal symbols, in order of appearance
+            productions (list): Pairs of left hand side and right hand side
+                                symbols, where ε is an empty right hand side
+            terminals (list): Terminal symbols, sorted and followed by `$`
+            coded (list): Productions with terminals coded as their bit, and non
+                          terminals as the complement of their index
+            nullable (int): Bitset of the non terminals that derive ε
+            first (list): Bitset of terminals of the FIRST set of every non terminal
+            follow (list): Bitset of terminals of the FOLLOW set of every non terminal
+            first_plus (list): Bitset of terminals of the FIRST+ set of every
+                               production
+            conflicts (list): Cells of the LL(1) table predicted by more than one
+                              production, see `create_table`
+        """
+        if path is None:
+            path = Path.cwd().joinpath("data", "grammar.txt")
+        self.non_terminals, self.productions = self.read_grammar(path)
+        nt_codes = {nt: code for code, nt in enumerate(self.non_terminals)}
+        self.terminals = sorted(
+            {
+                symbol
+                for _, rhs in self.productions
+                for symbol in rhs
+                if symbol not in nt_codes
+            }
+        ) + [END]
+        t_codes = {terminal: code for code, terminal in enumerate(self.terminals)}
+
+        self.coded = [
+            (
+                nt_codes[lhs],
+                [
+                    ~nt_codes[symbol] if symbol in nt_codes else 1 << t_codes[symbol]
+                    for symbol in rhs
+                ],
+            )
+            for lhs, rhs in self.productions
+        ]
+        self.nullable = self.compute_nullable()
+        self.first = self.compute_first()
+        self.follow = self.compute_follow()
+        self.first_plus = [
+            self.first_of(rhs) | (self.follow[lhs] if self.derives_empty(rhs) else 0)
+            for lhs, rhs in self.coded
+        ]
+        self.conflicts = []
+
+    def read_grammar(self, path: Path) -> tuple:
+        """
+        Read the non terminals and productions of a grammar file.
+
+        Args:
+            path (Path): Grammar file
+
+        Returns:
+            tuple: List of non terminals, and list of numbered productions
+        """
+        non_terminals = []
+        productions = []
+
+        with path.open("r", encoding="utf-8") as f:
+            for line in f.read().splitlines():
+                if not line.strip():
+                    continue
+                lhs, rhs = line.split("->", 1)
+                non_terminals.append(lhs)
+                for alternative in rhs.split(" | "):
+                    symbols = alternative.split()
+                    productions.append((lhs, [] if symbols == [EPSILON] else symbols))
+
+        return non_terminals, productions
+
+    def derives_empty(self, symbols: list) -> bool:
+        """
+        Check if a sequence of coded symbols derives ε.
+
+        Args:
+            symbols (list): Coded symbols
+
+        Returns:
+            bool: True if every symbol is a nullable non terminal
+        """
+        nullable = self.nullable
+        return all(symbol < 0 and nullable >> ~symbol & 1 for symbol in symbols)
+
+    def first_of(self, symbols: list) -> int:
+        """
+        Compute the FIRST set of a sequence of coded symbols, without ε.
+
+        Args:
+            symbols (list): Coded symbols
+
+        Returns:
+            int: Bitset of terminals
+        """
+        first = 0
+        for symbol in symbols:
+            if symbol > 0:
+                return first | symbol
+            first |= self.first[~symbol]
+            if not self.nullable >> ~symbol & 1:
+                break
+        return first
+
+    def compute_nullable(self) -> int:
+        """
+        Find the non terminals that derive ε, iterating until nothing changes.
+
+        Returns:
+            int: Bitset of nullable non terminals
+        """
+        self.nullable = 0
+        changed = True
+        while changed:
+            changed = False
+            for lhs, rhs in self.coded:
+                if not self.nullable >> lhs & 1 and self.derives_empty(rhs):
+                    self.nullable |= 1 << lhs
+                    changed = True
+        return self.nullable
+
+    def compute_first(self) -> list:
+        """
+        Compute the FIRST sets of the non terminals, iterating until nothing changes.
+
+        Returns:
+            list: Bitset of terminals of every non terminal
+        """
+        self.first = [0] * len(self.non_terminals)
+        changed = True
+        while changed:
+            changed = False
+            for lhs, rhs in self.coded:
+                first = self.first[lhs] | self.first_of(rhs)
+                if first != self.first[lhs]:
+                    self.first[lhs] = first
+                    changed = True
+        return self.first
+
+    def compute_follow(self) -> list:
+        """
+        Compute the FOLLOW sets of the non terminals, iterating until nothing changes.
+
+        The end of input follows the start symbol, the first non terminal.
+
+        Returns:
+            list: Bitset of terminals of every non terminal
+        """
+        follow = [0] * len(self.non_terminals)
+        follow[0] = 1 << self.terminals.index(END)
+        changed = True
+        while changed:
+            changed = False
+            for lhs, rhs in self.coded:
+                # Walk the right hand side backwards, carrying what may come next
+                trailer = follow[lhs]
+                for symbol in reversed(rhs):
+                    if symbol > 0:
+                        trailer = symbol
+                        continue
+                    nt = ~symbol
+                    if trailer & ~follow[nt]:
+                        follow[nt] |= trailer
+                        changed = True
+                    if self.nullable >> nt & 1:
+                        trailer |= self.first[nt]
+                    else:
+                        trailer = self.first[nt]
+        return follow
+
+    def terminal_names(self, bitset: int) -> list:
+        """
+        Get the terminals of a bitset, in table order.
+
+        Args:
+            bitset (int): Bitset of terminals
+
+        Returns:
+            list: Terminal symbols
+        """
+        return [
+            terminal
+            for code, terminal in enumerate(self.terminals)
+            if bitset >> code & 1
+        ]
+
+    def create_table(self) -> dict:
+        """
+        Create the LL(1) parsing table from the FIRST+ sets of the productions.
+
+        A cell predicted by more than one production is an LL(1) conflict. It is
+        given to the production that comes first in the grammar, which for an
+        optional part such as `selection_stmt->else statement | ε` means that the
+        part is taken whenever it can be, and it is recorded in `conflicts`.
+
+        Returns:
+            dict: Production number, or "ERROR", for every non terminal and terminal
+        """
+        table = {
+            nt: {terminal: "ERROR" for terminal in self.terminals}
+            for nt in self.non_terminals
+        }
+        predicted = {}
+        for number, (lhs, _) in enumerate(self.productions, start=1):
+            for terminal in self.terminal_names(self.first_plus[number - 1]):
+                predicted.setdefault((lhs, terminal), []).append(number)
+
+        self.conflicts = []
+        for (lhs, terminal), numbers in predicted.items():
+            table[lhs][terminal] = numbers[0]
+            if len(numbers) > 1:
+                self.conflicts.append((lhs, terminal, numbers))
+        return table
+
+    def production(self, number: int) -> str:
+        """
+        Write a production as it appears in the grammar.
+
+        Args:
+            number (int): Production number, from 1
+
+        Returns:
+            str: Production, as `lhs->rhs`
+        """
+        lhs, rhs = self.productions[number - 1]
+        return f"{lhs}->{' '.join(rhs) or EPSILON}"
+
+    def write_sets(self, directory: Path | None = None) -> None:
+        """
+        Write the FIRST, FOLLOW and FIRST+ sets to text files, for reference.
+
+        Sets that may derive ε include it, like in the hand-written sets.
+
+        Args:
+            directory (Path | None): Output directory, defaults to `data/sets`
+        """
+        if directory is None:
+            directory = Path.cwd().joinpath("data", "sets")
+
+        def names(bitset: int, empty: bool) -> str:
+            return " ".join(self.terminal_names(bitset) + [EPSILON] * empty)
+
+        first = [
+            f"First({nt})={{ {names(self.first[code], self.nullable >> code & 1)} }}"
+            for code, nt in enumerate(self.non_terminals)
+        ]
+        follow = [
+            f"Follow({nt})={{ {names(self.follow[code], False)} }}"
+            for code, nt in enumerate(self.non_terminals)
+        ]
+        first_plus = [
+            f"First+( {self.production(number).replace('->', ' -> ')} )"
+            f"={{ {names(first_plus, self.derives_empty(rhs))} }}"
+            for number, first_plus, (_, rhs) in zip(
+                range(1, len(self.coded) + 1), self.first_plus, self.coded
+            )
+        ]
+        for name, lines in [
+            ("first.txt", first),
+            ("follow.txt", follow),
+            ("firstplus.txt", first_plus),
+        ]:
+            directory.joinpath(name).write_text("\n".join(lines), encoding="utf-8")
+
+    def report(self) -> str:
+        """
+        Describe the grammar and its LL(1) conflicts.
+
+        Returns:
+            str: Human readable report
+        """
+        self.create_table()
+        lines = [
+            f"Non terminals: {len(self.non_terminals)}",
+            f"Terminals: {len(self.terminals)}",
+            f"Productions: {len(self.productions)}",
+            f"LL(1) conflicts: {len(self.conflicts)}",
+        ]
+        for lhs, terminal, numbers in self.conflicts:
+            lines.append(
+                f"  {lhs} on '{terminal}': "
+                + ", ".join(f"{n}. {self.production(n)}" for n in numbers)
+                + f" (using {numbers[0]})"
+            )
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else None
+    analysis = GrammarAnalysis(path)
+    analysis.write_sets()
+    print("Grammar sets written to data/sets")
+    print(analysis.report())
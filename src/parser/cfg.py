@@ -1,17 +1,43 @@
 import csv
+from array import array
 from pathlib import Path
 
+from .. import language_tables
+from .analysis import GrammarAnalysis
+
 
 class CFG:
     """Class to represent a Context Free Grammar (CFG)."""
 
-    def __init__(self) -> None:
-        """Initialize constructor for CFG class."""
-        self.grammar = self.read_grammar()
-        self.grammar_nt = self.grammar[0]
-        self.simple_nt = self.grammar[1]
-        self.productions = self.read_productions()
-        self.fp_sets = self.read_firstplus()
+    def __init__(self, precompiled: bool = True) -> None:
+        """
+        Initialize constructor for CFG class.
+
+        Args:
+            precompiled (bool): Whether to load the grammar and parsing table from
+                                the language tables artifact, instead of building
+                                them from the data files. Loaded tables are
+                                read-only and shared by every grammar, so one
+                                grammar can be used by many parsers and threads
+        """
+        if precompiled:
+            language_tables.share(self, "cfg")
+            return
+
+        # Sets and table are computed from data/grammar.txt, see GrammarAnalysis
+        analysis = GrammarAnalysis()
+        self.grammar_nt = analysis.non_terminals
+        self.productions = [
+            analysis.production(number)
+            for number in range(1, len(analysis.productions) + 1)
+        ]
+        self.first = dict(
+            zip(self.grammar_nt, map(analysis.terminal_names, analysis.first))
+        )
+        self.follow = dict(
+            zip(self.grammar_nt, map(analysis.terminal_names, analysis.follow))
+        )
+        self.fp_sets = [analysis.terminal_names(fp) for fp in analysis.first_plus]
         self.num_productions = self.number_productions(self.productions)
         self.symbol_sets = self.compute_symbols(self.productions)
         self.symbols = self.symbol_sets[0]
@@ -19,85 +45,32 @@ class CFG:
         self.non_terminals = self.symbol_sets[2]
         self.rhs_productions = self.symbol_sets[3]
         self.production_terminals = self.symbol_sets[4]
-        self.table_set = self.create_parsing_table(
-            self.terminals,
-            self.non_terminals,
-            self.num_productions,
-            self.fp_sets,
-            self.production_terminals,
-            self.grammar_nt,
+        self.table = analysis.create_table()
+        self.conflicts = analysis.conflicts
+        self.ordered_t = analysis.terminals
+        self.ordered_nt = list(analysis.non_terminals)
+        self.num_terminals = len(self.ordered_t)
+        self.coded_table = self.encode_table()
+        self.symbol_names = self.coded_table[0]
+        self.symbol_codes = self.coded_table[1]
+        self.row_offsets = self.coded_table[2]
+        self.cells = self.coded_table[3]
+        self.reversed_rhs = self.coded_table[4]
+        self.expected = self.coded_table[5]
+        self.sync_sets = self.coded_table[6]
+        self.terminators = self.coded_table[7]
+
+        # A declaration starting with `void` is one more function, unless it is
+        # `void main`, which must be the last one: then the list of declarations
+        # ends, and `program` matches it. Parsers need two tokens to decide it, so
+        # the rule is the non terminal, the terminal, and the production for the
+        # main function and for any other function.
+        self.main_rule = (
+            self.symbol_codes["declaration_list"],
+            self.symbol_codes["void"],
+            self.num_productions["declaration_list->ε"],
+            self.num_productions["declaration_list->declaration declaration_list"],
         )
-        self.table = self.table_set[0]
-        self.ordered_t = self.table_set[1]
-        self.ordered_nt = self.table_set[2]
-        self.adjust_table()
-
-    def read_grammar(self) -> list:
-        """
-        Read the complete and simplified grammar from text files.
-
-        Returns:
-            list: Two lists containing the complete and
-                  simplified grammar non terminal symbols.
-        """
-        grammar_nt = []
-        path = Path.cwd().joinpath("data", "grammar.txt")
-
-        with path.open("r", encoding="utf-8") as f:
-            lines = f.read().splitlines()
-
-            for line in lines:
-                lhs = line.split("->")[0]
-                grammar_nt.append(lhs)
-
-        simple_nt = []
-        path = Path.cwd().joinpath("data", "simple_grammar.txt")
-
-        with path.open("r", encoding="utf-8") as f:
-            lines = f.read().splitlines()
-
-            for line in lines:
-                lhs = line.split("->")[0]
-                simple_nt.append(lhs)
-
-        return grammar_nt, simple_nt
-
-    def read_productions(self) -> list:
-        """
-        _summary_.
-
-        Returns:
-            list: _description_
-        """
-        productions = []
-        path = Path.cwd().joinpath("data", "productions.txt")
-
-        with path.open("r", encoding="utf-8") as f:
-            productions = f.read().splitlines()
-
-        return productions
-
-    def read_firstplus(self) -> list:
-        """
-        _summary_.
-
-        Returns:
-            list: _description_
-
-        """
-        lines = []
-        fp_sets = []
-        path = Path.cwd().joinpath("data", "sets", "firstplus.txt")
-
-        with path.open("r", encoding="utf-8") as f:
-            lines = f.read().splitlines()
-
-        for fp_set in lines:
-            rhs = fp_set.split(")={ ")[1][:-2]
-            rhs_list = [terminal.strip() for terminal in rhs.split(" ")]
-            fp_sets.append(rhs_list)
-
-        return fp_sets
 
     def number_productions(self, productions: list) -> dict:
         """
@@ -155,59 +128,138 @@ class CFG:
             production_terminals,
         )
 
-    def create_parsing_table(
-        self,
-        terminals: set,
-        non_terminals: set,
-        num_productions: dict,
-        fp_sets: list,
-        production_terminals: list,
-        grammar_nt: list,
-    ) -> tuple:
+    def encode_table(self) -> tuple:
+        """
+        Code the symbols as integers and flatten the parsing table for the parser.
+
+        Terminals are numbered first, in table order, and non terminals after them,
+        so a symbol is a non terminal when its code is at least `num_terminals`.
+        Each non terminal points to the offset of its row in the flat table, and
+        non terminals with the same row share it.
+
+        What error recovery needs is precomputed as well: the terminals expected by
+        every non terminal, named for error messages, and its synchronizing sets,
+        see `synchronizing_sets`.
+
+        Returns:
+            tuple: Symbol names by code, symbol codes by name, row offset of every
+                   non terminal, flat table of production numbers (0 for errors),
+                   the reversed right hand side codes of every production, without
+                   ε, and the expected terminals, synchronizing set and terminators
+                   of every non terminal
         """
-        Create a parsing table for the given grammar for use in LL(1) parser.
+        symbol_names = self.ordered_t + self.ordered_nt
+        symbol_codes = {name: code for code, name in enumerate(symbol_names)}
+
+        unique = {}
+        row_offsets = array("H")
+        cells = array("H")
+        for nt in self.ordered_nt:
+            row = tuple(
+                0 if self.table[nt][terminal] == "ERROR" else self.table[nt][terminal]
+                for terminal in self.ordered_t
+            )
+            if row not in unique:
+                unique[row] = len(cells)
+                cells.extend(row)
+            row_offsets.append(unique[row])
+
+        # Production numbers start at 1, so the first entry is left empty
+        reversed_rhs = [()] + [
+            tuple(symbol_codes[symbol] for symbol in rhs[::-1] if symbol != "ε")
+            for _, rhs in sorted(self.rhs_productions.items())
+        ]
+
+        expected = [
+            [
+                terminal
+                for terminal in self.ordered_t
+                if self.table[nt][terminal] != "ERROR"
+            ]
+            for nt in self.ordered_nt
+        ]
+        sync_sets, terminators = self.synchronizing_sets(symbol_codes)
+        return (
+            symbol_names,
+            symbol_codes,
+            row_offsets,
+            cells,
+            reversed_rhs,
+            expected,
+            sync_sets,
+            terminators,
+        )
+
+    def synchronizing_sets(self, symbol_codes: dict) -> tuple:
+        """
+        Compute the terminals error recovery gives up on each non terminal at.
+
+        A non terminal is given up on at any terminal of its FOLLOW set, which is
+        left for the symbols below it. Inside a block, it is also given up on at
+        `}`, which closes the block, so a missing `;` is not skipped up to the end
+        of the next block. A non terminal whose productions all end with `;`, such
+        as a statement, is given up on at `;` as well, consuming it, so recovery
+        resumes with the next statement.
 
         Args:
-            terminals (set): Set of terminal symbols.
-            non_terminals (set): Set of non terminal symbols.
-            num_productions (dict): List of numbered productions.
-            fp_sets (list): List of first plus sets.
-            production_terminals (list): List of production terminals.
-            grammar_nt (list): List of non terminal symbols.
+            symbol_codes (dict): Symbol code of every symbol name
 
         Returns:
-            tuple: Both the parsing table and the ordered terminals.
+            tuple[list, list]: Synchronizing set of terminal codes of every non
+                               terminal, and its terminators, the codes it consumes
+                               when it is given up on
         """
-        table = {}
-        ordered_t = sorted(terminals)
-        ordered_t.append("$")
-
-        ordering = {nt: i for i, nt in enumerate(grammar_nt)}
-        ordered_nt = sorted(list(non_terminals), key=lambda nt: ordering[nt])
-
-        for nt in ordered_nt:
-            table[nt] = {}
-
-            for terminal in ordered_t:
-                # Fill table with error messages
-                table[nt][terminal] = "ERROR"
-
-        for prod, fp_set, pt in zip(num_productions, fp_sets, production_terminals):
-            for terminal in fp_set:
-                if terminal == "ε":
-                    # Do nothing if epsilon is found
-                    continue
-                # Fill table of each production with terminals from first plus sets
-                table[pt[0]][terminal] = num_productions[prod]
-
-        return table, ordered_t, ordered_nt
-    
-    def adjust_table(self) -> None:
-        """Adjust the parsing table to account for grammar changes."""
-        self.table['declaration_list']['void'] = 2
-        self.table["term'"]['ID'] = 58
-        self.table["arithmetic_expression'"]['ID'] = 53
-        self.table["expression'"]['ID'] = 44
+        lhs = [production.split("->")[0] for production in self.productions]
+        rhs = [
+            [symbol for symbol in self.rhs_productions[number] if symbol != "ε"]
+            for number in range(1, len(lhs) + 1)
+        ]
+
+        # Non terminals between braces, and all those they derive, are in a block
+        in_block = set()
+        pending = [
+            symbol
+            for symbols in rhs
+            if "{" in symbols and "}" in symbols
+            for symbol in symbols[symbols.index("{") + 1 : symbols.index("}")]
+            if symbol in self.ordered_nt
+        ]
+        while pending:
+            nt = pending.pop()
+            if nt not in in_block:
+                in_block.add(nt)
+                pending.extend(
+                    symbol
+                    for head, symbols in zip(lhs, rhs)
+                    if head == nt
+                    for symbol in symbols
+                    if symbol in self.ordered_nt
+                )
+
+        # Start from every non terminal, and drop those with a production that
+        # does not end with `;` until none is left to drop
+        terminated = set(self.ordered_nt)
+        changed = True
+        while changed:
+            changed = False
+            for head, symbols in zip(lhs, rhs):
+                if head in terminated and not (
+                    symbols and (symbols[-1] == ";" or symbols[-1] in terminated)
+                ):
+                    terminated.discard(head)
+                    changed = True
+
+        sync_sets = []
+        for nt in self.ordered_nt:
+            terminals = set(self.follow[nt])
+            if nt in in_block:
+                terminals.add("}")
+            sync_sets.append(frozenset(symbol_codes[t] for t in terminals))
+        semicolon = frozenset([symbol_codes[";"]])
+        terminators = [
+            semicolon if nt in terminated else frozenset() for nt in self.ordered_nt
+        ]
+        return sync_sets, terminators
 
     def export_table(self) -> None:
         """Generate a CSV file of the parsing table."""
@@ -218,8 +270,8 @@ class CFG:
             w = csv.DictWriter(f, fieldnames=field_names)
             w.writeheader()
 
-            for nt, st in zip(self.grammar_nt, self.simple_nt):
-                row = {"non_terminal": nt} | self.table[st]
+            for nt in self.ordered_nt:
+                row = {"non_terminal": nt} | self.table[nt]
                 w.writerow(row)
 
         print("Parsing table exported to data/parsing_table.csv")
@@ -0,0 +1,237 @@
+import hashlib
+import types
+from pathlib import Path
+
+from .. import generated_module
+from .cfg import CFG
+
+# Bump whenever the generated code changes, to force a regeneration
+GENERATOR_VERSION = 1
+MODULE_PATH = Path(__file__).with_name("recursive_descent.py")
+
+
+def source_hash(cfg: CFG) -> str:
+    """
+    Hash the coded symbols, parsing table and main rule the generated parser is
+    built from.
+
+    Args:
+        cfg (CFG): Grammar with the integer-coded parsing table
+
+    Returns:
+        str: Hexadecimal SHA-256 digest of every input of the generator
+    """
+    digest = hashlib.sha256(cfg.cells.tobytes() + cfg.row_offsets.tobytes())
+    for value in [
+        cfg.symbol_names,
+        cfg.reversed_rhs,
+        [cfg.main_rule, GENERATOR_VERSION],
+    ]:
+        digest.update(repr(value).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class DescentCodeGenerator:
+    """Class to generate a recursive descent parser from the LL(1) parsing table."""
+
+    def __init__(self, cfg: CFG) -> None:
+        """
+        Initialize constructor for DescentCodeGenerator class.
+
+        Args:
+            cfg (CFG): Grammar with the integer-coded parsing table
+
+        Properties:
+            cfg (CFG): Grammar with the integer-coded parsing table
+            constants (dict): Module level constants of the generated code
+            lines (list): Lines of generated code
+        """
+        self.cfg = cfg
+        self.constants = {}
+        self.lines = []
+
+    def constant(self, prefix: str, value: str) -> str:
+        """
+        Declare a module level constant of the generated code, reusing duplicates.
+
+        Args:
+            prefix (str): Prefix of the constant name
+            value (str): Python expression of the constant
+
+        Returns:
+            str: Name of the constant
+        """
+        for name, existing in self.constants.items():
+            if existing == value:
+                return name
+        name = f"_{prefix}{len(self.constants)}"
+        self.constants[name] = value
+        return name
+
+    def emit(self, depth: int, line: str) -> None:
+        """
+        Append a line of generated code.
+
+        Args:
+            depth (int): Indentation level of the line
+            line (str): Code of the line
+        """
+        self.lines.append("    " * depth + line)
+
+    def function(self, nt: int) -> str:
+        """
+        Name the function that parses a non terminal.
+
+        Args:
+            nt (int): Code of the non terminal
+
+        Returns:
+            str: Function name
+        """
+        return "parse_" + self.cfg.symbol_names[nt].replace("'", "_prime")
+
+    def generate(self) -> str:
+        """
+        Generate the source code of the recursive descent parser module.
+
+        Returns:
+            str: Source code of the module
+        """
+        cfg = self.cfg
+        self.constants = {}
+        self.lines = []
+        for nt in range(cfg.num_terminals, len(cfg.symbol_names)):
+            self.emit_function(nt)
+
+        header = [
+            '"""',
+            "Recursive descent parser generated from data/grammar.txt.",
+            "",
+            "Do not edit, regenerate it with `python -m src.parser.codegen`.",
+            '"""',
+            "",
+            f'SOURCE_HASH = "{source_hash(cfg)}"',
+            "",
+            *[f"{name} = {value}" for name, value in self.constants.items()],
+            "",
+            "",
+            "def parse(kinds, is_main, fail):",
+            "    pos = 0",
+        ]
+        footer = [
+            "",
+            f"    {self.function(cfg.num_terminals)}()",
+            "    return pos",
+        ]
+        return "\n".join(header + self.lines + footer) + "\n"
+
+    def emit_function(self, nt: int) -> None:
+        """
+        Generate the function of a non terminal, which switches on the token kind.
+
+        A production that ends with the non terminal itself, such as a list, loops
+        back instead of calling the function again, so lists of any length only
+        take one frame.
+
+        Args:
+            nt (int): Code of the non terminal
+        """
+        cfg = self.cfg
+        num_terminals = cfg.num_terminals
+        offset = cfg.row_offsets[nt - num_terminals]
+        predicted = {}
+        for terminal in range(num_terminals):
+            production = cfg.cells[offset + terminal]
+            if production:
+                predicted.setdefault(production, []).append(terminal)
+        loops = any(
+            cfg.reversed_rhs[production][:1] == (nt,) for production in predicted
+        )
+
+        self.emit(0, "")
+        self.emit(1, f"def {self.function(nt)}():")
+        self.emit(2, "nonlocal pos")
+        depth = 2
+        if loops:
+            self.emit(2, "while True:")
+            depth = 3
+        self.emit(depth, "kind = kinds[pos]")
+
+        main_nt, main_terminal, main_production, _ = cfg.main_rule
+        if nt == main_nt:
+            self.emit(depth, "# Enforce the last declaration to be the main function")
+            self.emit(
+                depth,
+                f"if kind == {main_terminal} and is_main(pos):"
+                f"  # {cfg.symbol_names[main_terminal]}",
+            )
+            self.emit_production(depth + 1, nt, main_production)
+
+        for number, (production, terminals) in enumerate(predicted.items()):
+            keyword = "if" if number == 0 else "elif"
+            if len(terminals) == 1:
+                self.emit(
+                    depth,
+                    f"{keyword} kind == {terminals[0]}:"
+                    f"  # {cfg.symbol_names[terminals[0]]}",
+                )
+            else:
+                name = self.constant("FIRST", f"frozenset({terminals})")
+                self.emit(depth, f"{keyword} kind in {name}:")
+            self.emit_production(depth + 1, nt, production)
+        self.emit(depth, f"raise fail({nt}, pos)")
+
+    def emit_production(self, depth: int, nt: int, production: int) -> None:
+        """
+        Generate the code that parses the right hand side of a production.
+
+        The first terminal of a production was already checked by the switch, and
+        every other one is checked before it is matched.
+
+        Args:
+            depth (int): Indentation level of the code
+            nt (int): Code of the non terminal
+            production (int): Production number
+        """
+        cfg = self.cfg
+        self.emit(depth, f"# {cfg.productions[production - 1]}")
+        rhs = cfg.reversed_rhs[production][::-1]
+        loops = bool(rhs) and rhs[-1] == nt
+        for index, symbol in enumerate(rhs[:-1] if loops else rhs):
+            if symbol >= cfg.num_terminals:
+                self.emit(depth, f"{self.function(symbol)}()")
+                continue
+            if index:
+                self.emit(
+                    depth,
+                    f"if kinds[pos] != {symbol}:  # {cfg.symbol_names[symbol]}",
+                )
+                self.emit(depth + 1, f"raise fail({symbol}, pos)")
+            self.emit(depth, "pos += 1")
+        self.emit(depth, "continue" if loops else "return")
+
+
+def load_descent_parser(cfg: CFG) -> types.ModuleType:
+    """
+    Load the recursive descent parser, regenerating it if the grammar changed.
+
+    The generated module is saved next to this module, see `generated_module.load`.
+
+    Args:
+        cfg (CFG): Grammar with the integer-coded parsing table
+
+    Returns:
+        types.ModuleType: Module with a `parse(kinds, is_main, fail)` function
+    """
+    return generated_module.load(
+        f"{__package__}.recursive_descent",
+        MODULE_PATH,
+        source_hash(cfg),
+        lambda: DescentCodeGenerator(cfg).generate(),
+    )
+
+
+if __name__ == "__main__":
+    source = DescentCodeGenerator(CFG(precompiled=False)).generate()
+    MODULE_PATH.write_text(source, encoding="utf-8")
+    print(f"Recursive descent parser generated at {MODULE_PATH}")
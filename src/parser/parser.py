@@ -1,92 +1,423 @@
+from array import array
+from collections.abc import Iterable, Sequence
+
 from ..scanner.scanner import Scanner
 from .cfg import CFG
+from .codegen import load_descent_parser
+from .tracing import Tracer
+from .tree import SyntaxTree
 
 
 class Parser:
     """Custom class for the Syntax Analyzer / Parser."""
 
-    def __init__(self, scanner: Scanner, cfg: CFG) -> None:
-        """Initialize constructor for Parser class."""
+    trees: tuple = ("concrete", "abstract")
+
+    def __init__(
+        self, scanner: Scanner, cfg: CFG, tracer: Tracer | None = None
+    ) -> None:
+        """
+        Initialize constructor for Parser class.
+
+        Args:
+            scanner (Scanner): Scanner whose tokens are parsed
+            cfg (CFG): Grammar with the integer-coded parsing table
+            tracer (Tracer | None): Tracer of the parse, defaults to tracing off
+
+        Properties:
+            scanner (Scanner): Scanner whose tokens are parsed
+            cfg (CFG): Grammar with the integer-coded parsing table
+            tracer (Tracer): Tracer of the parse
+            tree (SyntaxTree | None): Syntax tree built by the last parse, if any
+            diagnostics (list): Syntax errors found by the last parse, when it
+                                recovers from them
+            terminal_codes (array): Terminal code of every scanner token id, or a
+                                    code past every symbol for tokens that are not
+                                    part of the grammar
+        """
         self.scanner = scanner
         self.cfg = cfg
+        self.tracer = Tracer() if tracer is None else tracer
+        self.tree = None
+        self.diagnostics = []
+        tokens_by_id = scanner.token_helper.tokens_by_id
+        unknown = len(cfg.symbol_names)
+        self.terminal_codes = array("H", [unknown] * (max(tokens_by_id) + 1))
+        for token_id, token in tokens_by_id.items():
+            if token in cfg.ordered_t:
+                self.terminal_codes[token_id] = cfg.symbol_codes[token]
+
+    def is_main(self, token: tuple) -> bool:
+        """
+        Check if a token is the identifier of the main function.
+
+        Args:
+            token (tuple): Token from the scanner output
+
+        Returns:
+            bool: True if the token is the `main` identifier
+        """
+        return (
+            self.terminal_codes[token[0]] == self.cfg.symbol_codes["ID"]
+            and self.scanner.id_symbol_table[token[1]] == "main"
+        )
+
+    def terminal_error(
+        self, expected: int, token: tuple, position: int, last_token: int | None
+    ) -> Exception:
+        """
+        Describe a token that is not the terminal expected by the grammar.
+
+        Args:
+            expected (int): Code of the expected terminal
+            token (tuple): Token received instead
+            position (int): Position of the token in the scanner output
+            last_token (int | None): Code of the last matched terminal, if any
+
+        Returns:
+            Exception: Syntax error
+        """
+        expected = self.cfg.symbol_names[expected]
+        received = self.scanner.token_helper.tokens_by_id[token[0]]
+        msg = f"Error: {expected} is not a non-terminal symbol in production "
+        msg += f"{expected}. Expected '{expected}' but received '{received}' "
+        msg += "instead. "
+
+        # Catch read statement error.
+        if last_token == self.cfg.symbol_codes["read"]:
+            msg += "Read statement failed to parse."
+            return Exception(msg + self.location(position, " "))
+        return Exception(msg + self.location(position))
+
+    def prediction_error(self, nt: int, token: tuple, position: int) -> Exception:
+        """
+        Describe a token that no production of a non terminal can start with.
+
+        Args:
+            nt (int): Code of the non terminal
+            token (tuple): Token received
+            position (int): Position of the token in the scanner output
+
+        Returns:
+            Exception: Syntax error, or a KeyError for tokens that are not part of
+                       the grammar
+        """
+        cfg = self.cfg
+        code = self.terminal_codes[token[0]]
+        if code >= cfg.num_terminals:
+            # Tokens that are not part of the grammar have no column
+            return KeyError(self.scanner.token_helper.tokens_by_id[token[0]])
+
+        # If current token is terminal not part of first plus set
+        expected = cfg.expected[nt - cfg.num_terminals]
+        msg = f"Error: Expected one of {expected} for production "
+        msg += f"'{cfg.symbol_names[nt]}' but received "
+        msg += f"'{cfg.symbol_names[code]}' instead."
+        return Exception(msg + self.location(position, " "))
 
-    def parse(self) -> bool:
-        """Parse the tokens from the scanner to check for syntactic errors."""
-        table = self.cfg.table
+    def fail(self, error: Exception, position: int) -> Exception:
+        """
+        Trace the error that stopped the parser, before it is raised.
+
+        Args:
+            error (Exception): Error to be raised
+            position (int): Number of tokens matched before the error
+
+        Returns:
+            Exception: The same error
+        """
+        self.tracer.error(str(error), position)
+        return error
+
+    def location(self, position: int, separator: str = "") -> str:
+        """
+        Describe where a token is in the source, if the scanner saved its span.
+
+        Args:
+            position (int): Position of the token in the scanner output
+            separator (str): Text put before the description
+
+        Returns:
+            str: Line and column of the token, or an empty string if unknown
+        """
+        found = self.scanner.location(position)
+        if found is None:
+            return ""
+        line, column = found
+        return f"{separator}Found at line {line}:{column}."
+
+    def parse(
+        self,
+        tokens: Iterable[tuple] | None = None,
+        tree: str | None = None,
+        max_errors: int = 0,
+    ) -> bool:
+        """
+        Parse the tokens from the scanner to check for syntactic errors.
+
+        Tokens are pulled one at a time with one token of lookahead, so a generator
+        such as `Scanner.tokens()` is consumed only as far as the first syntax error.
+        Matched tokens and predicted productions are only traced when the tracer
+        asks for them, so with tracing off the loop does no extra work.
+
+        A concrete syntax tree is built alongside the parse stack when asked for:
+        every predicted production adds the children of its non terminal, and every
+        matched terminal records the position of its token. Abstract trees are
+        reduced from it once the parse succeeds. The tree is saved to `tree`.
+
+        With `max_errors`, syntax errors are saved to `diagnostics` instead of
+        raised, and the parser recovers in panic mode: a missing terminal is
+        assumed to be there, and a non terminal that cannot start with the token
+        skips tokens until one it can start with, or until one in its
+        synchronizing set, which pops it. Statements are also popped at the `;`
+        that ends them, which is skipped with them. Every recovery pops a symbol or
+        consumes a token, so the parse always ends. Errors found before another
+        token is matched are cascades of the last one, and are not saved.
+
+        Args:
+            tokens (Iterable[tuple] | None): Tokens to be parsed, defaults to the
+                                             output list of the scanner
+            tree (str | None): Syntax tree to be built, `concrete` or `abstract`,
+                               or None to only check the syntax
+            max_errors (int): Syntax errors saved before the parse stops, or 0 to
+                              raise the first one
+
+        Raises:
+            ValueError: Raised when the kind of tree is unknown
+            Exception: Raised on the first syntax error, without `max_errors`
+            KeyError: Raised on the first token that is not part of the grammar,
+                      without `max_errors`
+
+        Returns:
+            bool: True if the tokens were parsed successfully
+        """
+        if tree is not None and tree not in self.trees:
+            raise ValueError(
+                f"Unknown syntax tree '{tree}', expected one of {self.trees}"
+            )
+
+        cfg = self.cfg
+        num_terminals = cfg.num_terminals
+        symbol_names = cfg.symbol_names
+        # The flat parsing table is shared, read-only, by every parser
+        row_offsets = cfg.row_offsets
+        cells = cfg.cells
+        # A plain copy of the shared, read-only productions is faster to index
+        reversed_rhs = list(cfg.reversed_rhs)
+        terminal_codes = self.terminal_codes
         token_identifier = self.scanner.token_helper.tokens_by_id
-        input_tokens = [
-            (self.scanner.token_helper.token_ids["$"],),
-            *self.scanner.output[::-1],
-        ]
+        end_of_input = (self.scanner.token_helper.token_ids["$"],)
+        input_tokens = iter(self.scanner.output if tokens is None else tokens)
+
+        end = cfg.symbol_codes["$"]
+        main_nt, main_terminal, main_production, function_production = cfg.main_rule
+        sync_sets = cfg.sync_sets
+        terminators = cfg.terminators
+        productions = cfg.productions
+        tracer = self.tracer
+        trace_tokens = tracer.tokens
+        trace_predictions = tracer.predictions
 
-        non_terminals = self.cfg.ordered_nt
-        rhs_productions = self.cfg.rhs_productions
+        # The start symbol is the first non terminal
+        stack = array("H", [end, num_terminals])
 
-        stack = ["$"]
-        stack.append(non_terminals[0])
+        # Nodes of the symbols on the stack, from the start symbol at node 0 up
+        build = tree is not None
+        syntax_tree = self.tree = None
+        if build:
+            syntax_tree = SyntaxTree(symbol_names, num_terminals, reversed_rhs)
+            syntax_tree.add(num_terminals)
+            nodes = array("i", [-1, 0])
+            node_tokens = syntax_tree.tokens
+            expand = syntax_tree.expand
 
-        token_id = input_tokens.pop()
-        next_token = input_tokens[-1]
+        token_id = next(input_tokens, end_of_input)
+        next_token = next(input_tokens, end_of_input)
         last_token = None
+        position = 0
 
-        while stack[-1] != "$":
+        # Tokens skipped by error recovery, and tokens matched at the last error
+        diagnostics = self.diagnostics = []
+        skipped = 0
+        matched_at_error = -1
+
+        while stack[-1] != end:
             top = stack[-1]
-            token = token_identifier[token_id[0]]
+            token = terminal_codes[token_id[0]]
 
             # Check for a match between the top of the stack and the current token
             if top == token:
-                print(f"Matched terminal: {token} on production {stack[-1]}")
-
-                # Do small semantic analysis to enforce last function to be main
-                if token == "void" and token_identifier[next_token[0]] == "ID":
-                    idx = next_token[1]
-                    name = self.scanner.id_symbol_table[idx]
-
-                    if name == "main":
-                        table["declaration_list"]["void"] = 3
-                        stack = stack[:-7]
+                if trace_tokens:
+                    tracer.token(symbol_names[token])
 
                 # Pop the stack and get the next token
                 stack.pop()
+                if build:
+                    node_tokens[nodes.pop()] = position
                 last_token = token
-                token_id = input_tokens.pop()
-
-                if len(input_tokens) > 1:
-                    next_token = input_tokens[-1]
+                token_id = next_token
+                next_token = next(input_tokens, end_of_input)
+                position += 1
+                continue
 
             # If current token is terminal but is not the expected token, throw error
-            elif top not in non_terminals:
-                msg = f"Error: {top} is not a non-terminal symbol in production "
-                msg += f"{stack[-1]}. Expected '{top}' but received '{token}' instead. "
-                
-                # Catch read statement error.
-                if last_token == "read":
-                    msg += "Read statement failed to parse."
-                
-                raise Exception(msg)
-            # If current token is terminal not part of first plus set, throw error
-            elif table[top][token] == "ERROR":
-                filter_list = list(
-                    filter(lambda x: x[1] != "ERROR", table[top].items())
-                )
-                expected = [x[0] for x in filter_list]
-                msg = f"Error: Expected one of {expected} for production "
-                msg += f"'{stack[-1]}' but received '{token}' instead."
-                raise Exception(msg)
+            elif top < num_terminals:
+                error = self.terminal_error(top, token_id, position, last_token)
             else:
-                # Get the RHS productions for the current token
-                production_num = table[top][token]
-                production_symbols = rhs_productions[production_num][::-1]
+                if token >= num_terminals:
+                    if not max_errors:
+                        raise self.fail(
+                            self.prediction_error(top, token_id, position), position
+                        )
+                    received = token_identifier[token_id[0]]
+                    msg = f"Error: Received '{received}', which is not part of the "
+                    msg += "grammar."
+                    error = Exception(msg + self.location(position, " "))
+                    production_num = 0
+                elif top == main_nt and token == main_terminal:
+                    # Enforce the last declaration to be the main function, which
+                    # takes one more token of lookahead than the table
+                    production_num = (
+                        main_production
+                        if self.is_main(next_token)
+                        else function_production
+                    )
+                elif not (
+                    production_num := cells[row_offsets[top - num_terminals] + token]
+                ):
+                    error = self.prediction_error(top, token_id, position)
+
+                if production_num:
+                    if trace_predictions:
+                        tracer.prediction(
+                            symbol_names[top],
+                            symbol_names[token],
+                            production_num,
+                            productions[production_num - 1],
+                        )
+
+                    # Pop the stack and push the reversed RHS of the production
+                    stack.pop()
+                    stack.extend(reversed_rhs[production_num])
+                    if build:
+                        nodes.extend(expand(nodes.pop(), production_num))
+                    continue
 
-                # Pop the stack and push the RHS productions
+            if not max_errors:
+                raise self.fail(error, position)
+
+            # Errors before another token is matched are cascades of the last one
+            if position - skipped != matched_at_error:
+                matched_at_error = position - skipped
+                diagnostics.append(str(error))
+                if len(diagnostics) == max_errors:
+                    break
+
+            if top < num_terminals or token == end or (
+                token < num_terminals and token in sync_sets[top - num_terminals]
+            ):
+                # Assume a missing terminal was there, or give up on a non terminal
                 stack.pop()
-                if "ε" not in production_symbols:
-                    stack.extend(production_symbols)
+                if build:
+                    nodes.pop()
+            elif token in terminators[top - num_terminals]:
+                # Give up on a statement at the `;` that ends it, which is consumed
+                stack.pop()
+                if build:
+                    nodes.pop()
+                token_id = next_token
+                next_token = next(input_tokens, end_of_input)
+                position += 1
+                skipped += 1
+            else:
+                # Skip the token, looking for one the non terminal can start with
+                token_id = next_token
+                next_token = next(input_tokens, end_of_input)
+                position += 1
+                skipped += 1
 
-        # Identify last token in input
-        token = token_identifier[token_id[0]]
+        if max_errors and stack[-1] == end and terminal_codes[token_id[0]] != end:
+            if position - skipped != matched_at_error and len(diagnostics) < max_errors:
+                msg = "Error: Expected the end of the program but received "
+                msg += f"'{token_identifier[token_id[0]]}' instead."
+                diagnostics.append(msg + self.location(position, " "))
 
         # Verify last token and stack top are both "$"
-        if stack[-1] == "$" and token == "$":
-            print("Parsing successful.")
+        if (
+            not diagnostics
+            and stack[-1] == end
+            and terminal_codes[token_id[0]] == end
+        ):
+            if build:
+                self.tree = (
+                    syntax_tree.abstract() if tree == "abstract" else syntax_tree
+                )
+            tracer.finish(True, position)
+            return True
+
+        tracer.finish(False, position)
+
+
+class DescentParser(Parser):
+    """Custom class for the recursive descent parser generated from the grammar."""
+
+    def parse(self, tokens: Iterable[tuple] | None = None) -> bool:
+        """
+        Parse the tokens with the generated recursive descent parser.
+
+        Every non terminal is a function of `recursive_descent.py`, generated from
+        the parsing table by `codegen`, so the same programs are accepted and
+        rejected as with `Parser.parse`, with the same errors. The terminal codes
+        of the tokens are looked up at once before parsing, so tokens from a
+        generator are read to the end first. Programs nested too deep for Python
+        recursion are handed to the table-driven parser.
+
+        Only the result and errors of the parse are traced. Syntax trees and error
+        recovery are left to the table-driven parser.
+
+        Args:
+            tokens (Iterable[tuple] | None): Tokens to be parsed, defaults to the
+                                             output list of the scanner
+
+        Raises:
+            Exception: Raised on the first syntax error
+            KeyError: Raised on the first token that is not part of the grammar
+
+        Returns:
+            bool: True if the tokens were parsed successfully
+        """
+        cfg = self.cfg
+        if tokens is None:
+            tokens = self.scanner.output
+        elif not isinstance(tokens, Sequence):
+            tokens = list(tokens)
+        terminal_codes = self.terminal_codes
+        end = cfg.symbol_codes["$"]
+        end_of_input = (self.scanner.token_helper.token_ids["$"],)
+        kinds = array("H", [terminal_codes[token[0]] for token in tokens])
+        kinds.append(end)
+        count = len(tokens)
+
+        def is_main(position: int) -> bool:
+            return position + 1 < count and self.is_main(tokens[position + 1])
+
+        def fail(symbol: int, position: int) -> Exception:
+            token = tokens[position] if position < count else end_of_input
+            if symbol >= cfg.num_terminals:
+                error = self.prediction_error(symbol, token, position)
+            else:
+                last_token = kinds[position - 1] if position else None
+                error = self.terminal_error(symbol, token, position, last_token)
+            return self.fail(error, position)
+
+        try:
+            position = load_descent_parser(cfg).parse(kinds, is_main, fail)
+        except RecursionError:
+            return super().parse(tokens)
+
+        # Verify last token is "$"
+        if kinds[position] == end:
+            self.tracer.finish(True, position)
             return True
+
+        self.tracer.finish(False, position)
@@ -0,0 +1,658 @@
+"""
+Recursive descent parser generated from data/grammar.txt.
+
+Do not edit, regenerate it with `python -m src.parser.codegen`.
+"""
+
+SOURCE_HASH = "8b9523885bfd518bccfb8e99fd4a90f17251a34089afd9766f33443cb00408f6"
+
+_FIRST0 = frozenset([22, 24, 27, 28])
+_FIRST1 = frozenset([22, 24, 27])
+_FIRST2 = frozenset([8, 19])
+_FIRST3 = frozenset([2, 5])
+_FIRST4 = frozenset([16, 23, 25, 26, 29, 30, 31, 32])
+_FIRST5 = frozenset([16, 23, 25, 29, 30, 31])
+_FIRST6 = frozenset([26, 32])
+_FIRST7 = frozenset([11, 19])
+_FIRST8 = frozenset([1, 15, 16, 17])
+_FIRST9 = frozenset([8, 11])
+_FIRST10 = frozenset([0, 9, 10, 12, 13, 14])
+_FIRST11 = frozenset([2, 8])
+_FIRST12 = frozenset([0, 2, 5, 8, 9, 10, 12, 13, 14, 20])
+_FIRST13 = frozenset([4, 6])
+_FIRST14 = frozenset([0, 2, 4, 5, 6, 8, 9, 10, 12, 13, 14, 20])
+_FIRST15 = frozenset([3, 7])
+_FIRST16 = frozenset([15, 17])
+_FIRST17 = frozenset([0, 2, 3, 4, 5, 6, 7, 8, 9, 10, 12, 13, 14, 20])
+
+
+def parse(kinds, is_main, fail):
+    pos = 0
+
+    def parse_program():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind in _FIRST0:
+            # program->declaration_list void ID ( void ) compound_stmt
+            parse_declaration_list()
+            if kinds[pos] != 28:  # void
+                raise fail(28, pos)
+            pos += 1
+            if kinds[pos] != 16:  # ID
+                raise fail(16, pos)
+            pos += 1
+            if kinds[pos] != 1:  # (
+                raise fail(1, pos)
+            pos += 1
+            if kinds[pos] != 28:  # void
+                raise fail(28, pos)
+            pos += 1
+            if kinds[pos] != 2:  # )
+                raise fail(2, pos)
+            pos += 1
+            parse_compound_stmt()
+            return
+        raise fail(34, pos)
+
+    def parse_declaration_list():
+        nonlocal pos
+        while True:
+            kind = kinds[pos]
+            # Enforce the last declaration to be the main function
+            if kind == 28 and is_main(pos):  # void
+                # declaration_list->ε
+                return
+            if kind in _FIRST0:
+                # declaration_list->declaration declaration_list
+                parse_declaration()
+                continue
+            raise fail(35, pos)
+
+    def parse_declaration():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind in _FIRST1:
+            # declaration->type_specifier ID declaration'
+            parse_type_specifier()
+            if kinds[pos] != 16:  # ID
+                raise fail(16, pos)
+            pos += 1
+            parse_declaration_prime()
+            return
+        elif kind == 28:  # void
+            # declaration->void ID ( params ) compound_stmt
+            pos += 1
+            if kinds[pos] != 16:  # ID
+                raise fail(16, pos)
+            pos += 1
+            if kinds[pos] != 1:  # (
+                raise fail(1, pos)
+            pos += 1
+            parse_params()
+            if kinds[pos] != 2:  # )
+                raise fail(2, pos)
+            pos += 1
+            parse_compound_stmt()
+            return
+        raise fail(36, pos)
+
+    def parse_declaration_prime():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind == 1:  # (
+            # declaration'->( params ) { local_declarations statement_list return expression ; }
+            pos += 1
+            parse_params()
+            if kinds[pos] != 2:  # )
+                raise fail(2, pos)
+            pos += 1
+            if kinds[pos] != 31:  # {
+                raise fail(31, pos)
+            pos += 1
+            parse_local_declarations()
+            parse_statement_list()
+            if kinds[pos] != 26:  # return
+                raise fail(26, pos)
+            pos += 1
+            parse_expression()
+            if kinds[pos] != 8:  # ;
+                raise fail(8, pos)
+            pos += 1
+            if kinds[pos] != 32:  # }
+                raise fail(32, pos)
+            pos += 1
+            return
+        elif kind in _FIRST2:
+            # declaration'->var_declaration'
+            parse_var_declaration_prime()
+            return
+        raise fail(37, pos)
+
+    def parse_var_declaration():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind in _FIRST1:
+            # var_declaration->type_specifier ID var_declaration'
+            parse_type_specifier()
+            if kinds[pos] != 16:  # ID
+                raise fail(16, pos)
+            pos += 1
+            parse_var_declaration_prime()
+            return
+        raise fail(38, pos)
+
+    def parse_var_declaration_prime():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind == 8:  # ;
+            # var_declaration'->;
+            pos += 1
+            return
+        elif kind == 19:  # [
+            # var_declaration'->[ INTEGER ] ;
+            pos += 1
+            if kinds[pos] != 17:  # INTEGER
+                raise fail(17, pos)
+            pos += 1
+            if kinds[pos] != 20:  # ]
+                raise fail(20, pos)
+            pos += 1
+            if kinds[pos] != 8:  # ;
+                raise fail(8, pos)
+            pos += 1
+            return
+        raise fail(39, pos)
+
+    def parse_type_specifier():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind == 22:  # float
+            # type_specifier->float
+            pos += 1
+            return
+        elif kind == 24:  # int
+            # type_specifier->int
+            pos += 1
+            return
+        elif kind == 27:  # string
+            # type_specifier->string
+            pos += 1
+            return
+        raise fail(40, pos)
+
+    def parse_params():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind in _FIRST1:
+            # params->type_specifier ID param param_list
+            parse_type_specifier()
+            if kinds[pos] != 16:  # ID
+                raise fail(16, pos)
+            pos += 1
+            parse_param()
+            parse_param_list()
+            return
+        elif kind == 28:  # void
+            # params->void
+            pos += 1
+            return
+        raise fail(41, pos)
+
+    def parse_param_list():
+        nonlocal pos
+        while True:
+            kind = kinds[pos]
+            if kind == 2:  # )
+                # param_list->ε
+                return
+            elif kind == 5:  # ,
+                # param_list->, type_specifier ID param param_list
+                pos += 1
+                parse_type_specifier()
+                if kinds[pos] != 16:  # ID
+                    raise fail(16, pos)
+                pos += 1
+                parse_param()
+                continue
+            raise fail(42, pos)
+
+    def parse_param():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind in _FIRST3:
+            # param->ε
+            return
+        elif kind == 19:  # [
+            # param->[ ]
+            pos += 1
+            if kinds[pos] != 20:  # ]
+                raise fail(20, pos)
+            pos += 1
+            return
+        raise fail(43, pos)
+
+    def parse_compound_stmt():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind == 31:  # {
+            # compound_stmt->{ local_declarations statement_list return ; }
+            pos += 1
+            parse_local_declarations()
+            parse_statement_list()
+            if kinds[pos] != 26:  # return
+                raise fail(26, pos)
+            pos += 1
+            if kinds[pos] != 8:  # ;
+                raise fail(8, pos)
+            pos += 1
+            if kinds[pos] != 32:  # }
+                raise fail(32, pos)
+            pos += 1
+            return
+        raise fail(44, pos)
+
+    def parse_local_declarations():
+        nonlocal pos
+        while True:
+            kind = kinds[pos]
+            if kind in _FIRST4:
+                # local_declarations->ε
+                return
+            elif kind in _FIRST1:
+                # local_declarations->var_declaration local_declarations
+                parse_var_declaration()
+                continue
+            raise fail(45, pos)
+
+    def parse_statement_list():
+        nonlocal pos
+        while True:
+            kind = kinds[pos]
+            if kind in _FIRST5:
+                # statement_list->statement statement_list
+                parse_statement()
+                continue
+            elif kind in _FIRST6:
+                # statement_list->ε
+                return
+            raise fail(46, pos)
+
+    def parse_statement():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind == 16:  # ID
+            # statement->ID statement'
+            pos += 1
+            parse_statement_prime()
+            return
+        elif kind == 23:  # if
+            # statement->if ( expression ) body selection_stmt
+            pos += 1
+            if kinds[pos] != 1:  # (
+                raise fail(1, pos)
+            pos += 1
+            parse_expression()
+            if kinds[pos] != 2:  # )
+                raise fail(2, pos)
+            pos += 1
+            parse_body()
+            parse_selection_stmt()
+            return
+        elif kind == 25:  # read
+            # statement->read ID var ;
+            pos += 1
+            if kinds[pos] != 16:  # ID
+                raise fail(16, pos)
+            pos += 1
+            parse_var()
+            if kinds[pos] != 8:  # ;
+                raise fail(8, pos)
+            pos += 1
+            return
+        elif kind == 29:  # while
+            # statement->while ( expression ) body
+            pos += 1
+            if kinds[pos] != 1:  # (
+                raise fail(1, pos)
+            pos += 1
+            parse_expression()
+            if kinds[pos] != 2:  # )
+                raise fail(2, pos)
+            pos += 1
+            parse_body()
+            return
+        elif kind == 30:  # write
+            # statement->write expression ;
+            pos += 1
+            parse_expression()
+            if kinds[pos] != 8:  # ;
+                raise fail(8, pos)
+            pos += 1
+            return
+        elif kind == 31:  # {
+            # statement->{ local_declarations statement_list }
+            pos += 1
+            parse_local_declarations()
+            parse_statement_list()
+            if kinds[pos] != 32:  # }
+                raise fail(32, pos)
+            pos += 1
+            return
+        raise fail(47, pos)
+
+    def parse_body():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind in _FIRST5:
+            # body->statement
+            parse_statement()
+            return
+        elif kind == 26:  # return
+            # body->return return_stmt
+            pos += 1
+            parse_return_stmt()
+            return
+        raise fail(48, pos)
+
+    def parse_statement_prime():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind == 1:  # (
+            # statement'->( args ) ;
+            pos += 1
+            parse_args()
+            if kinds[pos] != 2:  # )
+                raise fail(2, pos)
+            pos += 1
+            if kinds[pos] != 8:  # ;
+                raise fail(8, pos)
+            pos += 1
+            return
+        elif kind in _FIRST7:
+            # statement'->var = assignment_stmt
+            parse_var()
+            if kinds[pos] != 11:  # =
+                raise fail(11, pos)
+            pos += 1
+            parse_assignment_stmt()
+            return
+        raise fail(49, pos)
+
+    def parse_assignment_stmt():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind in _FIRST8:
+            # assignment_stmt->expression ;
+            parse_expression()
+            if kinds[pos] != 8:  # ;
+                raise fail(8, pos)
+            pos += 1
+            return
+        elif kind == 18:  # STRING
+            # assignment_stmt->STRING ;
+            pos += 1
+            if kinds[pos] != 8:  # ;
+                raise fail(8, pos)
+            pos += 1
+            return
+        raise fail(50, pos)
+
+    def parse_selection_stmt():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind in _FIRST4:
+            # selection_stmt->ε
+            return
+        elif kind == 21:  # else
+            # selection_stmt->else body
+            pos += 1
+            parse_body()
+            return
+        raise fail(51, pos)
+
+    def parse_return_stmt():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind in _FIRST8:
+            # return_stmt->expression ;
+            parse_expression()
+            if kinds[pos] != 8:  # ;
+                raise fail(8, pos)
+            pos += 1
+            return
+        elif kind == 8:  # ;
+            # return_stmt->;
+            pos += 1
+            return
+        raise fail(52, pos)
+
+    def parse_var():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind in _FIRST9:
+            # var->ε
+            return
+        elif kind == 19:  # [
+            # var->[ arithmetic_expression ]
+            pos += 1
+            parse_arithmetic_expression()
+            if kinds[pos] != 20:  # ]
+                raise fail(20, pos)
+            pos += 1
+            return
+        raise fail(53, pos)
+
+    def parse_expression():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind in _FIRST8:
+            # expression->arithmetic_expression expression'
+            parse_arithmetic_expression()
+            parse_expression_prime()
+            return
+        raise fail(54, pos)
+
+    def parse_expression_prime():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind in _FIRST10:
+            # expression'->relop arithmetic_expression
+            parse_relop()
+            parse_arithmetic_expression()
+            return
+        elif kind in _FIRST11:
+            # expression'->ε
+            return
+        raise fail(55, pos)
+
+    def parse_relop():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind == 0:  # !=
+            # relop->!=
+            pos += 1
+            return
+        elif kind == 9:  # <
+            # relop-><
+            pos += 1
+            return
+        elif kind == 10:  # <=
+            # relop-><=
+            pos += 1
+            return
+        elif kind == 12:  # ==
+            # relop->==
+            pos += 1
+            return
+        elif kind == 13:  # >
+            # relop->>
+            pos += 1
+            return
+        elif kind == 14:  # >=
+            # relop->>=
+            pos += 1
+            return
+        raise fail(56, pos)
+
+    def parse_arithmetic_expression():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind in _FIRST8:
+            # arithmetic_expression->term arithmetic_expression'
+            parse_term()
+            parse_arithmetic_expression_prime()
+            return
+        raise fail(57, pos)
+
+    def parse_arithmetic_expression_prime():
+        nonlocal pos
+        while True:
+            kind = kinds[pos]
+            if kind in _FIRST12:
+                # arithmetic_expression'->ε
+                return
+            elif kind in _FIRST13:
+                # arithmetic_expression'->addop term arithmetic_expression'
+                parse_addop()
+                parse_term()
+                continue
+            raise fail(58, pos)
+
+    def parse_addop():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind == 4:  # +
+            # addop->+
+            pos += 1
+            return
+        elif kind == 6:  # -
+            # addop->-
+            pos += 1
+            return
+        raise fail(59, pos)
+
+    def parse_term():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind in _FIRST8:
+            # term->factor term'
+            parse_factor()
+            parse_term_prime()
+            return
+        raise fail(60, pos)
+
+    def parse_term_prime():
+        nonlocal pos
+        while True:
+            kind = kinds[pos]
+            if kind in _FIRST14:
+                # term'->ε
+                return
+            elif kind in _FIRST15:
+                # term'->mulop factor term'
+                parse_mulop()
+                parse_factor()
+                continue
+            raise fail(61, pos)
+
+    def parse_mulop():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind == 3:  # *
+            # mulop->*
+            pos += 1
+            return
+        elif kind == 7:  # /
+            # mulop->/
+            pos += 1
+            return
+        raise fail(62, pos)
+
+    def parse_factor():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind == 1:  # (
+            # factor->( arithmetic_expression )
+            pos += 1
+            parse_arithmetic_expression()
+            if kinds[pos] != 2:  # )
+                raise fail(2, pos)
+            pos += 1
+            return
+        elif kind in _FIRST16:
+            # factor->num
+            parse_num()
+            return
+        elif kind == 16:  # ID
+            # factor->ID factor'
+            pos += 1
+            parse_factor_prime()
+            return
+        raise fail(63, pos)
+
+    def parse_factor_prime():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind in _FIRST17:
+            # factor'->ε
+            return
+        elif kind == 1:  # (
+            # factor'->( args )
+            pos += 1
+            parse_args()
+            if kinds[pos] != 2:  # )
+                raise fail(2, pos)
+            pos += 1
+            return
+        elif kind == 19:  # [
+            # factor'->[ arithmetic_expression ]
+            pos += 1
+            parse_arithmetic_expression()
+            if kinds[pos] != 20:  # ]
+                raise fail(20, pos)
+            pos += 1
+            return
+        raise fail(64, pos)
+
+    def parse_num():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind == 15:  # FLOAT
+            # num->FLOAT
+            pos += 1
+            return
+        elif kind == 17:  # INTEGER
+            # num->INTEGER
+            pos += 1
+            return
+        raise fail(65, pos)
+
+    def parse_args():
+        nonlocal pos
+        kind = kinds[pos]
+        if kind in _FIRST8:
+            # args->arithmetic_expression arg_list
+            parse_arithmetic_expression()
+            parse_arg_list()
+            return
+        elif kind == 2:  # )
+            # args->ε
+            return
+        raise fail(66, pos)
+
+    def parse_arg_list():
+        nonlocal pos
+        while True:
+            kind = kinds[pos]
+            if kind == 2:  # )
+                # arg_list->ε
+                return
+            elif kind == 5:  # ,
+                # arg_list->, arithmetic_expression arg_list
+                pos += 1
+                parse_arithmetic_expression()
+                continue
+            raise fail(67, pos)
+
+    parse_program()
+    return pos
@@ -0,0 +1,180 @@
+import sys
+from collections import deque
+from pathlib import Path
+from typing import TextIO
+
+OFF = 0
+SUMMARY = 1
+TOKENS = 2
+PREDICTIONS = 3
+LEVELS = {"off": OFF, "summary": SUMMARY, "tokens": TOKENS, "predictions": PREDICTIONS}
+
+
+class RingBuffer:
+    """Custom class for a trace sink that keeps only the last events in memory."""
+
+    def __init__(self, size: int = 100, stream: TextIO | None = None) -> None:
+        """
+        Initialize constructor for RingBuffer class.
+
+        Args:
+            size (int): Number of events kept
+            stream (TextIO | None): Stream the events are dumped to on errors,
+                                    defaults to standard error
+
+        Properties:
+            events (deque): Last events, oldest first
+            stream (TextIO | None): Stream the events are dumped to on errors
+            write (Callable): Save an event, dropping the oldest one when full
+        """
+        self.events = deque(maxlen=size)
+        self.stream = stream
+        self.write = self.events.append
+
+    def error(self, message: str) -> None:
+        """
+        Dump the last events, followed by the error that stopped the parser.
+
+        Args:
+            message (str): Error message
+        """
+        stream = sys.stderr if self.stream is None else self.stream
+        stream.write(f"Last {len(self.events)} trace events:\n")
+        stream.writelines(f"{event}\n" for event in self.events)
+        stream.write(f"{message}\n")
+        stream.flush()
+
+    def close(self) -> None:
+        """Keep the events, which remain available after the parse."""
+
+
+class FileWriter:
+    """Custom class for a trace sink that writes every event to a buffered file."""
+
+    def __init__(
+        self, target: str | Path | TextIO, buffer_size: int = 1 << 16
+    ) -> None:
+        """
+        Initialize constructor for FileWriter class.
+
+        Args:
+            target (str | Path | TextIO): Path of the file, or an open text stream
+                                          such as standard output
+            buffer_size (int): Bytes buffered before writing to a file
+
+        Properties:
+            file (TextIO): Stream the events are written to
+            owned (bool): Whether the file was opened here, and is closed here
+        """
+        self.owned = isinstance(target, (str, Path))
+        self.file = (
+            Path(target).open("w", encoding="utf-8", buffering=buffer_size)
+            if self.owned
+            else target
+        )
+
+    def write(self, event: str) -> None:
+        """
+        Write an event as a line.
+
+        Args:
+            event (str): Event to be written
+        """
+        self.file.write(f"{event}\n")
+
+    def error(self, message: str) -> None:
+        """
+        Write the error that stopped the parser, and flush the file.
+
+        Args:
+            message (str): Error message
+        """
+        self.write(message)
+        self.file.flush()
+
+    def close(self) -> None:
+        """Flush the events, closing the file if it was opened here."""
+        if self.owned:
+            self.file.close()
+        else:
+            self.file.flush()
+
+
+class Tracer:
+    """Custom class to report parser events to a sink, up to a tracing level."""
+
+    def __init__(
+        self, level: int | str = OFF, sink: RingBuffer | FileWriter | None = None
+    ) -> None:
+        """
+        Initialize constructor for Tracer class.
+
+        The parser checks `tokens` and `predictions` once before it starts, and only
+        calls the tracer for the events of the selected level.
+
+        Args:
+            level (int | str): Tracing level, or its name in `LEVELS`
+            sink (RingBuffer | FileWriter | None): Sink of the events, defaults
+                                                   to a writer to standard output
+
+        Properties:
+            level (int): Tracing level, from `OFF` to `PREDICTIONS`
+            sink (RingBuffer | FileWriter): Sink of the events
+            summary (bool): Whether the result and errors of the parse are traced
+            tokens (bool): Whether every matched token is traced
+            predictions (bool): Whether every predicted production is traced
+        """
+        self.level = LEVELS[level] if isinstance(level, str) else level
+        self.sink = FileWriter(sys.stdout) if sink is None else sink
+        self.summary = self.level >= SUMMARY
+        self.tokens = self.level >= TOKENS
+        self.predictions = self.level >= PREDICTIONS
+
+    def token(self, name: str) -> None:
+        """
+        Trace a terminal matched with the current token.
+
+        Args:
+            name (str): Terminal symbol
+        """
+        self.sink.write(f"Matched terminal: {name} on production {name}")
+
+    def prediction(
+        self, nt: str, terminal: str, number: int, production: str
+    ) -> None:
+        """
+        Trace a production predicted from the parsing table.
+
+        Args:
+            nt (str): Non terminal on top of the stack
+            terminal (str): Current token
+            number (int): Production number
+            production (str): Predicted production
+        """
+        self.sink.write(f"Predicted {number}: {production} for {nt} on '{terminal}'")
+
+    def finish(self, success: bool, tokens: int) -> None:
+        """
+        Trace the result of the parse, and close the sink.
+
+        Args:
+            success (bool): Whether the tokens were parsed successfully
+            tokens (int): Number of tokens matched
+        """
+        if self.summary:
+            result = "Parsing successful." if success else "Parsing failed."
+            self.sink.write(f"{result} Matched {tokens} tokens.")
+        self.sink.close()
+
+    def error(self, message: str, tokens: int) -> None:
+        """
+        Trace the error that stopped the parse, and close the sink.
+
+        Args:
+            message (str): Error message
+            tokens (int): Number of tokens matched before the error
+        """
+        if self.summary:
+            self.sink.write(f"Parsing failed. Matched {tokens} tokens.")
+            self.sink.error(message)
+        self.sink.close()
@@ -0,0 +1,332 @@
+from array import array
+from collections.abc import Iterator
+
+# Terminals left out of abstract trees, since the shape of the tree already says
+# where they were
+PUNCTUATION = {"(", ")", "[", "]", "{", "}", ";", ","}
+
+
+class SyntaxTree:
+    """Class to represent a syntax tree as an arena of nodes in parallel arrays."""
+
+    def __init__(
+        self, symbol_names: list, num_terminals: int, reversed_rhs: list = ()
+    ) -> None:
+        """
+        Initialize constructor for SyntaxTree class.
+
+        A node is an index into the arrays, and there is no object per node. The
+        children of a node are created together, so they are consecutive, but they
+        are still linked as siblings so trees can be reshaped. `Node` gives a view
+        of a node for traversal.
+
+        Args:
+            symbol_names (list): Symbol name of every symbol code of the grammar
+            num_terminals (int): Number of terminal symbols, coded first
+            reversed_rhs (list): Reversed right hand side codes of every
+                                 production, for trees built by `expand`
+
+        Properties:
+            symbol_names (list): Symbol name of every symbol code of the grammar
+            num_terminals (int): Number of terminal symbols, coded first
+            kinds (array): Symbol code of every node
+            parents (array): Parent of every node, -1 for the root
+            first_child (array): First child of every node, -1 for leaves
+            next_sibling (array): Next sibling of every node, -1 for the last child
+            tokens (array): Position in the token stream of every terminal node,
+                            -1 for non terminals and unmatched terminals
+            templates (list): Number of children, their symbol codes and an array
+                              of -1 for each of them, for every production
+        """
+        self.symbol_names = symbol_names
+        self.num_terminals = num_terminals
+        self.kinds = array("H")
+        self.parents = array("i")
+        self.first_child = array("i")
+        self.next_sibling = array("i")
+        self.tokens = array("i")
+        self.templates = [
+            (len(rhs), array("H", rhs[::-1]), array("i", [-1] * len(rhs)))
+            for rhs in reversed_rhs
+        ]
+
+    def add(self, kind: int, parent: int = -1, token: int = -1) -> int:
+        """
+        Add a node without children, and no siblings yet.
+
+        Args:
+            kind (int): Symbol code of the node
+            parent (int): Parent of the node, -1 for the root
+            token (int): Position of the token matched by the node, if any
+
+        Returns:
+            int: The new node
+        """
+        self.kinds.append(kind)
+        self.parents.append(parent)
+        self.first_child.append(-1)
+        self.next_sibling.append(-1)
+        self.tokens.append(token)
+        return len(self.kinds) - 1
+
+    def expand(self, node: int, production: int) -> range:
+        """
+        Add the children of a node for the production predicted for it.
+
+        Args:
+            node (int): Node of the non terminal
+            production (int): Number of the production
+
+        Returns:
+            range: The new children, last first, to be pushed on the parse stack
+        """
+        count, kinds, blanks = self.templates[production]
+        start = len(self.kinds)
+        if not count:
+            return range(0)
+        self.kinds.extend(kinds)
+        self.parents.extend(array("i", (node,)) * count)
+        self.first_child.extend(blanks)
+        self.next_sibling.extend(range(start + 1, start + count))
+        self.next_sibling.append(-1)
+        self.tokens.extend(blanks)
+        self.first_child[node] = start
+        return range(start + count - 1, start - 1, -1)
+
+    def children(self, node: int) -> Iterator[int]:
+        """
+        Iterate over the children of a node.
+
+        Args:
+            node (int): Parent node
+
+        Yields:
+            int: Every child, in order
+        """
+        child = self.first_child[node]
+        next_sibling = self.next_sibling
+        while child >= 0:
+            yield child
+            child = next_sibling[child]
+
+    @property
+    def root(self) -> "Node":
+        """Get a view of the root node, the start symbol of the grammar."""
+        return Node(self, 0)
+
+    def __len__(self) -> int:
+        """Get the number of nodes in the arena, including detached nodes."""
+        return len(self.kinds)
+
+    @property
+    def nbytes(self) -> int:
+        """Get the bytes used by the node arrays, without their spare capacity."""
+        return sum(
+            len(values) * values.itemsize
+            for values in [
+                self.kinds,
+                self.parents,
+                self.first_child,
+                self.next_sibling,
+                self.tokens,
+            ]
+        )
+
+    def abstract(self) -> "SyntaxTree":
+        """
+        Build an abstract syntax tree from a concrete one.
+
+        Punctuation and non terminals that derived ε are dropped. Non terminals
+        with a single child are replaced by that child, and the tails made by the
+        grammar for lists and left factoring, such as `statement_list` under
+        `statement_list` or any `X'`, are spliced into their parent. What remains
+        are statements and expressions with their keywords, operators and operands.
+
+        Returns:
+            SyntaxTree: New tree, with only the nodes reachable from the root
+        """
+        names = self.symbol_names
+        num_terminals = self.num_terminals
+        kinds = self.kinds
+        parents = self.parents
+        tokens = self.tokens
+
+        # Children always come after their parent, so going backwards every node
+        # is reduced after all of its children
+        reduced = [None] * len(kinds)
+        for node in range(len(kinds) - 1, -1, -1):
+            kind = kinds[node]
+            if kind < num_terminals:
+                keep = tokens[node] >= 0 and names[kind] not in PUNCTUATION
+                reduced[node] = [(kind, tokens[node], [])] if keep else []
+                continue
+
+            items = []
+            for child in self.children(node):
+                items.extend(reduced[child])
+                reduced[child] = None
+            parent = parents[node]
+            spliced = names[kind].endswith("'") or (
+                parent >= 0 and kinds[parent] == kind
+            )
+            if node and (len(items) <= 1 or spliced):
+                reduced[node] = items
+            else:
+                reduced[node] = [(kind, -1, items)]
+
+        tree = SyntaxTree(names, num_terminals)
+        pending = [(item, -1) for item in reduced[0]]
+        while pending:
+            (kind, token, items), parent = pending.pop()
+            node = tree.add(kind, parent, token)
+            if parent >= 0:
+                tree.link(parent, node)
+            pending.extend((item, node) for item in reversed(items))
+        return tree
+
+    def link(self, parent: int, node: int) -> None:
+        """
+        Make a node the last child of its parent, when building a tree in order.
+
+        Children are added in preorder, so the last child of the parent is the
+        node added right before, or one of its ancestors.
+
+        Args:
+            parent (int): Parent node
+            node (int): New child
+        """
+        previous = node - 1
+        parents = self.parents
+        while previous > parent and parents[previous] != parent:
+            previous = parents[previous]
+        if previous == parent:
+            self.first_child[parent] = node
+        else:
+            self.next_sibling[previous] = node
+
+
+class Node:
+    """Class to represent a lightweight view of a node of a syntax tree."""
+
+    __slots__ = ("tree", "index")
+
+    def __init__(self, tree: SyntaxTree, index: int) -> None:
+        """
+        Initialize constructor for Node class.
+
+        Args:
+            tree (SyntaxTree): Tree holding the node
+            index (int): Index of the node in the arrays of the tree
+
+        Properties:
+            tree (SyntaxTree): Tree holding the node
+            index (int): Index of the node in the arrays of the tree
+        """
+        self.tree = tree
+        self.index = index
+
+    @property
+    def symbol(self) -> int:
+        """Get the symbol code of the node."""
+        return self.tree.kinds[self.index]
+
+    @property
+    def kind(self) -> str:
+        """Get the symbol name of the node."""
+        return self.tree.symbol_names[self.tree.kinds[self.index]]
+
+    @property
+    def is_terminal(self) -> bool:
+        """Check if the node is a terminal symbol."""
+        return self.tree.kinds[self.index] < self.tree.num_terminals
+
+    @property
+    def token(self) -> int | None:
+        """Get the position of the matched token in the token stream, if any."""
+        token = self.tree.tokens[self.index]
+        return None if token < 0 else token
+
+    @property
+    def parent(self) -> "Node | None":
+        """Get the parent of the node, if it is not the root."""
+        parent = self.tree.parents[self.index]
+        return None if parent < 0 else Node(self.tree, parent)
+
+    def children(self) -> Iterator["Node"]:
+        """
+        Iterate over the children of the node.
+
+        Yields:
+            Node: Every child, in order
+        """
+        for child in self.tree.children(self.index):
+            yield Node(self.tree, child)
+
+    def walk(self) -> Iterator["Node"]:
+        """
+        Iterate over the node and all of its descendants, in preorder.
+
+        The walk uses its own stack, so it works on trees of any depth.
+
+        Yields:
+            Node: Every node of the subtree
+        """
+        tree = self.tree
+        pending = [self.index]
+        while pending:
+            node = pending.pop()
+            yield Node(tree, node)
+            pending.extend(reversed(list(tree.children(node))))
+
+    def __eq__(self, other: object) -> bool:
+        """Check if two views are of the same node of the same tree."""
+        return (
+            isinstance(other, Node)
+            and self.tree is other.tree
+            and self.index == other.index
+        )
+
+    def __hash__(self) -> int:
+        """Hash a view by its tree and node."""
+        return hash((id(self.tree), self.index))
+
+    def __repr__(self) -> str:
+        """Describe the node by its symbol, and token position if it has one."""
+        token = self.token
+        suffix = "" if token is None else f" @{token}"
+        return f"Node({self.kind}{suffix})"
+
+
+class TreeVisitor:
+    """Class to walk a syntax tree, calling a method for every kind of node."""
+
+    def visit(self, node: Node) -> object:
+        """
+        Visit a node with its `visit_<kind>` method, or `generic_visit` if missing.
+
+        Quotes in symbol names are written as `_prime`, so `statement'` nodes are
+        visited by `visit_statement_prime`. Symbols that are not valid names, such
+        as operators, always use `generic_visit`.
+
+        Args:
+            node (Node): Node to be visited
+
+        Returns:
+            object: Value returned by the visit method
+        """
+        name = "visit_" + node.kind.replace("'", "_prime")
+        method = getattr(self, name, None) if name.isidentifier() else None
+        return (method or self.generic_visit)(node)
+
+    def generic_visit(self, node: Node) -> None:
+        """
+        Visit every child of a node.
+
+        Visits are recursive, so very deep concrete trees may be better traversed
+        with `Node.walk`. Abstract trees flatten lists, and stay shallow.
+
+        Args:
+            node (Node): Node whose children are visited
+        """
+        for child in node.children():
+            self.visit(child)
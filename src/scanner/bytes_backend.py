@@ -0,0 +1,189 @@
+import mmap
+import re
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+from .compiled_dfa import ACCEPTOR, BODY, CONSUMING, FINAL, INCOMPLETE, CompiledDFA
+from .tokens import Tokens
+from .transition_table import TransitionTable
+
+if TYPE_CHECKING:
+    from .scanner import Scanner
+
+NON_ASCII = re.compile(rb"[\x80-\xff]")
+
+
+class BytesBackend:
+    """Custom class for the Scanner's memory-mapped bytes backend."""
+
+    def __init__(
+        cls, automaton: TransitionTable, dfa: CompiledDFA, token_helper: Tokens
+    ) -> None:
+        """
+        Define constructor method for the BytesBackend class.
+
+        The automaton runs over the raw bytes of the source, and tokens are tracked by
+        their start and end offsets, so no string is built for every character. Tokens
+        with a fixed lexeme are looked up from their bytes, and the rest are decoded
+        only to be saved to a symbol table.
+
+        Every character past ASCII is an invalid character of the language, and so is
+        every byte of its UTF-8 encoding, so the automaton behaves the same on bytes as
+        on characters. Only strings and comments can hold them, in bodies that are
+        skipped without running the automaton.
+
+        Since the table backend reads blocks, skips bodies and slices lexemes by
+        offset too, both run at about the same speed, see
+        `benchmarks/scanner_backends.py`.
+
+        Args:
+            automaton (TransitionTable): Transition table of the scanner
+            dfa (CompiledDFA): Integer-coded automaton of the scanner
+            token_helper (Tokens): Token helper of the scanner
+
+        Properties:
+            dfa (CompiledDFA): Integer-coded automaton of the scanner
+            symbol_states (set): Accepting states whose tokens go to a symbol table
+            comment_state (int): Accepting state for comments
+            fixed (dict): Output entry of every token with a fixed lexeme, by bytes
+            unicode_bodies (bool): Whether non-ASCII characters can be scanned from
+                                   bytes, which needs all of them to be invalid
+        """
+        cls.dfa: CompiledDFA = dfa
+        cls.symbol_states: set = {
+            automaton.id_state,
+            automaton.int_state,
+            automaton.float_state,
+            automaton.str_state,
+            automaton.comment_state,
+        }
+        cls.comment_state: int = automaton.comment_state
+        cls.fixed: dict = {
+            lexeme.encode("ascii"): (token_id,)
+            for lexeme, token_id in token_helper.token_ids.items()
+            if not lexeme.isalnum() and lexeme != "$"
+        }
+        cls.unicode_bodies: bool = set(dfa.char_classes[128:]) == {dfa.invalid_class}
+
+    def tokens(cls, scanner: "Scanner") -> Iterator[tuple]:
+        """
+        Yield the tokens recognized in the bytes of a source.
+
+        Files are memory-mapped, so repeated scans are served from the page cache.
+        Sources with carriage returns are copied with their newlines normalized.
+        Strings and comments with non-ASCII characters are decoded from UTF-8 like
+        any other lexeme, and offsets are counted in characters, as in the other
+        backends.
+
+        Args:
+            scanner (Scanner): Scanner whose symbol tables and error messages are used
+
+        Raises:
+            ScanError: Raised with the same messages as the table-driven scanner
+
+        Yields:
+            tuple: Token identifier, followed by its symbol table entry if it has one
+        """
+        if scanner.path is None or scanner.path.stat().st_size == 0:
+            yield from cls.scan_buffer(scanner, scanner.read_source())
+            return
+
+        with scanner.path.open("rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield from cls.scan_buffer(scanner, buffer)
+
+    def scan_buffer(cls, scanner: "Scanner", buffer: bytes | mmap.mmap) -> Iterator:
+        """
+        Yield the tokens recognized in a buffer of bytes.
+
+        A multi-byte character only counts as one in the offsets of the tokens and
+        errors, so the bytes each one saves are subtracted from the later offsets.
+
+        Args:
+            scanner (Scanner): Scanner whose symbol tables and error messages are used
+            buffer (bytes | mmap.mmap): Bytes of the source
+
+        Raises:
+            ScanError: Raised with the same messages as the table-driven scanner
+
+        Yields:
+            tuple: Token identifier, followed by its symbol table entry if it has one
+        """
+        if not cls.unicode_bodies and NON_ASCII.search(buffer):
+            yield from scanner.table_tokens()
+            return
+        if buffer.find(b"\r") >= 0:
+            buffer = buffer[:].replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+        dfa = cls.dfa
+        flags = dfa.flags
+        transitions = dfa.transitions
+        char_classes = dfa.char_classes
+        num_classes = dfa.num_classes
+        blank = dfa.blank_class
+        symbol_states = cls.symbol_states
+        fixed = cls.fixed
+        comment_state = cls.comment_state
+        accept_token = scanner.accept_token
+        skip_body = scanner.skip_body
+        keep_comments = scanner.keep_comments
+        spans = scanner.spans
+        non_ascii = NON_ASCII.search
+        size = len(buffer)
+        pos = 0
+        # Bytes past the characters read so far
+        shift = 0
+
+        with memoryview(buffer) as view:
+            while True:
+                while pos < size and char_classes[view[pos]] == blank:
+                    pos += 1
+                if pos >= size:
+                    return
+
+                start = pos
+                state = 0
+                body = False
+                while True:
+                    char_class = char_classes[view[pos]] if pos < size else blank
+                    next_state = transitions[state * num_classes + char_class]
+                    if flags[next_state] & FINAL:
+                        break
+                    if pos >= size and flags[next_state] & INCOMPLETE:
+                        raise scanner.lexical_error(
+                            next_state, pos - shift, start - shift, str(view, "utf-8")
+                        )
+                    state = next_state
+                    pos += 1
+                    if flags[state] & BODY:
+                        body = True
+                        state, pos = skip_body(state, buffer, pos)
+                        if flags[state] & ACCEPTOR:
+                            # The closing delimiter is consumed below, like any
+                            # last character
+                            next_state = state
+                            pos -= 1
+                            break
+
+                if not flags[next_state] & ACCEPTOR:
+                    raise scanner.lexical_error(
+                        next_state, pos - shift, start - shift, str(view, "utf-8")
+                    )
+                if not flags[next_state] & CONSUMING:
+                    pos += 1
+
+                first = start - shift
+                if body and non_ascii(buffer, start, pos):
+                    shift += pos - start - len(str(buffer[start:pos], "utf-8"))
+                lexeme = view[start:pos]
+                if next_state == comment_state and not keep_comments:
+                    entry = None
+                elif next_state in symbol_states:
+                    entry = accept_token(next_state, str(lexeme, "utf-8"))
+                else:
+                    entry = fixed[lexeme]
+                lexeme.release()
+                if entry is not None:
+                    if spans:
+                        scanner.add_span(first, pos - shift)
+                    yield entry
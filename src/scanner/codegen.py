@@ -0,0 +1,366 @@
+import hashlib
+import re
+import types
+from pathlib import Path
+
+from .. import generated_module
+from .compiled_dfa import ACCEPTOR, CONSUMING, ERROR, INCOMPLETE, CompiledDFA
+from .tokens import Tokens
+from .transition_table import TransitionTable
+
+# Bump whenever the generated code changes, to force a regeneration
+GENERATOR_VERSION = 2
+MODULE_PATH = Path(__file__).with_name("direct_dfa.py")
+
+
+def source_hash(automaton: TransitionTable, token_helper: Tokens) -> str:
+    """
+    Hash the transition table, state lists and token identifiers the generated
+    scanner is built from.
+
+    Args:
+        automaton (TransitionTable): Transition table of the scanner
+        token_helper (Tokens): Token helper of the scanner
+
+    Returns:
+        str: Hexadecimal SHA-256 digest of every input of the generator
+    """
+    digest = hashlib.sha256(automaton.path.read_bytes())
+    for states in [
+        automaton.accepted,
+        automaton.error,
+        automaton.consuming,
+        automaton.active_states,
+        automaton.incomplete_comment,
+        [automaton.incomplete_string, GENERATOR_VERSION],
+        token_helper.token_ids,
+    ]:
+        digest.update(repr(states).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class DirectCodeGenerator:
+    """Custom class to generate a direct-coded scanner from the transition table."""
+
+    def __init__(cls, automaton: TransitionTable, token_helper: Tokens) -> None:
+        """
+        Define constructor method for the DirectCodeGenerator class.
+
+        Args:
+            automaton (TransitionTable): Transition table of the scanner
+            token_helper (Tokens): Token helper used to classify characters
+
+        Properties:
+            automaton (TransitionTable): Transition table of the scanner
+            token_helper (Tokens): Token helper used to classify characters
+            dfa (CompiledDFA): Integer-coded automaton of the scanner
+            symbol_states (list): Accepting states whose tokens go to a symbol table
+            class_chars (list): Characters of each character class, `None` for the
+                                invalid class, which holds every other character
+            constants (dict): Module level constants of the generated code
+            roots (list): States that need their own entry in the dispatch loop
+            lines (list): Lines of generated code
+        """
+        cls.automaton: TransitionTable = automaton
+        cls.token_helper: Tokens = token_helper
+        cls.dfa: CompiledDFA = CompiledDFA(automaton, token_helper)
+        cls.class_chars: list = []
+        for name in cls.dfa.classes:
+            if name == "letter":
+                cls.class_chars.append(sorted(token_helper.letters))
+            elif name == "digit":
+                cls.class_chars.append(sorted(token_helper.digits))
+            elif name == "blank":
+                cls.class_chars.append(sorted(char for char in token_helper.blank))
+            elif name == "invalid":
+                cls.class_chars.append(None)
+            else:
+                cls.class_chars.append([name])
+        cls.symbol_states: list = [
+            automaton.id_state,
+            automaton.int_state,
+            automaton.float_state,
+            automaton.str_state,
+            automaton.comment_state,
+        ]
+        cls.constants: dict = {}
+        cls.roots: list = []
+        cls.lines: list = []
+
+    def constant(cls, prefix: str, value: str) -> str:
+        """
+        Declare a module level constant of the generated code, reusing duplicates.
+
+        Args:
+            prefix (str): Prefix of the constant name
+            value (str): Python expression of the constant
+
+        Returns:
+            str: Name of the constant
+        """
+        for name, existing in cls.constants.items():
+            if existing == value:
+                return name
+        name = f"_{prefix}{len(cls.constants)}"
+        cls.constants[name] = value
+        return name
+
+    def emit(cls, depth: int, line: str) -> None:
+        """
+        Append a line of generated code.
+
+        Args:
+            depth (int): Indentation level of the line
+            line (str): Code of the line
+        """
+        cls.lines.append("    " * depth + line)
+
+    def next_state(cls, state: int, char_class: int) -> int:
+        """
+        Get the state reached from a state after reading a character class.
+
+        Args:
+            state (int): Current state
+            char_class (int): Class number of the character read
+
+        Returns:
+            int: Next state
+        """
+        return cls.dfa.transitions[state * cls.dfa.num_classes + char_class]
+
+    def generate(cls) -> str:
+        """
+        Generate the source code of the direct-coded scanner module.
+
+        Returns:
+            str: Source code of the module
+        """
+        cls.roots = [0]
+        body = []
+        generated = 0
+
+        # Every back edge of the automaton adds a new root to the dispatch loop
+        while generated < len(cls.roots):
+            state = cls.roots[generated]
+            cls.lines = []
+            keyword = "if" if generated == 0 else "elif"
+            cls.emit(2, f"{keyword} state == {state}:")
+            cls.emit_state(3, state, [state], "" if state == 0 else None)
+            body.extend(cls.lines)
+            generated += 1
+
+        header = [
+            '"""',
+            "Direct-coded scanner generated from data/transitions.csv.",
+            "",
+            "Do not edit, regenerate it with `python -m src.scanner.codegen`.",
+            '"""',
+            "import re",
+            "",
+            f'SOURCE_HASH = "{source_hash(cls.automaton, cls.token_helper)}"',
+            "",
+            *[f"{name} = {value}" for name, value in cls.constants.items()],
+            "",
+            "",
+            "def tokens(text, accept_token, error, span=None):",
+            "    size = len(text)",
+            "    pos = 0",
+            "    start = 0",
+            "    state = 0",
+            "    while True:",
+        ]
+        return "\n".join(header + body) + "\n"
+
+    def emit_state(
+        cls, depth: int, state: int, path: list, spelled: str | None
+    ) -> None:
+        """
+        Generate straight-line code for a state, nesting the states it leads to.
+
+        When the code starts, `pos` is the position of the next character to read.
+
+        Args:
+            depth (int): Indentation level of the code
+            state (int): State to generate code for
+            path (list): States nested so far, to detect back edges
+            spelled (str | None): Characters read so far in the token, if they are
+                                  the same for every way of reaching the state
+        """
+        dfa = cls.dfa
+        targets = {}
+        for char_class in range(dfa.num_classes):
+            target = cls.next_state(state, char_class)
+            targets.setdefault(target, []).append(char_class)
+
+        # Characters that stay in the state are skipped in a single regex call
+        loop = [c for c in targets.get(state, []) if cls.class_chars[c] is not None]
+        if state in targets:
+            loop_chars = [char for c in loop for char in cls.class_chars[c] if char]
+            if dfa.invalid_class in targets[state]:
+                exits = [
+                    char
+                    for c, chars in enumerate(cls.class_chars)
+                    if chars is not None and c not in targets[state]
+                    for char in chars
+                    if char
+                ]
+                pattern = f"[^{cls.char_set(exits)}]*"
+            else:
+                pattern = f"[{cls.char_set(loop_chars)}]*"
+            run = cls.constant("RUN", f"re.compile({pattern!r}).match")
+            cls.emit(depth, f"pos = {run}(text, pos).end()")
+
+        # End of input is read as a blank character
+        cls.emit(depth, "if pos >= size:")
+        eof_state = cls.next_state(state, dfa.blank_class)
+        if state == 0 and eof_state == 0:
+            cls.emit(depth + 1, "return")
+        else:
+            cls.emit_target(depth + 1, eof_state, path, spelled, None, eof=True)
+
+        cls.emit(depth, "char = text[pos]")
+        if state == 0:
+            cls.emit(depth, "start = pos")
+        # Characters that stay in the state were already skipped by the run
+        branches = [
+            (target, classes) for target, classes in targets.items() if target != state
+        ]
+        # The invalid class is the fallback branch, since it holds every other char
+        branches.sort(key=lambda branch: dfa.invalid_class in branch[1])
+        for number, (target, classes) in enumerate(branches):
+            chars = [
+                char
+                for c in classes
+                if cls.class_chars[c] is not None
+                for char in cls.class_chars[c]
+                if char
+            ]
+            if number == len(branches) - 1 and dfa.invalid_class in classes:
+                cls.emit(depth, "else:" if number else "if True:")
+            else:
+                keyword = "if" if number == 0 else "elif"
+                if len(chars) == 1:
+                    cls.emit(depth, f"{keyword} char == {chars[0]!r}:")
+                else:
+                    name = cls.constant("SET", f"frozenset({''.join(chars)!r})")
+                    cls.emit(depth, f"{keyword} char in {name}:")
+            char = chars[0] if len(chars) == 1 and spelled is not None else None
+            cls.emit_target(depth + 1, target, path, spelled, char)
+
+    def emit_target(
+        cls,
+        depth: int,
+        target: int,
+        path: list,
+        spelled: str | None,
+        char: str | None,
+        eof: bool = False,
+    ) -> None:
+        """
+        Generate the code that runs once the character at `pos` leads to a state.
+
+        Args:
+            depth (int): Indentation level of the code
+            target (int): State reached after reading the character
+            path (list): States nested so far, to detect back edges
+            spelled (str | None): Characters read before, if always the same
+            char (str | None): Character read, if it is always the same
+            eof (bool): Whether the character read is the end of input
+        """
+        flags = cls.dfa.flags[target]
+        index = "pos"
+
+        if flags & ACCEPTOR:
+            # Consuming states leave the character to be read again
+            consuming = flags & CONSUMING or eof
+            end = index if consuming else f"{index} + 1"
+            lexeme = spelled if consuming else cls.join(spelled, char)
+            token_ids = cls.token_helper.token_ids
+            if lexeme in token_ids and target not in cls.symbol_states:
+                # Tokens with a fixed lexeme are emitted as constants
+                entry = cls.constant("TOKEN", repr((token_ids[lexeme],)))
+                if end != "pos":
+                    cls.emit(depth, f"pos = {end}")
+                cls.emit(depth, "state = 0")
+                cls.emit(depth, "if span is not None:")
+                cls.emit(depth + 1, "span(start, pos)")
+                cls.emit(depth, f"yield {entry}")
+                cls.emit(depth, "continue")
+                return
+            cls.emit(depth, f"entry = accept_token({target}, text[start:{end}])")
+            if end != "pos":
+                cls.emit(depth, f"pos = {end}")
+            cls.emit(depth, "state = 0")
+            cls.emit(depth, "if entry is not None:")
+            cls.emit(depth + 1, "if span is not None:")
+            cls.emit(depth + 2, "span(start, pos)")
+            cls.emit(depth + 1, "yield entry")
+            cls.emit(depth, "continue")
+        elif flags & ERROR or (eof and flags & INCOMPLETE):
+            cls.emit(depth, f"raise error({target}, {index}, start)")
+        elif target in path:
+            if target not in cls.roots:
+                cls.roots.append(target)
+            cls.emit(depth, f"pos = {index} + 1")
+            cls.emit(depth, f"state = {target}")
+            cls.emit(depth, "continue")
+        else:
+            cls.emit(depth, f"pos = {index} + 1")
+            cls.emit_state(depth, target, [*path, target], cls.join(spelled, char))
+
+    def join(cls, spelled: str | None, char: str | None) -> str | None:
+        """
+        Append a known character to the known characters of a token.
+
+        Args:
+            spelled (str | None): Characters read before, if always the same
+            char (str | None): Character read, if always the same
+
+        Returns:
+            str | None: Characters read, or None if they are not always the same
+        """
+        if spelled is None or char is None:
+            return None
+        return spelled + char
+
+    def char_set(cls, chars: list) -> str:
+        """
+        Build the body of a regular expression character set.
+
+        Args:
+            chars (list): Characters of the set
+
+        Returns:
+            str: Escaped characters, to be wrapped in brackets
+        """
+        return "".join(re.escape(char) for char in sorted(set(chars)))
+
+
+def load_direct_scanner(
+    automaton: TransitionTable, token_helper: Tokens
+) -> types.ModuleType:
+    """
+    Load the direct-coded scanner, regenerating it if the transition table changed.
+
+    The generated module is saved next to this module, see `generated_module.load`.
+
+    Args:
+        automaton (TransitionTable): Transition table of the scanner
+        token_helper (Tokens): Token helper used to classify characters
+
+    Returns:
+        types.ModuleType: Module with a `tokens(text, accept_token, error, span)`
+                          generator
+    """
+    return generated_module.load(
+        f"{__package__}.direct_dfa",
+        MODULE_PATH,
+        source_hash(automaton, token_helper),
+        lambda: DirectCodeGenerator(automaton, token_helper).generate(),
+    )
+
+
+if __name__ == "__main__":
+    source = DirectCodeGenerator(TransitionTable(), Tokens()).generate()
+    MODULE_PATH.write_text(source, encoding="utf-8")
+    print(f"Direct-coded scanner generated at {MODULE_PATH}")
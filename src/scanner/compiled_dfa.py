@@ -0,0 +1,235 @@
+from array import array
+
+from .tokens import Tokens
+from .transition_table import TransitionTable
+
+# Bit flags describing each state of the automaton
+ACCEPTOR = 1
+ERROR = 2
+CONSUMING = 4
+ACTIVE = 8
+INCOMPLETE_COMMENT = 16
+INCOMPLETE_STRING = 32
+BODY = 64
+FINAL = ACCEPTOR | ERROR
+INCOMPLETE = INCOMPLETE_COMMENT | INCOMPLETE_STRING
+
+
+class CompiledDFA:
+    """Custom class for the integer-coded form of the Scanner's automaton."""
+
+    def __init__(cls, automaton: TransitionTable, token_helper: Tokens) -> None:
+        """
+        Define constructor method for the CompiledDFA class.
+
+        Args:
+            automaton (TransitionTable): Transition table to be compiled
+            token_helper (Tokens): Token helper used to classify characters
+
+        Properties:
+            classes (list): Character class names, in column order
+            num_classes (int): Number of character classes (columns)
+            num_states (int): Number of states, including final states without row
+            blank_class (int): Class number of blank characters and end of input
+            invalid_class (int): Class number of characters outside the language
+            char_classes (bytes): Class number of each of the first 256 characters
+            transitions (array): Flat matrix, next state is at
+                                 `state * num_classes + char_class`
+            flags (array): Bit flags of each state
+            token_ids (array): Token id of each accepting state of a fixed symbol,
+                               0 for every other state
+        """
+        cls.classes: list = list(automaton.keys)
+        cls.num_classes: int = len(cls.classes)
+        cls.num_states: int = (
+            max(len(automaton.table) - 1, *automaton.accepted, *automaton.error) + 1
+        )
+        cls.blank_class: int = cls.classes.index("blank")
+        cls.invalid_class: int = cls.classes.index("invalid")
+        cls.char_classes: bytes = bytes(
+            cls.classes.index(token_helper.identify_char(chr(code)))
+            for code in range(256)
+        )
+        cls.transitions: array = cls.compile_transitions(automaton)
+        cls.flags: array = cls.compile_flags(automaton)
+        cls.token_ids: array = cls.compile_token_ids(token_helper)
+
+    def compile_transitions(cls, automaton: TransitionTable) -> array:
+        """
+        Convert the rows of the transition table into a flat integer matrix.
+
+        Final states have no row in the table, so they transition to themselves.
+
+        Args:
+            automaton (TransitionTable): Transition table to be compiled
+
+        Returns:
+            array: Flat transition matrix, with one byte per entry
+        """
+        transitions = array("B")
+        for state in range(cls.num_states):
+            if state < len(automaton.table):
+                row = automaton.table[state]
+                transitions.extend(int(row[key]) for key in cls.classes)
+            else:
+                transitions.extend([state] * cls.num_classes)
+        return transitions
+
+    def compile_flags(cls, automaton: TransitionTable) -> array:
+        """
+        Combine every state predicate of the transition table into a flags byte.
+
+        Incomplete states that loop on blanks are marked as the body of a string or
+        comment, which only its closing delimiter can leave.
+
+        Args:
+            automaton (TransitionTable): Transition table to be compiled
+
+        Returns:
+            array: Flags byte of each state
+        """
+        predicates = [
+            (ACCEPTOR, automaton.is_acceptor_state),
+            (ERROR, automaton.is_error_state),
+            (CONSUMING, automaton.is_consuming_state),
+            (ACTIVE, automaton.is_active_state),
+            (INCOMPLETE_COMMENT, automaton.is_incomplete_comment),
+            (INCOMPLETE_STRING, automaton.is_incomplete_string),
+        ]
+        flags = array(
+            "B",
+            (
+                sum(flag for flag, predicate in predicates if predicate(state))
+                for state in range(cls.num_states)
+            ),
+        )
+        for state in range(cls.num_states):
+            loop = cls.transitions[state * cls.num_classes + cls.blank_class]
+            if flags[state] & INCOMPLETE and loop == state:
+                flags[state] |= BODY
+        return flags
+
+    def compile_token_ids(cls, token_helper: Tokens) -> array:
+        """
+        Find the accepting state of every fixed symbol, to map it to its token id.
+
+        Each symbol is run through the automaton followed by a blank, until a final
+        state is reached, so symbols that need a lookahead are accepted as well.
+
+        Args:
+            token_helper (Tokens): Token helper with the ids of the symbols
+
+        Returns:
+            array: Token id byte of each state
+        """
+        token_ids = array("B", bytes(cls.num_states))
+        symbols = [*token_helper.special_characters, *token_helper.complex_characters]
+        for symbol in symbols:
+            state = 0
+            for char in symbol + " ":
+                state = cls.step(state, char)
+                if cls.flags[state] & FINAL:
+                    break
+            if cls.flags[state] & ACCEPTOR:
+                token_ids[state] = token_helper.token_ids[symbol]
+        return token_ids
+
+    def char_class(cls, char: str) -> int:
+        """
+        Get the class number of a character, end of input ("") being blank.
+
+        Args:
+            char (str): Character to classify
+
+        Returns:
+            int: Class number of the character
+        """
+        if not char:
+            return cls.blank_class
+        code = ord(char)
+        return cls.char_classes[code] if code < 256 else cls.invalid_class
+
+    def step(cls, state: int, char: str) -> int:
+        """
+        Get the state reached from a state after reading a character.
+
+        Args:
+            state (int): Current state
+            char (str): Character read
+
+        Returns:
+            int: Next state
+        """
+        return cls.transitions[state * cls.num_classes + cls.char_class(char)]
+
+    def is_acceptor_state(cls, state: int) -> bool:
+        """
+        Check if state is acceptor.
+
+        Args:
+            state (int): State to be checked
+
+        Returns:
+            bool: Boolean stating whether state is acceptor or not
+        """
+        return bool(cls.flags[state] & ACCEPTOR)
+
+    def is_error_state(cls, state: int) -> bool:
+        """
+        Check if state is error.
+
+        Args:
+            state (int): State to be checked
+
+        Returns:
+            bool: Boolean stating whether state is error or not
+        """
+        return bool(cls.flags[state] & ERROR)
+
+    def is_consuming_state(cls, state: int) -> bool:
+        """
+        Check if state is consuming.
+
+        Args:
+            state (int): State to be checked
+
+        Returns:
+            bool: Boolean stating whether state is consuming or not
+        """
+        return bool(cls.flags[state] & CONSUMING)
+
+    def is_active_state(cls, state: int) -> bool:
+        """
+        Check if state is active.
+
+        Args:
+            state (int): State to be checked
+
+        Returns:
+            bool: Boolean stating whether state is active or not
+        """
+        return bool(cls.flags[state] & ACTIVE)
+
+    def is_incomplete_comment(cls, state: int) -> bool:
+        """
+        Check if state is part of incomplete comments.
+
+        Args:
+            state (int): State to be checked
+
+        Returns:
+            bool: Boolean stating whether state is an incomplete comment or not
+        """
+        return bool(cls.flags[state] & INCOMPLETE_COMMENT)
+
+    def is_incomplete_string(cls, state: int) -> bool:
+        """
+        Check if state is part of incomplete strings.
+
+        Args:
+            state (int): State to be checked
+
+        Returns:
+            bool: Boolean stating whether state is an incomplete string or not
+        """
+        return bool(cls.flags[state] & INCOMPLETE_STRING)
@@ -0,0 +1,395 @@
+"""
+Direct-coded scanner generated from data/transitions.csv.
+
+Do not edit, regenerate it with `python -m src.scanner.codegen`.
+"""
+import re
+
+SOURCE_HASH = "42f9292bcb1d5f7fafe077714a7509ca0a01bff53b2207386c0c5853e7de2410"
+
+_RUN0 = re.compile('[\\\t\\\n\\\r\\ ]*').match
+_SET1 = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz')
+_RUN2 = re.compile('[0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz]*').match
+_SET3 = frozenset('\t\n\r +-*/<>=!;,()[]{}')
+_SET4 = frozenset('."')
+_SET5 = frozenset('0123456789')
+_RUN6 = re.compile('[0123456789]*').match
+_SET7 = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"')
+_SET8 = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz\t\n\r +-*/<>=!;,."()[]{}')
+_SET9 = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz."')
+_TOKEN10 = (12,)
+_TOKEN11 = (13,)
+_TOKEN12 = (14,)
+_TOKEN13 = (15,)
+_SET14 = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789\t\n\r ([{')
+_SET15 = frozenset('+-/<>=!;,.")]}')
+_RUN16 = re.compile('[^\\*]*').match
+_TOKEN17 = (16,)
+_SET18 = frozenset('+-*/<>!;,.")]}')
+_TOKEN19 = (30,)
+_TOKEN20 = (17,)
+_TOKEN21 = (31,)
+_TOKEN22 = (18,)
+_TOKEN23 = (32,)
+_SET24 = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789\t\n\r +-*/<>!;,."()[]{}')
+_TOKEN25 = (33,)
+_TOKEN26 = (20,)
+_TOKEN27 = (21,)
+_RUN28 = re.compile('[^"]*').match
+_TOKEN29 = (24,)
+_TOKEN30 = (25,)
+_TOKEN31 = (26,)
+_TOKEN32 = (27,)
+_TOKEN33 = (28,)
+_TOKEN34 = (29,)
+
+
+def tokens(text, accept_token, error, span=None):
+    size = len(text)
+    pos = 0
+    start = 0
+    state = 0
+    while True:
+        if state == 0:
+            pos = _RUN0(text, pos).end()
+            if pos >= size:
+                return
+            char = text[pos]
+            start = pos
+            if char in _SET1:
+                pos = pos + 1
+                pos = _RUN2(text, pos).end()
+                if pos >= size:
+                    entry = accept_token(13, text[start:pos])
+                    state = 0
+                    if entry is not None:
+                        if span is not None:
+                            span(start, pos)
+                        yield entry
+                    continue
+                char = text[pos]
+                if char in _SET3:
+                    entry = accept_token(13, text[start:pos])
+                    state = 0
+                    if entry is not None:
+                        if span is not None:
+                            span(start, pos)
+                        yield entry
+                    continue
+                elif char in _SET4:
+                    raise error(37, pos, start)
+                else:
+                    raise error(40, pos, start)
+            elif char in _SET5:
+                pos = pos + 1
+                pos = _RUN6(text, pos).end()
+                if pos >= size:
+                    entry = accept_token(14, text[start:pos])
+                    state = 0
+                    if entry is not None:
+                        if span is not None:
+                            span(start, pos)
+                        yield entry
+                    continue
+                char = text[pos]
+                if char in _SET7:
+                    raise error(38, pos, start)
+                elif char in _SET3:
+                    entry = accept_token(14, text[start:pos])
+                    state = 0
+                    if entry is not None:
+                        if span is not None:
+                            span(start, pos)
+                        yield entry
+                    continue
+                elif char == '.':
+                    pos = pos + 1
+                    if pos >= size:
+                        raise error(38, pos, start)
+                    char = text[pos]
+                    if char in _SET8:
+                        raise error(38, pos, start)
+                    elif char in _SET5:
+                        pos = pos + 1
+                        pos = _RUN6(text, pos).end()
+                        if pos >= size:
+                            entry = accept_token(15, text[start:pos])
+                            state = 0
+                            if entry is not None:
+                                if span is not None:
+                                    span(start, pos)
+                                yield entry
+                            continue
+                        char = text[pos]
+                        if char in _SET9:
+                            raise error(38, pos, start)
+                        elif char in _SET3:
+                            entry = accept_token(15, text[start:pos])
+                            state = 0
+                            if entry is not None:
+                                if span is not None:
+                                    span(start, pos)
+                                yield entry
+                            continue
+                        else:
+                            raise error(40, pos, start)
+                    else:
+                        raise error(40, pos, start)
+                else:
+                    raise error(40, pos, start)
+            elif char == '+':
+                pos = pos + 1
+                state = 0
+                if span is not None:
+                    span(start, pos)
+                yield _TOKEN10
+                continue
+            elif char == '-':
+                pos = pos + 1
+                state = 0
+                if span is not None:
+                    span(start, pos)
+                yield _TOKEN11
+                continue
+            elif char == '*':
+                pos = pos + 1
+                state = 0
+                if span is not None:
+                    span(start, pos)
+                yield _TOKEN12
+                continue
+            elif char == '/':
+                pos = pos + 1
+                if pos >= size:
+                    state = 0
+                    if span is not None:
+                        span(start, pos)
+                    yield _TOKEN13
+                    continue
+                char = text[pos]
+                if char in _SET14:
+                    state = 0
+                    if span is not None:
+                        span(start, pos)
+                    yield _TOKEN13
+                    continue
+                elif char in _SET15:
+                    raise error(41, pos, start)
+                elif char == '*':
+                    pos = pos + 1
+                    pos = _RUN16(text, pos).end()
+                    if pos >= size:
+                        raise error(7, pos, start)
+                    char = text[pos]
+                    if char == '*':
+                        pos = pos + 1
+                        if pos >= size:
+                            raise error(7, pos, start)
+                        char = text[pos]
+                        if char == '/':
+                            entry = accept_token(17, text[start:pos + 1])
+                            pos = pos + 1
+                            state = 0
+                            if entry is not None:
+                                if span is not None:
+                                    span(start, pos)
+                                yield entry
+                            continue
+                        else:
+                            pos = pos + 1
+                            state = 7
+                            continue
+                else:
+                    raise error(40, pos, start)
+            elif char == '<':
+                pos = pos + 1
+                if pos >= size:
+                    state = 0
+                    if span is not None:
+                        span(start, pos)
+                    yield _TOKEN17
+                    continue
+                char = text[pos]
+                if char in _SET14:
+                    state = 0
+                    if span is not None:
+                        span(start, pos)
+                    yield _TOKEN17
+                    continue
+                elif char in _SET18:
+                    raise error(41, pos, start)
+                elif char == '=':
+                    pos = pos + 1
+                    state = 0
+                    if span is not None:
+                        span(start, pos)
+                    yield _TOKEN19
+                    continue
+                else:
+                    raise error(40, pos, start)
+            elif char == '>':
+                pos = pos + 1
+                if pos >= size:
+                    state = 0
+                    if span is not None:
+                        span(start, pos)
+                    yield _TOKEN20
+                    continue
+                char = text[pos]
+                if char in _SET14:
+                    state = 0
+                    if span is not None:
+                        span(start, pos)
+                    yield _TOKEN20
+                    continue
+                elif char in _SET18:
+                    raise error(41, pos, start)
+                elif char == '=':
+                    pos = pos + 1
+                    state = 0
+                    if span is not None:
+                        span(start, pos)
+                    yield _TOKEN21
+                    continue
+                else:
+                    raise error(40, pos, start)
+            elif char == '=':
+                pos = pos + 1
+                if pos >= size:
+                    state = 0
+                    if span is not None:
+                        span(start, pos)
+                    yield _TOKEN22
+                    continue
+                char = text[pos]
+                if char in _SET14:
+                    state = 0
+                    if span is not None:
+                        span(start, pos)
+                    yield _TOKEN22
+                    continue
+                elif char in _SET18:
+                    raise error(41, pos, start)
+                elif char == '=':
+                    pos = pos + 1
+                    state = 0
+                    if span is not None:
+                        span(start, pos)
+                    yield _TOKEN23
+                    continue
+                else:
+                    raise error(40, pos, start)
+            elif char == '!':
+                pos = pos + 1
+                if pos >= size:
+                    raise error(39, pos, start)
+                char = text[pos]
+                if char in _SET24:
+                    raise error(39, pos, start)
+                elif char == '=':
+                    pos = pos + 1
+                    state = 0
+                    if span is not None:
+                        span(start, pos)
+                    yield _TOKEN25
+                    continue
+                else:
+                    raise error(40, pos, start)
+            elif char == ';':
+                pos = pos + 1
+                state = 0
+                if span is not None:
+                    span(start, pos)
+                yield _TOKEN26
+                continue
+            elif char == ',':
+                pos = pos + 1
+                state = 0
+                if span is not None:
+                    span(start, pos)
+                yield _TOKEN27
+                continue
+            elif char == '.':
+                raise error(37, pos, start)
+            elif char == '"':
+                pos = pos + 1
+                pos = _RUN28(text, pos).end()
+                if pos >= size:
+                    raise error(5, pos, start)
+                char = text[pos]
+                if char == '"':
+                    entry = accept_token(18, text[start:pos + 1])
+                    pos = pos + 1
+                    state = 0
+                    if entry is not None:
+                        if span is not None:
+                            span(start, pos)
+                        yield entry
+                    continue
+            elif char == '(':
+                pos = pos + 1
+                state = 0
+                if span is not None:
+                    span(start, pos)
+                yield _TOKEN29
+                continue
+            elif char == ')':
+                pos = pos + 1
+                state = 0
+                if span is not None:
+                    span(start, pos)
+                yield _TOKEN30
+                continue
+            elif char == '[':
+                pos = pos + 1
+                state = 0
+                if span is not None:
+                    span(start, pos)
+                yield _TOKEN31
+                continue
+            elif char == ']':
+                pos = pos + 1
+                state = 0
+                if span is not None:
+                    span(start, pos)
+                yield _TOKEN32
+                continue
+            elif char == '{':
+                pos = pos + 1
+                state = 0
+                if span is not None:
+                    span(start, pos)
+                yield _TOKEN33
+                continue
+            elif char == '}':
+                pos = pos + 1
+                state = 0
+                if span is not None:
+                    span(start, pos)
+                yield _TOKEN34
+                continue
+            else:
+                raise error(40, pos, start)
+        elif state == 7:
+            pos = _RUN16(text, pos).end()
+            if pos >= size:
+                raise error(7, pos, start)
+            char = text[pos]
+            if char == '*':
+                pos = pos + 1
+                if pos >= size:
+                    raise error(7, pos, start)
+                char = text[pos]
+                if char == '/':
+                    entry = accept_token(17, text[start:pos + 1])
+                    pos = pos + 1
+                    state = 0
+                    if entry is not None:
+                        if span is not None:
+                            span(start, pos)
+                        yield entry
+                    continue
+                else:
+                    pos = pos + 1
+                    state = 7
+                    continue
@@ -0,0 +1,41 @@
+class ScanError(Exception):
+    """Custom class for the lexical errors raised by the Scanner."""
+
+    def __init__(cls, message: str, line: int, column: int, offset: int) -> None:
+        """
+        Define constructor method for the ScanError class.
+
+        Args:
+            message (str): Error message
+            line (int): Line of the error, starting at 1
+            column (int): Column of the error, starting at 1
+            offset (int): Character offset of the error in the source
+
+        Properties:
+            line (int): Line of the error, starting at 1
+            column (int): Column of the error, starting at 1
+            offset (int): Character offset of the error in the source
+        """
+        super().__init__(message)
+        cls.line: int = line
+        cls.column: int = column
+        cls.offset: int = offset
+
+    @property
+    def location(cls) -> str:
+        """
+        Position of the error, to be shown next to its message.
+
+        Returns:
+            str: Line and column of the error, as `line:column`
+        """
+        return f"{cls.line}:{cls.column}"
+
+    def __reduce__(cls) -> tuple:
+        """
+        Pickle the error with its position, so it can cross process boundaries.
+
+        Returns:
+            tuple: Class and constructor arguments of the error
+        """
+        return (type(cls), (str(cls), cls.line, cls.column, cls.offset))
@@ -0,0 +1,435 @@
+import os
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
+
+from .compiled_dfa import ACCEPTOR, BODY, CONSUMING, FINAL, INCOMPLETE
+from .scanner import Scanner
+from .symbol_table import SymbolTable
+
+
+class IncrementalScanner(Scanner):
+    """Custom class for a Scanner that rescans only the edited part of a source."""
+
+    def __init__(
+        cls, filename: str | os.PathLike = "<source>", source: str | None = None
+    ) -> None:
+        """
+        Define constructor method for the IncrementalScanner class.
+
+        Every token, comments included, is kept as a record of its token identifier
+        and the lexeme it saves to a symbol table, if any. At the start of every line
+        a checkpoint saves the state of the automaton (0 between tokens, or the string
+        or comment state when the line is inside one of them) and the number of
+        records and output tokens before it, so an edit is rescanned from the last
+        checkpoint between tokens.
+
+        Args:
+            filename (str | os.PathLike): Filename or path of the file to be analyzed
+            source (str | None): Source code to be analyzed instead of a file
+
+        Properties:
+            text (str): Current source code, with every edit applied
+            records (list[tuple]): Token identifier, or None for comments, and
+                                   symbol table lexeme of every token
+            offsets (list[int]): Offset of the start of every line
+            states (list[int]): State of the automaton at the start of every line
+            record_counts (list[int]): Number of records before every line
+            token_counts (list[int]): Number of output tokens before every line
+            first_records (list[list[int]]): Record of the first occurrence of every
+                                             entry, for each symbol table
+            stale (bool): Whether the last scan failed and checkpoints are unusable
+        """
+        super().__init__(filename, source=source)
+        cls.text: str = ""
+        cls.records: list = []
+        cls.offsets: list = [0]
+        cls.states: list = [0]
+        cls.record_counts: list = [0]
+        cls.token_counts: list = [0]
+        cls.first_records: list = [[] for _ in range(5)]
+        cls.stale: bool = True
+
+    @property
+    def symbol_tables(cls) -> tuple:
+        """
+        Symbol tables in the same order as the `scan` results.
+
+        Returns:
+            tuple[SymbolTable, ...]: Identifier, integer, float, string and comment
+                                     symbol tables
+        """
+        return (
+            cls.id_symbol_table,
+            cls.int_symbol_table,
+            cls.float_symbol_table,
+            cls.string_symbol_table,
+            cls.comment_symbol_table,
+        )
+
+    def symbol(cls, state: int, token: str) -> tuple | None:
+        """
+        Find the symbol table entry that an accepted token is saved to.
+
+        Args:
+            state (int): Final accepting state reached by the token
+            token (str): Characters of the token
+
+        Returns:
+            tuple | None: Position of the symbol table in `symbol_tables` and the
+                          lexeme saved to it, or None if the token is not saved
+        """
+        automaton = cls.automaton
+        if automaton.is_identifier(state):
+            if token in cls.token_helper.keyword_ids:
+                return None
+            return (0, token)
+        elif automaton.is_integer(state):
+            return (1, int(token))
+        elif automaton.is_float(state):
+            return (2, float(token))
+        elif automaton.is_string(state):
+            return (3, token)
+        elif automaton.is_comment(state):
+            return (4, token)
+        return None
+
+    def record(cls, state: int, token: str) -> tuple:
+        """
+        Build the record of an accepted token.
+
+        Args:
+            state (int): Final accepting state reached by the token
+            token (str): Characters of the token
+
+        Returns:
+            tuple: Token identifier, or None for comments, and the position of the
+                   symbol table and lexeme saved to it, or None if not saved
+        """
+        symbol = cls.symbol(state, token)
+        if symbol is None:
+            return (cls.accept_token(state, token)[0], None)
+        table, _ = symbol
+        names = ["ID", "INTEGER", "FLOAT", "STRING"]
+        kind = cls.token_helper.token_ids[names[table]] if table < 4 else None
+        return (kind, symbol)
+
+    def scan(cls) -> tuple:
+        """
+        Scan the whole source file, saving the records and line checkpoints.
+
+        Raises
+            Exception: Raised if the source file has a lexical error
+
+        Returns
+            tuple[list, SymbolTable, ...]: Tuple with output and all symbol tables
+
+        """
+        cls.text = cls.read_text()
+        cls.stale = True
+        return cls.rescan()
+
+    def edit(cls, start: int, end: int, text: str) -> tuple:
+        """
+        Replace part of the source and rescan only the tokens that may change.
+
+        The rescan starts at the last checkpoint between tokens before the edit, and
+        stops at the first line start after it that is between tokens in both the old
+        and the new source. Tokens in between are patched in the output, and symbol
+        tables are renumbered only when the first occurrence of an entry changes, so
+        results always match a scan of the whole edited source.
+
+        Args:
+            start (int): Offset of the first replaced character
+            end (int): Offset right after the last replaced character
+            text (str): Characters inserted in place of the replaced ones
+
+        Raises:
+            Exception: Raised if the edited source has a lexical error
+
+        Returns:
+            tuple[list, SymbolTable, ...]: Tuple with output and all symbol tables
+
+        """
+        old_text = cls.text
+        new_text = old_text[:start] + text + old_text[end:]
+        delta = len(new_text) - len(old_text)
+        cls.text = new_text
+
+        if cls.stale:
+            return cls.rescan()
+
+        # Restart at the last line start between tokens at or before the edit
+        restart = bisect_right(cls.offsets, start) - 1
+        while cls.states[restart] != 0:
+            restart -= 1
+
+        offsets = cls.offsets
+        states = cls.states
+        edit_end = start + len(text)
+
+        def resync(offset: int) -> int | None:
+            if offset < edit_end:
+                return None
+            old = bisect_left(offsets, offset - delta)
+            if old < len(offsets) and offsets[old] == offset - delta:
+                return old if states[old] == 0 else None
+            return None
+
+        try:
+            records, checkpoints, stop = cls.scan_records(
+                new_text, offsets[restart], resync
+            )
+        except Exception:
+            cls.stale = True
+            raise
+
+        cls.patch(restart, records, checkpoints, stop, delta)
+        return (cls.output, *cls.symbol_tables)
+
+    def rescan(cls) -> tuple:
+        """
+        Scan the whole current source again, after a failed scan.
+
+        Raises
+            Exception: Raised if the source has a lexical error
+
+        Returns
+            tuple[list, SymbolTable, ...]: Tuple with output and all symbol tables
+
+        """
+        records, checkpoints, _ = cls.scan_records(cls.text, 0)
+        cls.records = records
+        cls.offsets, cls.states, cls.record_counts, cls.token_counts = (
+            list(column) for column in zip((0, 0, 0, 0), *checkpoints)
+        )
+        cls.renumber()
+        cls.stale = False
+        return (cls.output, *cls.symbol_tables)
+
+    def patch(
+        cls,
+        restart: int,
+        records: list,
+        checkpoints: list,
+        stop: int | None,
+        delta: int,
+    ) -> None:
+        """
+        Replace the rescanned records, checkpoints and output tokens.
+
+        Args:
+            restart (int): Checkpoint where the rescan started
+            records (list[tuple]): Records found by the rescan
+            checkpoints (list[tuple]): Checkpoints found by the rescan, relative to it
+            stop (int | None): Old checkpoint where the rescan met the old source
+                               again, or None if it reached the end of the source
+            delta (int): Change of length of the source
+        """
+        first = cls.record_counts[restart]
+        first_token = cls.token_counts[restart]
+        if stop is None:
+            last = len(cls.records)
+            last_token = len(cls.output)
+        else:
+            last = cls.record_counts[stop]
+            last_token = cls.token_counts[stop]
+
+        removed = cls.records[first:last]
+        cls.records[first:last] = records
+        record_delta = len(records) - len(removed)
+        tokens = sum(kind is not None for kind, _ in records)
+        token_delta = tokens - (last_token - first_token)
+
+        # Checkpoints of the rescan, then the old ones after it shifted
+        new_offsets = [offset for offset, *_ in checkpoints]
+        new_states = [state for _, state, *_ in checkpoints]
+        new_records = [first + count for _, _, count, _ in checkpoints]
+        new_tokens = [first_token + count for *_, count in checkpoints]
+        tail = slice(len(cls.offsets) if stop is None else stop + 1, None)
+        new_offsets += [offset + delta for offset in cls.offsets[tail]]
+        new_states += cls.states[tail]
+        new_records += [count + record_delta for count in cls.record_counts[tail]]
+        new_tokens += [count + token_delta for count in cls.token_counts[tail]]
+        keep = slice(None, restart + 1)
+        cls.offsets = cls.offsets[keep] + new_offsets
+        cls.states = cls.states[keep] + new_states
+        cls.record_counts = cls.record_counts[keep] + new_records
+        cls.token_counts = cls.token_counts[keep] + new_tokens
+
+        if cls.needs_renumber(first, removed, records):
+            cls.renumber()
+            return
+
+        # Entries are unchanged, only the tokens of the rescan are replaced
+        tables = cls.symbol_tables
+        output = []
+        for kind, symbol in records:
+            if symbol is None:
+                output.append((kind,))
+            elif kind is not None:
+                table, lexeme = symbol
+                output.append((kind, tables[table].index(lexeme)))
+        cls.output[first_token:last_token] = output
+
+        for first_records in cls.first_records:
+            for idx, record in enumerate(first_records):
+                if record >= last:
+                    first_records[idx] = record + record_delta
+        for table, idx, record in cls.segment_entries(first, records):
+            cls.first_records[table][idx - 1] = first + record
+
+    def segment_entries(cls, first: int, records: list) -> list:
+        """
+        List the entries whose first occurrence is in a segment of records.
+
+        Args:
+            first (int): Record where the segment starts
+            records (list[tuple]): Records of the segment
+
+        Returns:
+            list[tuple]: Symbol table position, entry number or None for lexemes not
+                         saved yet, and record in the segment, in order of occurrence
+        """
+        tables = cls.symbol_tables
+        entries = []
+        seen = set()
+        for record, (_, symbol) in enumerate(records):
+            if symbol is None or symbol in seen:
+                continue
+            table, lexeme = symbol
+            idx = tables[table].index(lexeme)
+            if idx is None or cls.first_records[table][idx - 1] >= first:
+                seen.add(symbol)
+                entries.append((table, idx, record))
+        return entries
+
+    def needs_renumber(cls, first: int, removed: list, records: list) -> bool:
+        """
+        Check if an edit changes the order of the first occurrences of the entries.
+
+        Entries first seen before the edit keep their number, so numbering only
+        changes if the replaced and inserted records introduce different entries, or
+        the same entries in a different order.
+
+        Args:
+            first (int): Record where the replaced records start
+            removed (list[tuple]): Records replaced by the edit
+            records (list[tuple]): Records inserted by the edit
+
+        Returns:
+            bool: Whether symbol tables have to be numbered again
+        """
+        old = [entry[:2] for entry in cls.segment_entries(first, removed)]
+        new = [entry[:2] for entry in cls.segment_entries(first, records)]
+        return old != new
+
+    def renumber(cls) -> None:
+        """Rebuild the output and symbol tables from the records, in source order."""
+        cls.id_symbol_table = SymbolTable()
+        cls.int_symbol_table = SymbolTable()
+        cls.float_symbol_table = SymbolTable()
+        cls.string_symbol_table = SymbolTable()
+        cls.comment_symbol_table = SymbolTable()
+        tables = cls.symbol_tables
+        first_records = [[] for _ in tables]
+
+        output = []
+        for record, (kind, symbol) in enumerate(cls.records):
+            if symbol is None:
+                output.append((kind,))
+                continue
+            table, lexeme = symbol
+            idx = tables[table].add(lexeme)
+            if idx > len(first_records[table]):
+                first_records[table].append(record)
+            if kind is not None:
+                output.append((kind, idx))
+
+        cls.output[:] = output
+        cls.first_records = first_records
+
+    def scan_records(
+        cls, text: str, pos: int, resync: Callable | None = None
+    ) -> tuple:
+        """
+        Recognize tokens from an offset of a source, saving line checkpoints.
+
+        Args:
+            text (str): Source code to be scanned
+            pos (int): Offset of a line start between tokens where scanning starts
+            resync (Callable | None): Function called with every later line start
+                                      between tokens, returning the old checkpoint
+                                      matching it, which stops the scan
+
+        Raises:
+            ScanError: Raised with the same messages as the table-driven scanner
+
+        Returns:
+            tuple: Records, checkpoints as tuples of offset, state, and records and
+                   output tokens before them, and the old checkpoint that stopped the
+                   scan, or None if it reached the end of the source
+        """
+        dfa = cls.dfa
+        transitions = dfa.transitions
+        flags = dfa.flags
+        char_classes = dfa.char_classes
+        num_classes = dfa.num_classes
+        blank = dfa.blank_class
+        invalid = dfa.invalid_class
+        size = len(text)
+        records = []
+        checkpoints = []
+        tokens = 0
+
+        def char_class(char: str) -> int:
+            code = ord(char)
+            return char_classes[code] if code < 256 else invalid
+
+        while True:
+            # Skip blanks, saving a checkpoint after every newline
+            while pos < size and char_class(text[pos]) == blank:
+                pos += 1
+                if text[pos - 1] == "\n":
+                    checkpoints.append((pos, 0, len(records), tokens))
+                    stop = resync(pos) if resync else None
+                    if stop is not None:
+                        return records, checkpoints, stop
+            if pos >= size:
+                return records, checkpoints, None
+
+            start = pos
+            state = 0
+            while True:
+                next_class = char_class(text[pos]) if pos < size else blank
+                next_state = transitions[state * num_classes + next_class]
+                if flags[next_state] & FINAL:
+                    break
+                if pos >= size and flags[next_state] & INCOMPLETE:
+                    raise cls.lexical_error(next_state, pos, start, text)
+                state = next_state
+                pos += 1
+                if text[pos - 1] == "\n":
+                    # Line starts inside strings and comments keep their state
+                    checkpoints.append((pos, state, len(records), tokens))
+                if flags[state] & BODY:
+                    # Newlines of a body are counted at once, and all keep its state
+                    body = state
+                    next_state, end = cls.skip_body(body, text, pos)
+                    newline = text.find("\n", pos, end)
+                    while newline >= 0:
+                        checkpoints.append((newline + 1, body, len(records), tokens))
+                        newline = text.find("\n", newline + 1, end)
+                    if flags[next_state] & ACCEPTOR:
+                        pos = end - 1
+                        break
+                    state = next_state
+                    pos = end
+
+            if not flags[next_state] & ACCEPTOR:
+                raise cls.lexical_error(next_state, pos, start, text)
+            if not flags[next_state] & CONSUMING:
+                pos += 1
+            record = cls.record(next_state, text[start:pos])
+            records.append(record)
+            if record[0] is not None:
+                tokens += 1
@@ -0,0 +1,61 @@
+from array import array
+from bisect import bisect_right
+
+
+class LineIndex:
+    """Custom class for the offsets of the line starts of a source."""
+
+    __slots__ = ("starts",)
+
+    def __init__(cls, text: str) -> None:
+        """
+        Define constructor method for the LineIndex class.
+
+        Newlines are found with `str.find`, so building the index costs a single pass
+        in C over the text, and lines and columns are then resolved with `bisect`.
+
+        Args:
+            text (str): Source code to be indexed
+
+        Properties:
+            starts (array): Offset of the first character of every line
+        """
+        cls.starts: array = array("I", [0])
+        newline = text.find("\n")
+        while newline >= 0:
+            cls.starts.append(newline + 1)
+            newline = text.find("\n", newline + 1)
+
+    def line(cls, offset: int) -> int:
+        """
+        Find the line of a character offset.
+
+        Args:
+            offset (int): Offset of the character
+
+        Returns:
+            int: Line number of the character, starting at 1
+        """
+        return bisect_right(cls.starts, offset)
+
+    def locate(cls, offset: int) -> tuple:
+        """
+        Find the line and column of a character offset.
+
+        Args:
+            offset (int): Offset of the character
+
+        Returns:
+            tuple[int, int]: Line and column numbers of the character, starting at 1
+        """
+        line = bisect_right(cls.starts, offset)
+        return (line, offset - cls.starts[line - 1] + 1)
+
+    def __len__(cls) -> int:
+        """
+        Count the lines of the source.
+
+        Returns:
+            int: Number of lines
+        """
+        return len(cls.starts)
@@ -0,0 +1,294 @@
+import json
+import random
+import sys
+import timeit
+from array import array
+from collections import Counter
+from pathlib import Path
+
+from .transition_table import TransitionTable
+
+PACKED_PATH = Path.cwd().joinpath("data", "transitions_packed.json")
+
+# State lists of the transition table, saved along the packed rows
+STATE_LISTS = [
+    "accepted",
+    "error",
+    "consuming",
+    "active_states",
+    "incomplete_comment",
+]
+STATE_NUMBERS = [
+    "incomplete_string",
+    "id_state",
+    "int_state",
+    "float_state",
+    "str_state",
+    "comment_state",
+]
+
+
+class TableCompressor:
+    """Custom class to minimize the scanner automaton and pack its transitions."""
+
+    def __init__(cls, automaton: TransitionTable) -> None:
+        """
+        Define constructor method for the TableCompressor class.
+
+        Final states have no row in the transition table, so they are completed with
+        transitions to themselves, like in the compiled automaton.
+
+        Args:
+            automaton (TransitionTable): Transition table to be compressed
+
+        Properties:
+            automaton (TransitionTable): Transition table to be compressed
+            keys (list): Character class names, in column order
+            num_states (int): Number of states, including final states without row
+            delta (list): Next state of every state for every character class
+        """
+        cls.automaton: TransitionTable = automaton
+        cls.keys: list = list(automaton.keys)
+        cls.num_states: int = (
+            max(len(automaton.table) - 1, *automaton.accepted, *automaton.error) + 1
+        )
+        cls.delta: list = [
+            (
+                [int(automaton.table[state][key]) for key in cls.keys]
+                if state < len(automaton.table)
+                else [state] * len(cls.keys)
+            )
+            for state in range(cls.num_states)
+        ]
+
+    def category(cls, state: int) -> tuple:
+        """
+        Describe what the scanner needs to know about a state, besides its moves.
+
+        Every final state accepts its own kind of token or reports its own error
+        message, so it is only equivalent to itself.
+
+        Args:
+            state (int): State to be described
+
+        Returns:
+            tuple: Category of the state, equal for states that may be merged
+        """
+        automaton = cls.automaton
+        if automaton.is_acceptor_state(state) or automaton.is_error_state(state):
+            return ("final", state)
+        return (
+            "open",
+            automaton.is_active_state(state),
+            automaton.is_incomplete_comment(state),
+            automaton.is_incomplete_string(state),
+        )
+
+    def minimize(cls) -> list:
+        """
+        Merge equivalent states with Hopcroft's partition refinement algorithm.
+
+        States start grouped by category, and a group is split whenever some of its
+        states move into a splitter group with a character class and others do not.
+
+        Returns:
+            list: New state number of every state, numbered by their first old state,
+                  so the initial state stays 0 and unmerged states keep their order
+        """
+        num_classes = len(cls.keys)
+        inverse = [[[] for _ in range(cls.num_states)] for _ in range(num_classes)]
+        for state, row in enumerate(cls.delta):
+            for char_class, target in enumerate(row):
+                inverse[char_class][target].append(state)
+
+        groups = {}
+        for state in range(cls.num_states):
+            groups.setdefault(cls.category(state), set()).add(state)
+        blocks = list(groups.values())
+        block_of = [0] * cls.num_states
+        for number, block in enumerate(blocks):
+            for state in block:
+                block_of[state] = number
+        pending = set(range(len(blocks)))
+
+        while pending:
+            splitter = set(blocks[pending.pop()])
+            for char_class in range(num_classes):
+                movers = {
+                    state
+                    for target in splitter
+                    for state in inverse[char_class][target]
+                }
+                for number in sorted({block_of[state] for state in movers}):
+                    inside = blocks[number] & movers
+                    if len(inside) == len(blocks[number]):
+                        continue
+                    blocks[number] -= inside
+                    blocks.append(inside)
+                    for state in inside:
+                        block_of[state] = len(blocks) - 1
+                    # Only the smaller half needs to split others, unless both do
+                    if number in pending or len(inside) <= len(blocks[number]):
+                        pending.add(len(blocks) - 1)
+                    else:
+                        pending.add(number)
+
+        order = sorted(range(len(blocks)), key=lambda number: min(blocks[number]))
+        renumber = {number: new for new, number in enumerate(order)}
+        return [renumber[block_of[state]] for state in range(cls.num_states)]
+
+    def pack(cls, rows: list) -> dict:
+        """
+        Deduplicate rows and pack them with row displacement (comb compression).
+
+        Each unique row keeps its most common target as its default, and only the
+        other entries are placed in a shared `next` array, at `base + char_class`.
+        Rows are slid over the array until none of their entries collide, and the
+        `check` array records which row owns each slot.
+
+        Args:
+            rows (list): Next state of every state with a row, for every class
+
+        Returns:
+            dict: Unique row of every state, and the default, base, next and check
+                  arrays of the unique rows
+        """
+        unique = []
+        row_of = []
+        for row in rows:
+            if row not in unique:
+                unique.append(row)
+            row_of.append(unique.index(row))
+
+        default = [Counter(row).most_common(1)[0][0] for row in unique]
+        exceptions = [
+            [
+                (char_class, target)
+                for char_class, target in enumerate(row)
+                if target != common
+            ]
+            for row, common in zip(unique, default)
+        ]
+        base = [0] * len(unique)
+        next_states = []
+        check = []
+        # Rows with more exceptions are placed first, while the array is emptier
+        for number in sorted(range(len(unique)), key=lambda n: -len(exceptions[n])):
+            offset = 0
+            while any(
+                offset + char_class < len(check) and check[offset + char_class] >= 0
+                for char_class, _ in exceptions[number]
+            ):
+                offset += 1
+            for char_class, target in exceptions[number]:
+                slot = offset + char_class
+                if slot >= len(check):
+                    next_states.extend([0] * (slot + 1 - len(check)))
+                    check.extend([-1] * (slot + 1 - len(check)))
+                next_states[slot] = target
+                check[slot] = number
+            base[number] = offset
+
+        return {
+            "row_of": row_of,
+            "default": default,
+            "base": base,
+            "next": next_states,
+            "check": check,
+        }
+
+    def compress(cls) -> dict:
+        """
+        Minimize the automaton and pack the rows of its minimized transition table.
+
+        Returns:
+            dict: Character classes, renumbered state lists and packed rows, ready
+                  to be saved as JSON and loaded by `TransitionTable`
+        """
+        automaton = cls.automaton
+        renumber = cls.minimize()
+        num_states = max(renumber) + 1
+        delta = [None] * num_states
+        for state, row in enumerate(cls.delta):
+            delta[renumber[state]] = [renumber[target] for target in row]
+
+        finals = {
+            renumber[state] for state in [*automaton.accepted, *automaton.error]
+        }
+        rows = [delta[state] for state in range(num_states) if state not in finals]
+        states = {
+            name: sorted({renumber[state] for state in getattr(automaton, name)})
+            for name in STATE_LISTS
+        }
+        states.update(
+            {name: renumber[getattr(automaton, name)] for name in STATE_NUMBERS}
+        )
+        return {"keys": cls.keys, "states": states, **cls.pack(rows)}
+
+
+def report(automaton: TransitionTable, packed: dict) -> str:
+    """
+    Compare the size and lookup speed of the dense and packed transition tables.
+
+    Args:
+        automaton (TransitionTable): Original transition table
+        packed (dict): Packed transition table
+
+    Returns:
+        str: Human readable report
+    """
+    compressor = TableCompressor(automaton)
+    num_classes = len(compressor.keys)
+    num_states = compressor.num_states
+    minimized = max(TableCompressor(automaton).minimize()) + 1
+    dense = array("B", [target for row in compressor.delta for target in row])
+    arrays = {
+        name: array("B" if name != "check" else "b", packed[name])
+        for name in ["row_of", "default", "base", "next", "check"]
+    }
+    packed_size = sum(len(values) * values.itemsize for values in arrays.values())
+
+    rng = random.Random(0)
+    rows = len(packed["row_of"])
+    pairs = [(rng.randrange(rows), rng.randrange(num_classes)) for _ in range(10_000)]
+    row_of, default, base = arrays["row_of"], arrays["default"], arrays["base"]
+    next_states, check = arrays["next"], arrays["check"]
+    size = len(check)
+
+    def dense_lookup() -> None:
+        for state, char_class in pairs:
+            dense[state * num_classes + char_class]
+
+    def packed_lookup() -> None:
+        for state, char_class in pairs:
+            number = row_of[state]
+            slot = base[number] + char_class
+            if slot < size and check[slot] == number:
+                next_states[slot]
+            else:
+                default[number]
+
+    dense_time = min(timeit.repeat(dense_lookup, number=20, repeat=5))
+    packed_time = min(timeit.repeat(packed_lookup, number=20, repeat=5))
+    lookups = len(pairs) * 20
+    return "\n".join(
+        [
+            f"States: {num_states} ({len(automaton.table)} with a row), "
+            f"{minimized} after minimization",
+            f"Unique rows: {len(packed['default'])} of {rows}",
+            f"Dense flat table: {len(dense):,} bytes",
+            f"Packed table:     {packed_size:,} bytes "
+            f"(next/check {len(packed['next'])} slots)",
+            f"Dense lookup:  {dense_time / lookups * 1e9:6.1f} ns",
+            f"Packed lookup: {packed_time / lookups * 1e9:6.1f} ns",
+        ]
+    )
+
+
+if __name__ == "__main__":
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else PACKED_PATH
+    automaton = TransitionTable()
+    packed = TableCompressor(automaton).compress()
+    path.write_text(json.dumps(packed, indent=None) + "\n", encoding="utf-8")
+    print(f"Packed transition table written to {path}")
+    print(report(automaton, packed))
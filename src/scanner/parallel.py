@@ -0,0 +1,283 @@
+import os
+import re
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from .errors import ScanError
+from .scanner import Scanner
+from .token_stream import TokenStream
+
+# Openings of the only tokens that can span several lines
+OPENINGS = re.compile(rb'"|/\*')
+ERROR_LINE = re.compile(r"line (\d+)$")
+
+
+def split_points(data: bytes, parts: int, min_size: int = 1) -> list:
+    """
+    Find the offsets where a source can be split into independent chunks.
+
+    A chunk always starts right after a newline that is not inside a string or a
+    comment, so the scanner starts it in the initial state. Strings and comments are
+    skipped with the same rules as the automaton, including "**/" not closing a
+    comment. After a lexical error the scan stops anyway, so any later split is valid.
+
+    Args:
+        data (bytes): UTF-8 encoded source code
+        parts (int): Maximum number of chunks
+        min_size (int): Minimum number of bytes of a chunk
+
+    Returns:
+        list[int]: Offsets of the start of every chunk, the first one being 0
+    """
+    size = len(data)
+    step = max(size // max(parts, 1), min_size, 1)
+    points = [0]
+    target = step
+    pos = 0
+
+    while target < size:
+        opening = OPENINGS.search(data, pos)
+        region_end = opening.start() if opening else size
+
+        # Split at the first newline after the target outside strings and comments
+        while target < region_end:
+            newline = data.find(b"\n", max(target, pos), region_end)
+            if newline < 0 or newline + 1 >= size:
+                break
+            points.append(newline + 1)
+            target = newline + 1 + step
+
+        if opening is None:
+            break
+        if opening.group() == b'"':
+            close = data.find(b'"', opening.end())
+            if close < 0:
+                break
+            pos = close + 1
+        else:
+            # A star followed by anything but a slash is skipped in pairs
+            star = data.find(b"*", opening.end())
+            while 0 <= star < size - 1 and data[star + 1] != ord("/"):
+                star = data.find(b"*", star + 2)
+            if star < 0 or star >= size - 1:
+                break
+            pos = star + 2
+
+    return points
+
+
+def count_lines(data: bytes, start: int, end: int) -> int:
+    """
+    Count the newlines of a part of a source, like text mode universal newlines.
+
+    Args:
+        data (bytes): UTF-8 encoded source code
+        start (int): Offset where counting starts
+        end (int): Offset where counting stops
+
+    Returns:
+        int: Number of newlines between both offsets
+    """
+    returns = data.count(b"\r", start, end) - data.count(b"\r\n", start, end)
+    return data.count(b"\n", start, end) + returns
+
+
+def count_chars(data: bytes, start: int, end: int) -> int:
+    """
+    Count the characters of a part of a source, once decoded in text mode.
+
+    Args:
+        data (bytes): UTF-8 encoded source code
+        start (int): Offset where counting starts
+        end (int): Offset where counting stops
+
+    Returns:
+        int: Number of characters between both offsets, with newlines normalized
+    """
+    return len(data[start:end].decode("utf-8")) - data.count(b"\r\n", start, end)
+
+
+def scan_chunk(
+    source: str | bytes,
+    start: int,
+    end: int,
+    first_line: int,
+    first_char: int,
+    backend: str,
+    spans: bool,
+    keep_comments: bool = True,
+) -> tuple | ScanError:
+    """
+    Scan the bytes of a chunk of a source file, run by the worker processes.
+
+    Args:
+        source (str | bytes): Path of the source file, or the bytes of the chunk
+        start (int): Offset of the first byte of the chunk
+        end (int): Offset right after the last byte of the chunk
+        first_line (int): Line number of the first line of the chunk
+        first_char (int): Character offset of the first character of the chunk
+        backend (str): Scanner backend used for the chunk
+        spans (bool): Whether to save the offset and length of every token
+        keep_comments (bool): Whether to save comments to their symbol table
+
+    Returns:
+        tuple | ScanError: Chunk tokens, the entries of every symbol table in order
+                           and the token spans, or the error of the chunk with
+                           positions in the whole file
+    """
+    if isinstance(source, bytes):
+        data = source
+    else:
+        with open(source, "rb") as file:
+            file.seek(start)
+            data = file.read(end - start)
+
+    scanner = Scanner(
+        "<chunk>",
+        token_stream=True,
+        backend=backend,
+        spans=spans,
+        source=data,
+        keep_comments=keep_comments,
+    )
+    try:
+        output, *tables = scanner.scan()
+    except ScanError as error:
+        message = ERROR_LINE.sub(
+            lambda match: f"line {int(match[1]) + first_line - 1}", str(error)
+        )
+        # Chunks start at a line start, so columns are the same in the whole file
+        return ScanError(
+            message,
+            error.line + first_line - 1,
+            error.column,
+            error.offset + first_char,
+        )
+    starts = array("I", (offset + first_char for offset in scanner.starts))
+    entries = [list(table.values()) for table in tables]
+    return output, entries, starts, scanner.lengths
+
+
+class ParallelScanner(Scanner):
+    """Custom class for a Scanner splitting a large source across processes."""
+
+    def __init__(
+        cls,
+        filename: str | os.PathLike = "<source>",
+        workers: int | None = None,
+        min_chunk_size: int = 1 << 20,
+        **kwargs: object,
+    ) -> None:
+        """
+        Define constructor method for the ParallelScanner class.
+
+        Args:
+            filename (str | os.PathLike): Filename or path of the file to be analyzed
+            workers (int | None): Number of worker processes, all the CPUs if None
+            min_chunk_size (int): Minimum number of bytes scanned by a worker
+            **kwargs (object): Other arguments of the Scanner class
+
+        Raises:
+            ValueError: Raised if span tables are requested, since chunks are scanned
+                        from their own part of the source
+
+        Properties:
+            workers (int): Number of worker processes
+            min_chunk_size (int): Minimum number of bytes scanned by a worker
+        """
+        super().__init__(filename, **kwargs)
+        if cls.span_tables:
+            raise ValueError("Span tables are not supported by the ParallelScanner")
+        cls.workers: int = workers or os.cpu_count() or 1
+        cls.min_chunk_size: int = min_chunk_size
+
+    def scan(cls) -> tuple:
+        """
+        Scan the source file in chunks with a process pool and merge the results.
+
+        Each chunk is scanned with its own symbol tables, which are then merged in
+        chunk order, so tokens and symbol table entries are numbered exactly like a
+        serial scan. Sources smaller than two chunks are scanned serially.
+
+        Raises
+            ScanError: Raised with the first lexical error of the source file
+
+        Returns
+            tuple[list | TokenStream, SymbolTable, ...]: Tuple with output and all
+                                                         symbol tables
+
+        """
+        data = cls.read_source()
+        points = split_points(data, cls.workers, cls.min_chunk_size)
+        if len(points) == 1:
+            return super().scan()
+
+        ends = points[1:] + [len(data)]
+        first_lines = [1]
+        first_chars = [0]
+        for start, end in zip(points, ends[:-1]):
+            first_lines.append(first_lines[-1] + count_lines(data, start, end))
+            first_chars.append(first_chars[-1] + count_chars(data, start, end))
+        # Workers read their own chunk of files, in-memory sources are sent to them
+        if cls.path is None:
+            sources = [data[start:end] for start, end in zip(points, ends)]
+        else:
+            sources = [str(cls.path)] * len(points)
+        del data
+
+        tables = (
+            cls.id_symbol_table,
+            cls.int_symbol_table,
+            cls.float_symbol_table,
+            cls.string_symbol_table,
+            cls.comment_symbol_table,
+        )
+        token_ids = cls.token_helper.token_ids
+        kinds = [token_ids[name] for name in ["ID", "INTEGER", "FLOAT", "STRING"]]
+
+        with ProcessPoolExecutor(min(cls.workers, len(points))) as pool:
+            results = pool.map(
+                scan_chunk,
+                sources,
+                points,
+                ends,
+                first_lines,
+                first_chars,
+                [cls.backend] * len(points),
+                [cls.spans] * len(points),
+                [cls.keep_comments] * len(points),
+            )
+
+            for result in results:
+                if isinstance(result, ScanError):
+                    pool.shutdown(cancel_futures=True)
+                    raise result
+                stream, entries, starts, lengths = result
+                cls.merge_chunk(stream, entries, tables, kinds)
+                cls.starts.extend(starts)
+                cls.lengths.extend(lengths)
+
+        return (cls.output, *tables)
+
+    def merge_chunk(
+        cls, stream: TokenStream, entries: list, tables: tuple, kinds: list
+    ) -> None:
+        """
+        Append the tokens of a chunk to the output, renumbering their entries.
+
+        Args:
+            stream (TokenStream): Tokens of the chunk
+            entries (list[list]): Entries of every symbol table of the chunk
+            tables (tuple[SymbolTable, ...]): Symbol tables of the whole source
+            kinds (list[int]): Token identifiers of the ID, INTEGER, FLOAT and
+                               STRING tokens, which have symbol table entries
+        """
+        remaps = {}
+        for table, values, kind in zip(tables, entries, kinds + [None]):
+            remap = [0] + [table.add(value) for value in values]
+            remaps[kind] = remap
+
+        append = cls.output.append
+        for kind, idx in zip(stream.kinds, stream.indices):
+            remap = remaps.get(kind)
+            append((kind,) if remap is None else (kind, remap[idx]))
@@ -0,0 +1,191 @@
+import re
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+from .compiled_dfa import ACCEPTOR, CONSUMING, FINAL, CompiledDFA
+from .tokens import Tokens
+from .transition_table import TransitionTable
+
+if TYPE_CHECKING:
+    from .scanner import Scanner
+
+
+class RegexBackend:
+    """Custom class for the Scanner's regular expression backend."""
+
+    def __init__(
+        cls, automaton: TransitionTable, dfa: CompiledDFA, token_helper: Tokens
+    ) -> None:
+        """
+        Define constructor method for the RegexBackend class.
+
+        Every token is matched by one compiled alternation of the C-- lexical
+        specification, so characters are consumed by the `re` engine instead of
+        the Python loop. The automaton is only stepped once per token, to decide
+        whether the character that follows it is accepted or is an error.
+
+        Since the table backend skips string and comment bodies and slices lexemes
+        by offset, both run at about the same speed, see
+        `benchmarks/scanner_backends.py`, as most of the time is spent per token.
+
+        Args:
+            automaton (TransitionTable): Transition table of the scanner
+            dfa (CompiledDFA): Integer-coded automaton of the scanner
+            token_helper (Tokens): Token helper of the scanner
+
+        Properties:
+            dfa (CompiledDFA): Integer-coded automaton of the scanner
+            pattern (re.Pattern): Master pattern with one named group per token type
+            id_state (int): State reached after the characters of an identifier
+            int_state (int): State reached after the digits of an integer
+            dot_state (int): State reached after the digits of a number and a dot
+            float_state (int): State reached after the digits of a float
+            str_state (int): Accepting state for strings
+            comment_state (int): Accepting state for comments
+            symbol_states (dict): State reached after the characters of each symbol
+        """
+        cls.dfa: CompiledDFA = dfa
+        cls.pattern: re.Pattern = cls.compile_pattern(token_helper)
+        cls.id_state: int = dfa.step(0, "a")
+        cls.int_state: int = dfa.step(0, "0")
+        cls.dot_state: int = dfa.step(cls.int_state, ".")
+        cls.float_state: int = dfa.step(cls.dot_state, "0")
+        cls.str_state: int = automaton.str_state
+        cls.comment_state: int = automaton.comment_state
+        cls.symbol_states: dict = {
+            symbol: cls.run(symbol)
+            for symbol in [*token_helper.special_characters]
+            + [*token_helper.complex_characters]
+        }
+
+    def compile_pattern(cls, token_helper: Tokens) -> re.Pattern:
+        """
+        Build the master pattern from the sets of characters of the token helper.
+
+        Args:
+            token_helper (Tokens): Token helper of the scanner
+
+        Returns:
+            re.Pattern: Compiled alternation of every token type
+        """
+
+        def char_set(chars: list) -> str:
+            return "[" + "".join(re.escape(char) for char in sorted(chars)) + "]"
+
+        blank = char_set([char for char in token_helper.blank if char])
+        letter = char_set(token_helper.letters)
+        digit = char_set(token_helper.digits)
+        # Quotes start strings and dots are never valid on their own
+        symbols = [
+            re.escape(symbol)
+            for symbol in [*token_helper.complex_characters]
+            + [char for char in token_helper.special_characters if char not in '".']
+        ]
+
+        # Blanks are skipped as a prefix of the next token, or of the end of input
+        return re.compile(
+            rf"{blank}*(?:"
+            + "|".join(
+                [
+                    r"(?P<end>\Z)",
+                    r"(?P<comment>/\*(?:[^*]|\*[^/])*\*/)",
+                    r'(?P<string>"[^"]*")',
+                    rf"(?P<identifier>{letter}(?:{letter}|{digit})*)",
+                    rf"(?P<number>{digit}+(?:\.{digit}*)?)",
+                    rf"(?P<symbol>{'|'.join(symbols)})",
+                    r"(?P<other>.)",
+                ]
+            )
+            + ")",
+            re.DOTALL,
+        )
+
+    def run(cls, chars: str) -> int:
+        """
+        Compute the state reached from the initial state after reading some chars.
+
+        Args:
+            chars (str): Characters to be read
+
+        Returns:
+            int: State reached
+        """
+        state = 0
+        for char in chars:
+            state = cls.dfa.step(state, char)
+        return state
+
+    def tokens(cls, scanner: "Scanner", text: str) -> Iterator[tuple]:
+        """
+        Yield the tokens matched in a source string.
+
+        Args:
+            scanner (Scanner): Scanner whose symbol tables and error messages are used
+            text (str): Source code to be scanned
+
+        Raises:
+            ScanError: Raised with the same messages as the table-driven scanner
+
+        Yields:
+            tuple: Token identifier, followed by its symbol table entry if it has one
+        """
+        dfa = cls.dfa
+        flags = dfa.flags
+        transitions = dfa.transitions
+        num_classes = dfa.num_classes
+        invalid = dfa.invalid_class
+        # Class of each character code, with the end of input (256) being blank
+        char_classes = [*dfa.char_classes, dfa.blank_class]
+        symbol_states = cls.symbol_states
+        match = cls.pattern.match
+        accept_token = scanner.accept_token
+        spans = scanner.spans
+        position = 0
+        size = len(text)
+
+        while position < size:
+            found = match(text, position)
+            kind = found.lastgroup
+            if kind == "end":
+                break
+
+            token = found.group(kind)
+            start, position = found.span(kind)
+            if kind == "identifier":
+                state = cls.id_state
+            elif kind == "number":
+                if token[-1] == ".":
+                    state = cls.dot_state
+                elif "." in token:
+                    state = cls.float_state
+                else:
+                    state = cls.int_state
+            elif kind == "string":
+                state = cls.str_state
+            elif kind == "comment":
+                state = cls.comment_state
+            elif kind == "symbol":
+                state = symbol_states[token]
+            else:
+                state = cls.run(token)
+
+            # Tokens that end on a lookahead are decided by the character after them
+            last = position
+            if not flags[state] & FINAL:
+                follow = text[position : position + 1]
+                code = ord(follow) if follow else 256
+                char_class = char_classes[code] if code <= 256 else invalid
+                state = transitions[state * num_classes + char_class]
+                last += 1
+                if flags[state] & ACCEPTOR and not flags[state] & CONSUMING:
+                    token += follow
+                    position += 1
+
+            if flags[state] & ACCEPTOR:
+                entry = accept_token(state, token)
+                if entry is not None:
+                    if spans:
+                        scanner.add_span(start, position)
+                    yield entry
+            else:
+                raise scanner.lexical_error(state, last - 1, start, text)
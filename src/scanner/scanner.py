@@ -1,6 +1,34 @@
+import io
+import os
 import sys
+import warnings
+from array import array
+from collections.abc import Iterator
+from functools import partial
 from pathlib import Path
-
+from types import ModuleType
+from typing import IO, TextIO
+
+from .. import language_tables
+from . import vectorized
+from .bytes_backend import BytesBackend
+from .codegen import load_direct_scanner
+from .compiled_dfa import (
+    ACCEPTOR,
+    BODY,
+    CONSUMING,
+    ERROR,
+    FINAL,
+    INCOMPLETE,
+    INCOMPLETE_COMMENT,
+    INCOMPLETE_STRING,
+    CompiledDFA,
+)
+from .errors import ScanError
+from .line_index import LineIndex
+from .regex_backend import RegexBackend
+from .symbol_table import SpanTable, SymbolTable
+from .token_stream import TokenStream
 from .tokens import Tokens
 from .transition_table import TransitionTable
 
@@ -8,36 +36,152 @@ from .transition_table import TransitionTable
 class Scanner:
     """Custom class for the Lexical Analyzer / Scanner."""
 
-    def __init__(cls, filename: str) -> None:
+    backends: tuple = ("table", "regex", "direct", "numpy", "mmap")
+
+    def __init__(
+        cls,
+        filename: str | os.PathLike = "<source>",
+        chunk_size: int = 64 * 1024,
+        token_stream: bool = False,
+        backend: str = "table",
+        spans: bool = False,
+        source: str | bytes | memoryview | IO | None = None,
+        keep_comments: bool = True,
+        span_tables: bool = False,
+    ) -> None:
         """
         Define constructor method for the Scanner class.
 
+        The source code is read from `test/examples/{filename}` by default. A path
+        object is read from wherever it points to, and a `source` is scanned from
+        memory without touching the disk, in which case the filename is only a label.
+
         Args:
-            filename (str): Filename of the file to be analyzed
+            filename (str | os.PathLike): Filename of the file to be analyzed, in the
+                                          examples directory, or path to the file
+            chunk_size (int): Number of characters read from the file at a time
+            token_stream (bool): Whether to save the output in a compact TokenStream
+            backend (str): Scanning backend, one of `Scanner.backends`
+            spans (bool): Whether to save the offset and length of every token, also
+                          read as the offsets of a TokenStream output
+            source (str | bytes | memoryview | IO | None): Source code to be analyzed,
+                                                          or a binary or text stream
+                                                          to read it from
+            keep_comments (bool): Whether to save comments to their symbol table
+            span_tables (bool): Whether to save strings and comments as spans of the
+                                source, only supported by the `table` backend
+
+        Raises:
+            ValueError: Raised if the backend is not supported
+            ValueError: Raised if span tables are requested for another backend
+
+        Warns:
+            RuntimeWarning: Warned when the `numpy` backend falls back to `table`,
+                            because NumPy is not installed
 
         Properties:
-            output (list): List where the scanner output will be saved
+            output (list | TokenStream): List where the scanner output will be saved
             token_helper (Tokens): Local imported class regarding Tokens
             automaton (TransitionTable): Local imported class regarding Transitions
+            dfa (CompiledDFA): Integer-coded automaton used by the scan loop
             filename (str): The filename of the file that is going to be analyzed
-            path (Path): OS library to simplify path and file handling
-            id_symbol_table (dict): Symbol table to save identifiers
-            int_symbol_table (dict): Symbol table to save integer numbers
-            float_symbol_table (dict): Symbol table to save floating point numbers
-            string_symbol_table (dict): Symbol table to save strings
-            comment_symbol_table (dict): Symbol table to save comments
+            path (Path | None): Path of the source file, None for in-memory sources
+            source (str | bytes | None): In-memory source code, None for files
+            chunk_size (int): Size of the blocks used to buffer the source file
+            backend (str): Name of the backend used to recognize tokens
+            regex (RegexBackend | None): Regular expression backend, if selected
+            direct (ModuleType | None): Generated direct-coded scanner, if selected
+            vectorized (VectorizedBackend | None): NumPy backend, if selected
+            mapped (BytesBackend | None): Memory-mapped bytes backend, if selected
+            spans (bool): Whether the offset and length of every token are saved
+            keep_comments (bool): Whether comments are saved to their symbol table
+            span_tables (bool): Whether strings and comments are saved as spans
+            starts (array): Character offset of every output token, if saved
+            lengths (array): Number of characters of every output token, if saved
+            lines (LineIndex | None): Line starts of the source, built on demand
+            id_symbol_table (SymbolTable): Symbol table to save identifiers
+            int_symbol_table (SymbolTable): Symbol table to save integer numbers
+            float_symbol_table (SymbolTable): Symbol table to save floating point
+                                              numbers
+            string_symbol_table (SymbolTable | SpanTable): Symbol table to save strings
+            comment_symbol_table (SymbolTable | SpanTable): Symbol table to save
+                                                            comments
             error_messages (dict): Dictionary with error messages and their states
         """
-        cls.output: list = []
-        cls.token_helper: Tokens = Tokens()
-        cls.automaton: TransitionTable = TransitionTable()
+        cls.output: list | TokenStream = TokenStream() if token_stream else []
+        # Tables are thawed from the precompiled artifact, see `language_tables`
+        token_helper, automaton, dfa = language_tables.scanner_tables()
+        cls.token_helper: Tokens = token_helper
+        cls.automaton: TransitionTable = automaton
+        cls.dfa: CompiledDFA = dfa
+        cls.source: str | bytes | None = None
+        cls.path: Path | None = None
+        if source is not None:
+            if hasattr(source, "read"):
+                source = source.read()
+            cls.source = bytes(source) if isinstance(source, memoryview) else source
+        elif isinstance(filename, os.PathLike):
+            cls.path = Path(filename)
+            filename = cls.path.name
+        else:
+            cls.path = Path.cwd().joinpath("test", "examples", filename)
         cls.filename: str = filename
-        cls.path: Path = Path.cwd().joinpath("test", "examples", cls.filename)
-        cls.id_symbol_table: dict = {}
-        cls.int_symbol_table: dict = {}
-        cls.float_symbol_table: dict = {}
-        cls.string_symbol_table: dict = {}
-        cls.comment_symbol_table: dict = {}
+        cls.chunk_size: int = chunk_size
+        if backend not in cls.backends:
+            raise ValueError(
+                f"Unknown scanner backend '{backend}', expected one of {cls.backends}"
+            )
+        if backend == "numpy" and not vectorized.available():
+            warnings.warn(
+                "NumPy is not installed, falling back to the 'table' backend",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            backend = "table"
+        cls.backend: str = backend
+        cls.regex: RegexBackend | None = (
+            RegexBackend(cls.automaton, cls.dfa, cls.token_helper)
+            if backend == "regex"
+            else None
+        )
+        cls.direct: ModuleType | None = (
+            load_direct_scanner(cls.automaton, cls.token_helper)
+            if backend == "direct"
+            else None
+        )
+        cls.vectorized: vectorized.VectorizedBackend | None = (
+            vectorized.VectorizedBackend(cls.automaton, cls.dfa)
+            if backend == "numpy"
+            else None
+        )
+        cls.mapped: BytesBackend | None = (
+            BytesBackend(cls.automaton, cls.dfa, cls.token_helper)
+            if backend == "mmap"
+            else None
+        )
+        cls.spans: bool = spans
+        cls.keep_comments: bool = keep_comments
+        if span_tables and backend != "table":
+            raise ValueError(
+                "Span tables are only supported by the 'table' backend, "
+                f"not '{backend}'"
+            )
+        cls.span_tables: bool = span_tables
+        cls.starts: array = array("I")
+        cls.lengths: array = array("I")
+        if token_stream and spans:
+            # The stream reads the offsets of its tokens from the saved spans
+            cls.output.offsets = cls.starts
+        cls.lines: LineIndex | None = None
+        cls.id_symbol_table: SymbolTable = SymbolTable()
+        cls.int_symbol_table: SymbolTable = SymbolTable()
+        cls.float_symbol_table: SymbolTable = SymbolTable()
+        cls.string_symbol_table: SymbolTable = (
+            SpanTable() if span_tables else SymbolTable()
+        )
+        cls.comment_symbol_table: SymbolTable = (
+            SpanTable() if span_tables else SymbolTable()
+        )
         cls.error_messages: dict = dict(
             zip(
                 cls.automaton.error,
@@ -51,180 +195,139 @@ class Scanner:
             )
         )
 
-    def existing_symbol(cls, token: str, symbol_table: dict) -> bool:
+    def open_source(cls) -> TextIO:
         """
-        Check if a symbol was already saved in a symbol table.
+        Open the source to be analyzed in text mode, with universal newlines.
 
-        Args:
-            token (str): The token to be checked
-            symbol_table (dict): The symbol table where the check will happen
+        Returns:
+            TextIO: Open file object for the source file, or stream over the source
+        """
+        if cls.source is None:
+            return cls.path.open(encoding="utf-8")
+        if isinstance(cls.source, str):
+            return io.StringIO(cls.source, newline=None)
+        return io.TextIOWrapper(io.BytesIO(cls.source), encoding="utf-8")
+
+    def read_text(cls) -> str:
+        """
+        Read the whole source to be analyzed as text, with universal newlines.
+
+        In-memory strings without carriage returns are returned without a copy.
+
+        Returns:
+            str: Source code
+        """
+        if isinstance(cls.source, str) and "\r" not in cls.source:
+            return cls.source
+        with cls.open_source() as file:
+            return file.read()
+
+    def read_source(cls) -> bytes:
+        """
+        Read the whole source to be analyzed as bytes.
 
         Returns:
-            bool: A boolean value specifying whether the symbol was previously saved
+            bytes: UTF-8 encoded source code
         """
-        return True if token in symbol_table.values() else False
+        if cls.source is None:
+            return cls.path.read_bytes()
+        if isinstance(cls.source, str):
+            return cls.source.encode("utf-8")
+        return cls.source
 
-    def add_token_to_symbol_table(cls, token: str, symbol_table: dict) -> None:
+    def add_token_to_symbol_table(cls, token: str, symbol_table: SymbolTable) -> int:
         """
         Add a token to the specified symbol table if it doesn't exist already.
 
         Args:
             token (str): The token to be added
-            symbol_table (dict): The symbol table where the token will be added
+            symbol_table (SymbolTable): The symbol table where the token will be added
+
+        Returns:
+            int: Entry number of the token in the symbol table
         """
-        if not cls.existing_symbol(token, symbol_table):
-            entry = len(symbol_table) + 1
-            symbol_table[entry] = token
+        return symbol_table.add(token)
 
-    def add_symbol_to_output(cls, token: str, symbol_table: dict, t_id: str) -> None:
+    def accept_token(cls, state: int, token: str) -> tuple | None:
         """
-        Append a built symbol to the output list of the Scanner.
+        Save an accepted token to its symbol table and build its output entry.
 
         Args:
-            token (str): Token to be added to the output
-            symbol_table (dict): Symbol table corresponding to the token of the symbol
-            t_id (str): Identifier of the token to be retrieved from the Token ID table
+            state (int): Final accepting state reached by the token
+            token (str): Characters of the token
+
+        Returns:
+            tuple | None: Token identifier, followed by its symbol table entry if it
+                          has one, or None for comments, which are not output
         """
-        idx = next((k for k in symbol_table if symbol_table[k] == token), None)
-        cls.output.append((cls.token_helper.token_ids[t_id], idx))
+        # Symbols are known from their accepting state alone
+        token_id = cls.dfa.token_ids[state]
+        if token_id:
+            return (token_id, )
+
+        automaton = cls.automaton
+        tkn = cls.token_helper
+
+        if automaton.is_identifier(state):
+            # If token is a keyword, in any case
+            token_id = tkn.keyword_ids.get(token)
+            if token_id is not None:
+                return (token_id, )
+            # If token is not a keyword
+            idx = cls.add_token_to_symbol_table(token, cls.id_symbol_table)
+            return (tkn.token_ids["ID"], idx)
+        elif automaton.is_integer(state):
+            # Cast token in case it is an integer constant
+            idx = cls.add_token_to_symbol_table(int(token), cls.int_symbol_table)
+            return (tkn.token_ids["INTEGER"], idx)
+        elif automaton.is_float(state):
+            # Cast token in case it is a floating point constant
+            idx = cls.add_token_to_symbol_table(float(token), cls.float_symbol_table)
+            return (tkn.token_ids["FLOAT"], idx)
+        elif automaton.is_string(state):
+            idx = cls.add_token_to_symbol_table(token, cls.string_symbol_table)
+            return (tkn.token_ids["STRING"], idx)
+        elif automaton.is_comment(state):
+            if cls.keep_comments:
+                cls.add_token_to_symbol_table(token, cls.comment_symbol_table)
+            return None
+        # Search the token's ID
+        return (tkn.token_ids[token], )
+
+    def accept_span(cls, state: int, start: int, end: int) -> tuple | None:
+        """
+        Save an accepted string or comment to its span table by its offsets.
+
+        Args:
+            state (int): Final accepting state reached by the token
+            start (int): Offset of the first character of the token
+            end (int): Offset right after the last character of the token
 
-    def scan(cls) -> tuple[list, dict, dict, dict, dict, dict]:
+        Returns:
+            tuple | None: Token identifier, followed by its string table entry, or
+                          None for comments, which are not output
+        """
+        if cls.automaton.is_comment(state):
+            if cls.keep_comments:
+                cls.comment_symbol_table.add_span(start, end)
+            return None
+        idx = cls.string_symbol_table.add_span(start, end)
+        return (cls.token_helper.token_ids["STRING"], idx)
+
+    def scan(cls) -> tuple:
         """
         Scan method responsible for retrieving, identifying and saving tokens from the
         source file specified.
 
         Raises
-            Exception: Raised if a comment was not closed correctly
-            Exception: Raised if a string was not closed correctly
-            Exception: Raised depending on the error state, with its own error message
-            Exception: Raised in case an unknown error was thrown
+            ScanError: Raised if the source file has a lexical error, see `tokens`
 
         Returns
-            tuple[list, dict, dict, dict, dict, dict]: Tuple with output and all symbol
-                                                       tables
+            tuple[list | TokenStream, SymbolTable, ...]: Tuple with output and all
+                                                         symbol tables
 
         """
-        # Initialize local scoped variables for scanner execution
-        dfa = cls.automaton
-        tkn = cls.token_helper
-        char = ""
-        lookbehind = ""
-        token = ""
-        state = 0
-        line = 1
-        str_offset = 0
-        cmt_offset = 0
-
-        with cls.path.open(encoding="utf-8") as file:
-            while True:
-                # Run while state is not acceptor, error, or there is a lookbehind char
-                while (
-                    not dfa.is_acceptor_state(state) and not dfa.is_error_state(state)
-                ) or lookbehind != "":
-                    if lookbehind == "":
-                        char = file.read(1)
-                    else:
-                        char = lookbehind
-                        lookbehind = ""
-
-                    # If last char was read already, break the loop
-                    if not char and token == "":
-                        break
-
-                    # If newline char is read, increase line count and set offsets
-                    if char == "\n":
-                        line += 1
-                        if dfa.is_active_state(state):
-                            if dfa.is_incomplete_comment(state):
-                                cmt_offset += 1
-                            else:
-                                str_offset += 1
-
-                    # Identify character type and get state from transition table
-                    char_type = tkn.identify_char(char)
-                    state = int(dfa.table[state][char_type])
-
-                    if not tkn.is_blank(char) or dfa.is_active_state(state):
-                        token += char
-                        
-                    # If last char and state is in incomplete comment, break the loop
-                    if not char and (
-                        dfa.is_incomplete_comment(state)
-                        or dfa.is_incomplete_string(state)
-                    ):
-                        break
-
-                # Break loop if tokens are depleted and state is not active
-                if not char and token == "" and not dfa.is_active_state(state):
-                    break
-
-                # Check if state is a final accepting state
-                if dfa.is_acceptor_state(state):
-                    # If state is consuming and char is not blank, set lookbehind
-                    if dfa.is_consuming_state(state) and not tkn.is_blank(char):
-                        lookbehind = token[-1]
-                        token = token[:-1]
-
-                    if dfa.is_identifier(state):
-                        # If token is a keyword
-                        if tkn.is_keyword(token.lower()):
-                            cls.output.append((tkn.token_ids[token.lower()], ))
-                        else:
-                            # If token is not a keyword
-                            cls.add_token_to_symbol_table(token, cls.id_symbol_table)
-                            cls.add_symbol_to_output(
-                                token, cls.id_symbol_table, "ID"
-                            )
-                    elif dfa.is_integer(state):
-                        # Cast token in case it is an integer constant
-                        token = int(token)
-                        cls.add_token_to_symbol_table(token, cls.int_symbol_table)
-                        cls.add_symbol_to_output(
-                            token, cls.int_symbol_table, "INTEGER"
-                        )
-                    elif dfa.is_float(state):
-                        # Cast token in case it is a floating point constant
-                        token = float(token)
-                        cls.add_token_to_symbol_table(token, cls.float_symbol_table)
-                        cls.add_symbol_to_output(
-                            token, cls.float_symbol_table, "FLOAT"
-                        )
-                    elif dfa.is_string(state):
-                        # If token is a string, persist and reset offset
-                        str_offset = 0
-                        cls.add_token_to_symbol_table(token, cls.string_symbol_table)
-                        cls.add_symbol_to_output(
-                            token, cls.string_symbol_table, "STRING"
-                        )
-                    elif dfa.is_comment(state):
-                        # If token is a comment, persist and reset offset
-                        cmt_offset = 0
-                        cls.add_token_to_symbol_table(token, cls.comment_symbol_table)
-                        # cls.add_symbol_to_output(
-                        #     token, cls.comment_symbol_table, "COMMENT"
-                        # )
-                    else:
-                        # Search the token's ID and persist to output
-                        cls.output.append((tkn.token_ids[token], ))
-
-                    # Reset both state and token variables for next character
-                    state = 0
-                    token = ""
-
-                elif dfa.is_incomplete_comment(state):
-                    raise Exception(
-                        f"ERROR: Incorrectly closed comment in line {line - cmt_offset}"
-                    )
-                elif dfa.is_incomplete_string(state):
-                    raise Exception(
-                        f"ERROR: Incorrectly closed string in line {line - str_offset}"
-                    )
-                elif dfa.is_error_state(state):
-                    raise Exception(
-                        f"ERROR: {cls.error_messages[state]} at line {line}"
-                    )
-                else:
-                    raise Exception("Unkwown error occurred")
+        cls.output.extend(cls.tokens())
 
         return (
             cls.output,
@@ -235,10 +338,304 @@ class Scanner:
             cls.comment_symbol_table,
         )
 
+    def tokens(cls) -> Iterator[tuple]:
+        """
+        Retrieve, identify and yield tokens from the source file specified, as soon
+        as each of them is recognized by the selected backend.
+
+        Symbol tables are filled as tokens are produced, but tokens are not saved to
+        the `output` list.
+
+        Raises
+            ScanError: Raised if a comment was not closed correctly
+            ScanError: Raised if a string was not closed correctly
+            ScanError: Raised depending on the error state, with its own error message
+            ScanError: Raised in case an unknown error was thrown
+
+        Returns
+            Iterator[tuple]: Generator of token identifiers, each followed by its
+                             symbol table entry if it has one
+
+        """
+        if cls.backend == "regex":
+            return cls.regex_tokens()
+        if cls.backend == "direct":
+            return cls.direct_tokens()
+        if cls.backend == "numpy":
+            return cls.vectorized.tokens(cls, cls.read_source())
+        if cls.backend == "mmap":
+            return cls.mapped.tokens(cls)
+        return cls.table_tokens()
+
+    def regex_tokens(cls) -> Iterator[tuple]:
+        """
+        Yield the tokens matched by the regular expression backend.
+
+        Yields
+            tuple: Token identifier, followed by its symbol table entry if it has one
+
+        """
+        yield from cls.regex.tokens(cls, cls.read_text())
+
+    def direct_tokens(cls) -> Iterator[tuple]:
+        """
+        Yield the tokens recognized by the direct-coded scanner generated from the
+        transition table.
+
+        Yields
+            tuple: Token identifier, followed by its symbol table entry if it has one
+
+        """
+        text = cls.read_text()
+        error = partial(cls.lexical_error, text=text)
+        span = cls.add_span if cls.spans else None
+        yield from cls.direct.tokens(text, cls.accept_token, error, span)
+
+    def table_tokens(cls) -> Iterator[tuple]:
+        """
+        Yield the tokens recognized one character at a time with the integer-coded
+        transition table.
+
+        The source is read in blocks of `chunk_size` characters, and each token is
+        sliced from the block by its offsets once it is accepted, so no string is
+        built one character at a time. A consuming state leaves the character after
+        the token to be read again. Tokens that straddle two blocks keep their first
+        part until they end, and the bodies of strings and comments are skipped up to
+        their closing delimiter, see `skip_body`.
+
+        Yields
+            tuple: Token identifier, followed by its symbol table entry if it has one
+
+        """
+        # Initialize local scoped variables for scanner execution
+        transitions = cls.dfa.transitions
+        flags = cls.dfa.flags
+        char_classes = cls.dfa.char_classes
+        num_classes = cls.dfa.num_classes
+        blank = cls.dfa.blank_class
+        invalid = cls.dfa.invalid_class
+        spans = cls.spans
+        keep_comments = cls.keep_comments
+        span_tables = cls.span_tables
+        str_state = cls.automaton.str_state
+        comment_state = cls.automaton.comment_state
+        state = 0
+        # Offset of the block in the source, and index of the current token in it,
+        # negative if the token started in a previous block
+        base = 0
+        begin = 0
+        # Characters of the current token in previous blocks
+        parts = []
+
+        if span_tables:
+            # Span tables point into the whole source, which is then read at once
+            file = io.StringIO()
+            buffer = cls.read_text()
+            cls.string_symbol_table.source = buffer
+            cls.comment_symbol_table.source = buffer
+        else:
+            file = cls.open_source()
+            buffer = file.read(cls.chunk_size)
+
+        with file:
+            read = partial(file.read, cls.chunk_size)
+            size = len(buffer)
+            idx = 0
+
+            while True:
+                if idx == size:
+                    chunk = read()
+                    if chunk:
+                        if state and (
+                            keep_comments or not flags[state] & INCOMPLETE_COMMENT
+                        ):
+                            parts.append(buffer[max(begin, 0) :])
+                        base += size
+                        begin -= size
+                        buffer = chunk
+                        size = len(chunk)
+                        idx = 0
+
+                # Identify character class and get state from transition matrix
+                if idx < size:
+                    code = ord(buffer[idx])
+                    char_class = char_classes[code] if code < 256 else invalid
+                elif state == 0:
+                    return
+                else:
+                    char_class = blank
+                state = transitions[state * num_classes + char_class]
+                flag = flags[state]
+
+                if not flag & FINAL:
+                    # The source ended inside a string or comment
+                    if idx == size:
+                        raise cls.lexical_error(state, base + idx, base + begin)
+                    idx += 1
+                    # Blanks between tokens
+                    if state == 0:
+                        begin = idx
+                        continue
+                    if not flag & BODY:
+                        continue
+
+                    # Jump over the body of a string or comment in the current block
+                    state, idx = cls.skip_body(state, buffer, idx)
+                    flag = flags[state]
+                    if not flag & ACCEPTOR:
+                        continue
+                    # The closing delimiter is consumed below, like any last character
+                    idx -= 1
+
+                if not flag & ACCEPTOR:
+                    raise cls.lexical_error(state, base + idx, base + begin)
+
+                # Consuming states leave the current character for the next token
+                if not flag & CONSUMING:
+                    idx += 1
+                if span_tables and (state == str_state or state == comment_state):
+                    entry = cls.accept_span(state, begin, idx)
+                else:
+                    if begin < 0:
+                        parts.append(buffer[:idx])
+                        token = "".join(parts)
+                        parts.clear()
+                    else:
+                        token = buffer[begin:idx]
+                    entry = cls.accept_token(state, token)
+                if entry is not None:
+                    if spans:
+                        cls.add_span(base + begin, base + idx)
+                    yield entry
+
+                # Reset both state and token start for the next character
+                state = 0
+                begin = idx
+
+    def skip_body(cls, state: int, buffer: str | bytes, idx: int) -> tuple:
+        """
+        Find where the body of a string or comment ends in a buffer.
+
+        Bodies loop on every character but their closing delimiter, so it is searched
+        with `find` instead of running the automaton on every character. A star that
+        is not followed by a slash is skipped together with the next character, so
+        `**/` does not close a comment, like in the transition table.
+
+        Args:
+            state (int): Body state of the string or comment being scanned
+            buffer (str | bytes): Block of the source, as text or bytes
+            idx (int): Offset of the first character of the body left to scan
+
+        Returns:
+            tuple[int, int]: State reached and offset right after the last character
+                             skipped, which is the closing delimiter if the state is
+                             an accepting state, or the end of the buffer otherwise
+        """
+        automaton = cls.automaton
+        size = len(buffer)
+        text = isinstance(buffer, str)
+
+        if cls.dfa.flags[state] & INCOMPLETE_STRING:
+            close = buffer.find('"' if text else b'"', idx)
+            if close < 0:
+                return state, size
+            return automaton.str_state, close + 1
+
+        slash = "/" if text else ord("/")
+        star = buffer.find("*" if text else b"*", idx)
+        while 0 <= star < size - 1 and buffer[star + 1] != slash:
+            star = buffer.find("*" if text else b"*", star + 2)
+        if star < 0:
+            return state, size
+        if star == size - 1:
+            # The star may close the comment with the first character of the next block
+            return cls.dfa.step(state, "*"), size
+        return automaton.comment_state, star + 2
+
+    def add_span(cls, start: int, end: int) -> None:
+        """
+        Save the position of the last output token.
+
+        Args:
+            start (int): Offset of the first character of the token
+            end (int): Offset right after the last character of the token
+        """
+        cls.starts.append(start)
+        cls.lengths.append(end - start)
+
+    def line_index(cls, text: str | None = None) -> LineIndex:
+        """
+        Get the line starts of the source, building them once per file.
+
+        Args:
+            text (str | None): Source code to be indexed, read from the source file
+                               if not given and the index was not built yet
+
+        Returns:
+            LineIndex: Line starts of the source
+        """
+        if text is not None or cls.lines is None:
+            cls.lines = LineIndex(cls.read_text() if text is None else text)
+        return cls.lines
+
+    def location(cls, idx: int) -> tuple | None:
+        """
+        Find the line and column of an output token, if spans are saved.
+
+        The end of input, right after the last token, is located after its last
+        character.
+
+        Args:
+            idx (int): Position of the token in the output
+
+        Returns:
+            tuple[int, int] | None: Line and column numbers of the first character of
+                                    the token, or None if its span was not saved
+        """
+        if idx < len(cls.starts):
+            return cls.line_index().locate(cls.starts[idx])
+        if idx == len(cls.starts) and cls.starts:
+            return cls.line_index().locate(cls.starts[-1] + cls.lengths[-1])
+        return None
+
+    def lexical_error(
+        cls, state: int, offset: int, start: int = 0, text: str | None = None
+    ) -> ScanError:
+        """
+        Build the error for a source that cannot be scanned.
+
+        Unclosed strings and comments are reported at the line where they start.
+        Messages of other errors count lines up to the offending character, included.
+
+        Args:
+            state (int): Error or incomplete state reached by the automaton
+            offset (int): Offset of the offending character, or the source length
+            start (int): Offset of the first character of the current token
+            text (str | None): Source code, read from the source file if not given
+
+        Returns:
+            ScanError: Error with its message and position
+        """
+        lines = cls.line_index(text)
+        flags = cls.dfa.flags[state]
+        if flags & INCOMPLETE:
+            kind = "comment" if flags & INCOMPLETE_COMMENT else "string"
+            line, column = lines.locate(start)
+            message = f"ERROR: Incorrectly closed {kind} in line {line}"
+            return ScanError(message, line, column, start)
+        elif flags & ERROR:
+            line, column = lines.locate(offset)
+            message = (
+                f"ERROR: {cls.error_messages[state]} at line {lines.line(offset + 1)}"
+            )
+            return ScanError(message, line, column, offset)
+        line, column = lines.locate(offset)
+        return ScanError("Unkwown error occurred", line, column, offset)
+
     def export(
         cls,
         filename: str,
-        output: list,
+        output: list | TokenStream,
         ids: dict,
         ints: dict,
         floats: dict,
@@ -250,7 +647,7 @@ class Scanner:
 
         Args:
             filename (str): Name of the file to be analyzed
-            output (list): Output list with all identified tokens
+            output (list | TokenStream): Output list with all identified tokens
             ids (dict): Symbol table with identifiers
             ints (dict): Symbol table with integer constants
             floats (dict): Symbol table with floating gpoint constants
@@ -271,7 +668,7 @@ class Scanner:
     def export_to_file(
         cls,
         filename: str,
-        output: list,
+        output: list | TokenStream,
         ids: dict,
         ints: dict,
         floats: dict,
@@ -283,7 +680,7 @@ class Scanner:
 
         Args:
             filename (str): Name of the file to be analyzed
-            output (list): Output list with all identified tokens
+            output (list | TokenStream): Output list with all identified tokens
             ids (dict): Symbol table with identifiers
             ints (dict): Symbol table with integer constants
             floats (dict): Symbol table with floating gpoint constants
@@ -0,0 +1,225 @@
+from array import array
+from collections.abc import Hashable, Iterator, Mapping
+
+
+class SymbolTable(Mapping):
+    """Custom class for the Scanner's interning symbol tables."""
+
+    __slots__ = ("indices", "lexemes")
+
+    def __init__(cls) -> None:
+        """
+        Define constructor method for the SymbolTable class.
+
+        The table behaves as a read-only mapping from 1-based indices to lexemes,
+        so it compares equal to (and prints like) the plain dictionaries it replaces.
+
+        Properties:
+            indices (dict): Hash index mapping each lexeme to its entry number
+            lexemes (list): Lexemes in order of insertion, entry `n` is at `n - 1`
+        """
+        cls.indices: dict = {}
+        cls.lexemes: list = []
+
+    def add(cls, lexeme: Hashable) -> int:
+        """
+        Intern a lexeme, adding it to the table if it doesn't exist already.
+
+        Args:
+            lexeme (Hashable): The lexeme to be interned
+
+        Returns:
+            int: Entry number of the lexeme in the table
+        """
+        idx = cls.indices.get(lexeme)
+        if idx is None:
+            cls.lexemes.append(lexeme)
+            idx = len(cls.lexemes)
+            cls.indices[lexeme] = idx
+        return idx
+
+    def index(cls, lexeme: Hashable) -> int | None:
+        """
+        Look up the entry number of a lexeme.
+
+        Args:
+            lexeme (Hashable): The lexeme to be looked up
+
+        Returns:
+            int | None: Entry number of the lexeme, or None if it was never added
+        """
+        return cls.indices.get(lexeme)
+
+    def __getitem__(cls, idx: int) -> Hashable:
+        """
+        Retrieve the lexeme saved under an entry number.
+
+        Args:
+            idx (int): Entry number, starting from 1
+
+        Raises:
+            KeyError: Raised if there is no entry with that number
+
+        Returns:
+            Hashable: The lexeme saved under the entry number
+        """
+        if isinstance(idx, int) and 0 < idx <= len(cls.lexemes):
+            return cls.lexemes[idx - 1]
+        raise KeyError(idx)
+
+    def __iter__(cls) -> Iterator[int]:
+        """
+        Iterate over the entry numbers of the table.
+
+        Returns:
+            Iterator[int]: Iterator over the entry numbers, in insertion order
+        """
+        return iter(range(1, len(cls.lexemes) + 1))
+
+    def __len__(cls) -> int:
+        """
+        Count the entries of the table.
+
+        Returns:
+            int: Number of entries in the table
+        """
+        return len(cls.lexemes)
+
+    def __repr__(cls) -> str:
+        """
+        Represent the table as the equivalent dictionary.
+
+        Returns:
+            str: Representation of the table, e.g. `{1: 'x', 2: 'y'}`
+        """
+        return repr(dict(zip(cls, cls.lexemes)))
+
+
+class SpanTable(SymbolTable):
+    """Custom class for symbol tables saving lexemes as spans of the source."""
+
+    __slots__ = ("source", "starts", "ends", "overflow")
+
+    def __init__(cls, source: str = "") -> None:
+        """
+        Define constructor method for the SpanTable class.
+
+        Only the offsets of the first occurrence of each lexeme are saved, and the
+        lexeme is sliced from the retained source when it is looked up. Entries are
+        indexed by the hash of their lexeme and checked against the source, so
+        repeated lexemes keep their first entry number like in a SymbolTable.
+
+        Args:
+            source (str): Source code the spans point into
+
+        Properties:
+            indices (dict): Hash index mapping the hash of each lexeme to its entry
+            source (str): Source code the spans point into
+            starts (array): Offset of the first character of every entry
+            ends (array): Offset right after the last character of every entry
+            overflow (dict): Entry number of lexemes whose hash was already taken
+        """
+        cls.indices: dict = {}
+        cls.source: str = source
+        cls.starts: array = array("I")
+        cls.ends: array = array("I")
+        cls.overflow: dict = {}
+
+    def add(cls, lexeme: Hashable) -> int:
+        """
+        Reject lexemes given as text, which have no span in the source.
+
+        Args:
+            lexeme (Hashable): The lexeme to be interned
+
+        Raises:
+            TypeError: Always raised, lexemes are added with `add_span`
+        """
+        raise TypeError("SpanTable entries are added by their span, see add_span")
+
+    def add_span(cls, start: int, end: int) -> int:
+        """
+        Intern the lexeme found between two offsets of the source.
+
+        Args:
+            start (int): Offset of the first character of the lexeme
+            end (int): Offset right after the last character of the lexeme
+
+        Returns:
+            int: Entry number of the lexeme in the table
+        """
+        lexeme = cls.source[start:end]
+        idx = cls.index(lexeme)
+        if idx is None:
+            cls.starts.append(start)
+            cls.ends.append(end)
+            idx = len(cls.starts)
+            key = hash(lexeme)
+            if key in cls.indices:
+                cls.overflow[lexeme] = idx
+            else:
+                cls.indices[key] = idx
+        return idx
+
+    def index(cls, lexeme: Hashable) -> int | None:
+        """
+        Look up the entry number of a lexeme.
+
+        Args:
+            lexeme (Hashable): The lexeme to be looked up
+
+        Returns:
+            int | None: Entry number of the lexeme, or None if it was never added
+        """
+        idx = cls.indices.get(hash(lexeme))
+        if idx is not None:
+            start = cls.starts[idx - 1]
+            if cls.ends[idx - 1] - start == len(lexeme) and cls.source.startswith(
+                lexeme, start
+            ):
+                return idx
+        return cls.overflow.get(lexeme)
+
+    def __getitem__(cls, idx: int) -> str:
+        """
+        Slice the lexeme saved under an entry number from the source.
+
+        Args:
+            idx (int): Entry number, starting from 1
+
+        Raises:
+            KeyError: Raised if there is no entry with that number
+
+        Returns:
+            str: The lexeme saved under the entry number
+        """
+        if isinstance(idx, int) and 0 < idx <= len(cls.starts):
+            return cls.source[cls.starts[idx - 1] : cls.ends[idx - 1]]
+        raise KeyError(idx)
+
+    def __iter__(cls) -> Iterator[int]:
+        """
+        Iterate over the entry numbers of the table.
+
+        Returns:
+            Iterator[int]: Iterator over the entry numbers, in insertion order
+        """
+        return iter(range(1, len(cls.starts) + 1))
+
+    def __len__(cls) -> int:
+        """
+        Count the entries of the table.
+
+        Returns:
+            int: Number of entries in the table
+        """
+        return len(cls.starts)
+
+    def __repr__(cls) -> str:
+        """
+        Represent the table as the equivalent dictionary.
+
+        Returns:
+            str: Representation of the table, e.g. `{1: '"a"', 2: '"b"'}`
+        """
+        return repr(dict(cls.items()))
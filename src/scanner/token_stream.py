@@ -0,0 +1,125 @@
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+
+
+class TokenStream(Sequence):
+    """Custom class for a compact, array-backed list of scanner tokens."""
+
+    __slots__ = ("kinds", "indices", "offsets")
+
+    def __init__(
+        cls, tokens: Iterable[tuple] = (), offsets: array | None = None
+    ) -> None:
+        """
+        Define constructor method for the TokenStream class.
+
+        Tokens are stored as a struct of arrays, and read back as the same 1-tuples
+        `(token_id,)` and 2-tuples `(token_id, entry)` produced by the scanner.
+        Source offsets are optional, a scanner saving spans shares its `starts`
+        array with its stream, see `Scanner(..., spans=True)`, so they are filled
+        as tokens are recorded without being stored twice.
+
+        Args:
+            tokens (Iterable[tuple]): Initial tokens of the stream
+            offsets (array | None): Character offset of each token, if saved
+
+        Properties:
+            kinds (array): Token identifier of each token, one byte each
+            indices (array): Symbol table entry of each token, 0 if it has none
+            offsets (array | None): Character offset of each token, if saved
+        """
+        cls.kinds: array = array("B")
+        cls.indices: array = array("I")
+        cls.offsets: array | None = offsets
+        cls.extend(tokens)
+
+    def append(cls, token: tuple) -> None:
+        """
+        Append a token to the end of the stream.
+
+        Args:
+            token (tuple): Token identifier, followed by its symbol table entry
+        """
+        cls.kinds.append(token[0])
+        cls.indices.append(token[1] if len(token) > 1 else 0)
+
+    def extend(cls, tokens: Iterable[tuple]) -> None:
+        """
+        Append every token of an iterable to the end of the stream.
+
+        Args:
+            tokens (Iterable[tuple]): Tokens to be appended
+        """
+        kinds = cls.kinds.append
+        indices = cls.indices.append
+        for token in tokens:
+            kinds(token[0])
+            indices(token[1] if len(token) > 1 else 0)
+
+    def __getitem__(cls, idx: int | slice) -> "tuple | TokenStream":
+        """
+        Retrieve a token, or a new stream for a slice of tokens.
+
+        Args:
+            idx (int | slice): Position of the token, or slice of positions
+
+        Returns:
+            tuple | TokenStream: The token at the position, or the sliced stream
+        """
+        if isinstance(idx, slice):
+            stream = TokenStream()
+            stream.kinds = cls.kinds[idx]
+            stream.indices = cls.indices[idx]
+            if cls.offsets is not None:
+                stream.offsets = cls.offsets[idx]
+            return stream
+
+        entry = cls.indices[idx]
+        return (cls.kinds[idx], entry) if entry else (cls.kinds[idx],)
+
+    def __iter__(cls) -> Iterator[tuple]:
+        """
+        Iterate over the tokens of the stream.
+
+        Yields:
+            tuple: Token identifier, followed by its symbol table entry if it has one
+        """
+        for kind, entry in zip(cls.kinds, cls.indices):
+            yield (kind, entry) if entry else (kind,)
+
+    def __len__(cls) -> int:
+        """
+        Count the tokens of the stream.
+
+        Returns:
+            int: Number of tokens in the stream
+        """
+        return len(cls.kinds)
+
+    def __eq__(cls, other: object) -> bool:
+        """
+        Compare the stream with another sequence of tokens.
+
+        Args:
+            other (object): Object to compare with
+
+        Returns:
+            bool: Whether both sequences hold the same tokens
+        """
+        if isinstance(other, TokenStream):
+            return cls.kinds == other.kinds and cls.indices == other.indices
+        if isinstance(other, Sequence):
+            return len(cls) == len(other) and all(
+                isinstance(item, tuple) and token == item
+                for token, item in zip(cls, other)
+            )
+        return NotImplemented
+
+    def __repr__(cls) -> str:
+        """
+        Represent the stream as the equivalent list of tokens.
+
+        Returns:
+            str: Representation of the stream, e.g. `[(1,), (34, 1)]`
+        """
+        return repr(list(cls))
@@ -1,3 +1,6 @@
+from itertools import product
+
+
 class Tokens:
     """Custom class for the Scanner's Token helper."""
     
@@ -17,6 +20,9 @@ class Tokens:
             token_list (list): List of tokens, ordered as per the specification
             token_list_size (int): Size of the list of tokens
             token_ids (dict): Dictionary mapping tokens and their id's
+            tokens_by_id (dict): Dictionary mapping id's and their tokens
+            keyword_ids (dict): Dictionary mapping every upper and lowercase spelling
+                                of each keyword to its id
         """
         cls.blank: dict = dict.fromkeys(["", " ", "\n", "\t", "\r"]).keys()
         cls.digits: dict = dict.fromkeys([*"0123456789"]).keys()
@@ -52,6 +58,11 @@ class Tokens:
         cls.tokens_by_id: dict = dict(
             zip(list(range(1, cls.token_list_size + 1)), cls.token_list)
         )
+        cls.keyword_ids: dict = {
+            "".join(spelling): cls.token_ids[keyword]
+            for keyword in cls.keywords
+            for spelling in product(*[(char, char.upper()) for char in keyword])
+        }
 
     def get_token_list(cls) -> list[list, list, list, list]:
         """
@@ -1,14 +1,45 @@
 import csv
+import json
 from pathlib import Path
 
 
+def unpack(packed: dict) -> list:
+    """
+    Rebuild the rows of a transition table packed by `TableCompressor`.
+
+    Args:
+        packed (dict): Packed transition table
+
+    Returns:
+        list: Next state of every state with a row, for every character class
+    """
+    rows = []
+    for number in packed["row_of"]:
+        row = []
+        for char_class in range(len(packed["keys"])):
+            slot = packed["base"][number] + char_class
+            if slot < len(packed["check"]) and packed["check"][slot] == number:
+                row.append(packed["next"][slot])
+            else:
+                row.append(packed["default"][number])
+        rows.append(row)
+    return rows
+
+
 class TransitionTable:
     """Custom class for the Scanner's transition table helper."""
     
-    def __init__(cls) -> None:
+    def __init__(cls, path: Path | None = None) -> None:
         """
         Define constructor method for the TransitionTable class.
-        
+
+        Transitions are read from `data/transitions.csv` by default. A JSON file
+        packed by `python -m src.scanner.minimize` can be loaded instead, in which
+        case the state lists saved along its rows replace the default ones.
+
+        Args:
+            path (Path | None): Path of a CSV or packed JSON transition table
+
         Properties:
             filename (str): file from where to read transitions in CSV format
             path (Path): Path object to handle paths and file opening
@@ -26,12 +57,11 @@ class TransitionTable:
             incomplete_commment (list): List of states where comments are not closed yet
             incomplete_string (int): State where strings are not closed yet
         """
-        cls.filename: str = "transitions.csv"
-        cls.path: Path = Path.cwd().joinpath("data", cls.filename)
+        cls.filename: str = path.name if path else "transitions.csv"
+        cls.path: Path = path or Path.cwd().joinpath("data", cls.filename)
         cls.accepted: list = list(range(13, 36 + 1))
         cls.error: list = [37, 38, 39, 40, 41]
         cls.consuming: list = [13, 14, 15, 16, 19, 21, 23]
-        cls.table: list = cls.generate_table()
         cls.keys: list = []
         cls.id_state: int = 13
         cls.int_state: int = 14
@@ -41,6 +71,11 @@ class TransitionTable:
         cls.active_states: list = [5, 7, 8]
         cls.incomplete_comment: list = [7, 8]
         cls.incomplete_string: int = 5
+        cls.table: list = (
+            cls.load_packed_table()
+            if cls.path.suffix == ".json"
+            else cls.generate_table()
+        )
 
     def generate_table(cls) -> list:
         """
@@ -62,6 +97,22 @@ class TransitionTable:
                 table.append(transition)
         return table
 
+    def load_packed_table(cls) -> list:
+        """
+        Unpack the rows of a transition table compressed by `TableCompressor`.
+
+        Returns
+            list: List specifying the transition table of the scanner
+        """
+        packed = json.loads(cls.path.read_text(encoding="utf-8"))
+        cls.keys = packed["keys"]
+        for name, states in packed["states"].items():
+            setattr(cls, name, states)
+        return [
+            {key: str(target) for key, target in zip(cls.keys, row)}
+            for row in unpack(packed)
+        ]
+
     def is_acceptor_state(cls, state: int) -> bool:
         """
         Check if state is acceptor.
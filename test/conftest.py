@@ -0,0 +1,32 @@
+from collections.abc import Callable
+
+import pytest
+
+from src.scanner.scanner import Scanner
+
+FILENAMES = [f"test{n}.cmm" for n in ["", *range(15)]] + ["test_syntax.cmm"]
+
+
+@pytest.fixture(params=FILENAMES)
+def filename(request: pytest.FixtureRequest) -> str:
+    """Create fixture to run a test once per example file."""
+    return request.param
+
+
+@pytest.fixture
+def filenames() -> list:
+    """Create fixture to return every example file."""
+    return list(FILENAMES)
+
+
+@pytest.fixture
+def scan() -> Callable:
+    """Create fixture to return results or error message from scan."""
+
+    def scan(scanner: Scanner) -> tuple | str:
+        try:
+            return scanner.scan()
+        except Exception as error:
+            return str(error)
+
+    return scan
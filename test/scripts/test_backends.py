@@ -0,0 +1,32 @@
+from collections.abc import Callable
+
+import pytest
+
+from src.scanner import vectorized
+from src.scanner.scanner import Scanner
+
+BACKENDS = [
+    pytest.param(
+        backend,
+        marks=pytest.mark.skipif(
+            backend == "numpy" and not vectorized.available(),
+            reason="NumPy is not installed",
+        ),
+    )
+    for backend in Scanner.backends
+    if backend != "table"
+]
+
+
+class TestBackends:
+    """Class to bundle tests for the scanner backends."""
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_same_as_table(cls, filename: str, backend: str, scan: Callable) -> None:
+        """Test that every backend gives the same tokens, tables and errors."""
+        assert scan(Scanner(filename, backend=backend)) == scan(Scanner(filename))
+
+    def test_unknown_backend(cls) -> None:
+        """Test that unsupported backends are rejected."""
+        with pytest.raises(ValueError):
+            Scanner("test1.cmm", backend="lex")
@@ -0,0 +1,82 @@
+import threading
+
+import pytest
+
+from src import batch
+from src.batch import compile_batch, compile_source
+from src.parser.cfg import CFG
+
+SOURCES = {
+    "valid": "int x; void f(void) { return; } void main(void) { f(); return; }",
+    "syntax": "void main(void) { x = ; y = ; return; }",
+    "lexical": 'void main(void) { write "open; }',
+    "trailing": "void main(void) { return; } int x;",
+}
+
+
+class TestBatch:
+    """Class to bundle tests for compiling many sources against shared tables."""
+
+    def summary(cls, results: list) -> list:
+        """Create function to keep the comparable part of the results."""
+        return [(result.name, result.success, result.errors) for result in results]
+
+    @pytest.mark.parametrize("parser", ["table", "descent"])
+    def test_same_as_serial(cls, parser: str, filenames: list) -> None:
+        """Test that threads compile every file as a serial loop does, in order."""
+        cfg = CFG()
+        serial = [compile_source(name, cfg, parser=parser) for name in filenames]
+        results = compile_batch(filenames, workers=4, parser=parser)
+        assert cls.summary(results) == cls.summary(serial)
+        assert any(result.success for result in results)
+
+    def test_in_memory(cls) -> None:
+        """Test that in-memory sources report their lexical and syntax errors."""
+        results = {
+            result.name: result
+            for result in compile_batch(SOURCES, workers=2, max_errors=10)
+        }
+        assert results["valid"].success
+        assert results["valid"].errors == []
+        assert [
+            error.split(" for production ")[-1] for error in results["syntax"].errors
+        ] == [
+            "'assignment_stmt' but received ';' instead. Found at line 1:23.",
+            "'assignment_stmt' but received ';' instead. Found at line 1:29.",
+        ]
+        assert results["lexical"].parser is None
+        assert "line 1" in results["lexical"].errors[0]
+        assert results["trailing"].errors[0].startswith(
+            "Error: Expected the end of the program"
+        )
+
+    def test_unreadable(cls) -> None:
+        """Test that a missing file is reported without losing the other results."""
+        results = compile_batch(["test0.cmm", "missing.cmm", "test1.cmm"], workers=2)
+        assert [result.success for result in results] == [True, False, True]
+        assert "No such file or directory" in results[1].errors[0]
+        assert results[1].parser is None
+
+    def test_descent_recovery(cls) -> None:
+        """Test that the descent parser cannot be asked to recover from errors."""
+        with pytest.raises(ValueError):
+            compile_batch(SOURCES, parser="descent", max_errors=10)
+        with pytest.raises(ValueError):
+            compile_batch(SOURCES, parser="dense")
+
+    def test_shared_tables(cls, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that every thread parses against the same read-only tables."""
+        seen = []
+        compile_one = batch.compile_source
+
+        def record(*args: object) -> batch.BatchResult:
+            result = compile_one(*args)
+            seen.append((threading.get_ident(), result.parser.cfg.table))
+            return result
+
+        monkeypatch.setattr(batch, "compile_source", record)
+        sources = {str(n): SOURCES["valid"] for n in range(32)}
+        results = compile_batch(sources, workers=8)
+        assert all(result.success for result in results)
+        assert len({id(table) for _, table in seen}) == 1
+        assert seen[0][1] is CFG().table
@@ -0,0 +1,85 @@
+from collections.abc import Callable
+
+import pytest
+
+from src.scanner.scanner import Scanner
+
+SOURCES = [
+    'string s;\ns = "a long\nstring";\n',
+    "int x;\n/* a comment\n over ** lines **/ x = 1; */\n",
+    "/* stars **** and / slashes * / */ int y;\n",
+    "/***/ int z; /**/\n",
+]
+
+
+class TestBodySkipping:
+    """Class to bundle tests for the fast path over strings and comments."""
+
+    @pytest.mark.parametrize("source", SOURCES)
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 8])
+    def test_chunk_boundaries(
+        cls, source: str, chunk_size: int, scan: Callable
+    ) -> None:
+        """Test that delimiters straddling two blocks close strings and comments."""
+        scanner = Scanner(source=source, chunk_size=chunk_size, spans=True)
+        reference = Scanner(source=source, backend="regex", spans=True)
+        assert scan(scanner) == scan(reference)
+        assert scanner.starts == reference.starts
+        assert scanner.lengths == reference.lengths
+
+    @pytest.mark.parametrize(
+        ("source", "message"),
+        [
+            ('int x;\nx = "open\n\n', "ERROR: Incorrectly closed string in line 2"),
+            (
+                "int x;\n\n/* open\n **/\n",
+                "ERROR: Incorrectly closed comment in line 3",
+            ),
+            ("/* ends in a star *", "ERROR: Incorrectly closed comment in line 1"),
+        ],
+    )
+    @pytest.mark.parametrize("backend", ["table", "mmap"])
+    @pytest.mark.parametrize("chunk_size", [2, 64 * 1024])
+    def test_unclosed(
+        cls,
+        source: str,
+        message: str,
+        backend: str,
+        chunk_size: int,
+        scan: Callable,
+    ) -> None:
+        """Test that unclosed strings and comments keep their error messages."""
+        scanner = Scanner(source=source, backend=backend, chunk_size=chunk_size)
+        assert scan(scanner) == message
+
+    @pytest.mark.parametrize(
+        ("opening", "buffer", "idx", "expected"),
+        [
+            ('"', '"abc" x', 1, (18, 5)),
+            ('"', '"abc', 1, (5, 4)),
+            ("/*", "/* a **/ b */ c", 2, (17, 13)),
+            ("/*", "/* a *", 2, (8, 6)),
+            ("/*", "/* a **", 2, (7, 7)),
+            ("/*", b"/* a */", 2, (17, 7)),
+        ],
+    )
+    def test_skip_body(
+        cls, opening: str, buffer: str | bytes, idx: int, expected: tuple
+    ) -> None:
+        """Test the state and offset reached after the body of a token."""
+        scanner = Scanner()
+        state = 0
+        for char in opening:
+            state = scanner.dfa.step(state, char)
+        assert scanner.skip_body(state, buffer, idx) == expected
+
+    @pytest.mark.parametrize("backend", Scanner.backends)
+    def test_drop_comments(cls, filename: str, backend: str, scan: Callable) -> None:
+        """Test that dropping comments only leaves their symbol table empty."""
+        dropped = scan(Scanner(filename, backend=backend, keep_comments=False))
+        kept = scan(Scanner(filename, backend=backend))
+        if isinstance(kept, str):
+            assert dropped == kept
+        else:
+            assert dropped[:-1] == kept[:-1]
+            assert dict(dropped[-1]) == {}
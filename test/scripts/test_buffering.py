@@ -0,0 +1,26 @@
+import pytest
+
+from src.scanner.scanner import Scanner
+
+
+class TestBuffering:
+    """Class to bundle tests for the block-buffered scanner input."""
+
+    def scan(cls, filename: str, chunk_size: int) -> tuple:
+        """Create function to return results from scan."""
+        cmm_scanner = Scanner(filename, chunk_size=chunk_size)
+        results = cmm_scanner.scan()
+        return results
+
+    @pytest.mark.parametrize("filename", ["test1.cmm", "test2.cmm", "test7.cmm"])
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 64])
+    def test_chunk_boundaries(cls, filename: str, chunk_size: int) -> None:
+        """Test that tokens straddling two blocks are scanned like any other."""
+        assert cls.scan(filename, chunk_size) == cls.scan(filename, 64 * 1024)
+
+    @pytest.mark.parametrize("chunk_size", [1, 5])
+    def test_line_count(cls, chunk_size: int) -> None:
+        """Test that line numbers are preserved across blocks."""
+        with pytest.raises(Exception) as error:
+            cls.scan("test12.cmm", chunk_size)
+        assert str(error.value) == "ERROR: Invalid character after '!' found at line 5"
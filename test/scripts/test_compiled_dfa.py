@@ -0,0 +1,73 @@
+import pytest
+
+from src.scanner.compiled_dfa import CompiledDFA
+from src.scanner.tokens import Tokens
+from src.scanner.transition_table import TransitionTable
+
+
+@pytest.fixture(scope="class")
+def _dfa(request: pytest.FixtureRequest) -> None:
+    """Fixture function to share the compiled automaton to class."""
+    request.cls.automaton = TransitionTable()
+    request.cls.token_helper = Tokens()
+    request.cls.dfa = CompiledDFA(request.cls.automaton, request.cls.token_helper)
+
+
+@pytest.mark.usefixtures("_dfa")
+class TestCompiledDFA:
+    """Class to bundle tests for the integer-coded automaton."""
+
+    def test_char_classes(cls) -> None:
+        """Test that characters are classified like in the token helper."""
+        for char in ["", *map(chr, range(300)), "…"]:
+            name = cls.token_helper.identify_char(char)
+            assert cls.dfa.classes[cls.dfa.char_class(char)] == name
+
+    def test_transitions(cls) -> None:
+        """Test that every transition matches the CSV transition table."""
+        for state, row in enumerate(cls.automaton.table):
+            for char in ["a", "7", " ", "", *'+-*/<>=!;,."()[]{}', "@"]:
+                name = cls.token_helper.identify_char(char)
+                assert cls.dfa.step(state, char) == int(row[name])
+
+    def test_flags(cls) -> None:
+        """Test that state flags answer like the transition table predicates."""
+        predicates = [
+            "is_acceptor_state",
+            "is_error_state",
+            "is_consuming_state",
+            "is_active_state",
+            "is_incomplete_comment",
+            "is_incomplete_string",
+        ]
+        for state in range(cls.dfa.num_states):
+            for predicate in predicates:
+                expected = getattr(cls.automaton, predicate)(state)
+                assert getattr(cls.dfa, predicate)(state) == expected
+
+    def test_token_ids(cls) -> None:
+        """Test that only the accepting state of each fixed symbol has a token id."""
+        symbols = {
+            cls.token_helper.tokens_by_id[token_id]
+            for token_id in cls.dfa.token_ids
+            if token_id
+        }
+        assert len(symbols) == sum(1 for token_id in cls.dfa.token_ids if token_id)
+        # Quotes open strings, and dots and exclamation marks are never accepted alone
+        expected = {*cls.token_helper.special_characters} - {'"', ".", "!"}
+        assert symbols == expected | {*cls.token_helper.complex_characters}
+        for state in cls.automaton.accepted:
+            assert bool(cls.dfa.token_ids[state]) != (
+                cls.automaton.is_identifier(state)
+                or cls.automaton.is_integer(state)
+                or cls.automaton.is_float(state)
+                or cls.automaton.is_string(state)
+                or cls.automaton.is_comment(state)
+            )
+
+    @pytest.mark.parametrize("spelling", ["while", "WHILE", "wHiLe", "If", "iF"])
+    def test_keyword_ids(cls, spelling: str) -> None:
+        """Test that every spelling of a keyword maps to the lowercase keyword id."""
+        token_ids = cls.token_helper.token_ids
+        assert cls.token_helper.keyword_ids[spelling] == token_ids[spelling.lower()]
+        assert "whiles" not in cls.token_helper.keyword_ids
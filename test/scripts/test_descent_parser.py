@@ -0,0 +1,64 @@
+from pathlib import Path
+
+import pytest
+
+from src.parser import codegen
+from src.parser.cfg import CFG
+from src.parser.parser import DescentParser, Parser
+from src.scanner.scanner import Scanner
+
+
+class TestDescentParser:
+    """Class to bundle tests for the generated recursive descent parser."""
+
+    def parse(
+        cls, parser_class: type, source: str | None = None, filename: str = ""
+    ) -> object:
+        """Create function to return the parse result or its error message."""
+        try:
+            cmm_scanner = Scanner(filename, source=source, spans=True)
+            cmm_scanner.scan()
+            return parser_class(cmm_scanner, CFG()).parse()
+        except Exception as error:
+            return f"{type(error).__name__}: {error}"
+
+    def test_same_as_table(cls, filename: str) -> None:
+        """Test that both parsers accept and reject the same files, alike."""
+        assert cls.parse(DescentParser, filename=filename) == cls.parse(
+            Parser, filename=filename
+        )
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "void main(void) { return; }",
+            "int x; void f(void) { return; } void main(void) { f(); return; }",
+            "void main(void) { return; } int x;",
+            "int main(void) { return 0; }",
+            "void f(void) { return; }",
+            "void main(int x) { return; }",
+            "void main(void) { read x + 1; return; }",
+            "void main(void) { if (x) y = 1; else y = 2; return; }",
+        ],
+    )
+    def test_main_rule(cls, source: str) -> None:
+        """Test that only programs ending with the main function are accepted."""
+        assert cls.parse(DescentParser, source) == cls.parse(Parser, source)
+
+    def test_deep_nesting(cls) -> None:
+        """Test that programs too deep for recursion are still parsed."""
+        nested = "(" * 2000 + "1" + ")" * 2000
+        assert cls.parse(DescentParser, f"void main(void) {{ x = {nested}; return; }}")
+
+    def test_regenerate_when_stale(
+        cls, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test that a module generated from another grammar is replaced."""
+        path = tmp_path / "recursive_descent.py"
+        path.write_text('SOURCE_HASH = "stale"\n', encoding="utf-8")
+        monkeypatch.setattr(codegen, "MODULE_PATH", path)
+
+        cfg = CFG()
+        module = codegen.load_descent_parser(cfg)
+        assert module.SOURCE_HASH == codegen.source_hash(cfg)
+        assert module.SOURCE_HASH in path.read_text(encoding="utf-8")
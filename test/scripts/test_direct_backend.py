@@ -0,0 +1,25 @@
+from pathlib import Path
+
+import pytest
+
+from src.scanner import codegen
+from src.scanner.tokens import Tokens
+from src.scanner.transition_table import TransitionTable
+
+
+class TestDirectBackend:
+    """Class to bundle tests for the generated direct-coded scanner backend."""
+
+    def test_regenerate_when_stale(
+        cls, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test that a module generated from another table is replaced."""
+        path = tmp_path / "direct_dfa.py"
+        path.write_text('SOURCE_HASH = "stale"\n', encoding="utf-8")
+        monkeypatch.setattr(codegen, "MODULE_PATH", path)
+
+        automaton = TransitionTable()
+        token_helper = Tokens()
+        module = codegen.load_direct_scanner(automaton, token_helper)
+        assert module.SOURCE_HASH == codegen.source_hash(automaton, token_helper)
+        assert module.SOURCE_HASH in path.read_text(encoding="utf-8")
@@ -0,0 +1,94 @@
+from pathlib import Path
+
+import pytest
+
+from src.parser.analysis import GrammarAnalysis
+from src.parser.cfg import CFG
+
+# Expression grammar from "Engineering a Compiler", right recursive
+EXPRESSIONS = """goal->expr
+expr->term expr'
+expr'->+ term expr' | - term expr' | ε
+term->factor term'
+term'->* factor term' | / factor term' | ε
+factor->( expr ) | num | name"""
+
+DANGLING_ELSE = """stmt->if expr then stmt else_part | other
+else_part->else stmt | ε
+expr->cond"""
+
+
+class TestGrammarAnalysis:
+    """Class to bundle tests for the FIRST, FOLLOW and FIRST+ computation."""
+
+    def analyze(cls, text: str, tmp_path: Path) -> GrammarAnalysis:
+        """Create function to analyze a grammar written to a temporary file."""
+        path = tmp_path.joinpath("grammar.txt")
+        path.write_text(text, encoding="utf-8")
+        return GrammarAnalysis(path)
+
+    @pytest.mark.parametrize(
+        ("nt", "first", "follow"),
+        [
+            ("goal", ["(", "name", "num"], ["$"]),
+            ("expr", ["(", "name", "num"], [")", "$"]),
+            ("expr'", ["+", "-"], [")", "$"]),
+            ("term", ["(", "name", "num"], [")", "+", "-", "$"]),
+            ("term'", ["*", "/"], [")", "+", "-", "$"]),
+            ("factor", ["(", "name", "num"], [")", "*", "+", "-", "/", "$"]),
+        ],
+    )
+    def test_first_follow(
+        cls, nt: str, first: list, follow: list, tmp_path: Path
+    ) -> None:
+        """Test the FIRST and FOLLOW sets of the classic expression grammar."""
+        analysis = cls.analyze(EXPRESSIONS, tmp_path)
+        code = analysis.non_terminals.index(nt)
+        assert analysis.terminal_names(analysis.first[code]) == first
+        assert analysis.terminal_names(analysis.follow[code]) == follow
+        assert bool(analysis.nullable >> code & 1) == nt.endswith("'")
+
+    def test_first_plus(cls, tmp_path: Path) -> None:
+        """Test that ε productions are predicted by the FOLLOW set."""
+        analysis = cls.analyze(EXPRESSIONS, tmp_path)
+        table = analysis.create_table()
+        assert analysis.conflicts == []
+        assert analysis.production(5) == "expr'->ε"
+        assert analysis.terminal_names(analysis.first_plus[4]) == [")", "$"]
+        assert table["expr'"]["+"] == 3
+        assert table["expr'"][")"] == 5
+        assert table["expr'"]["num"] == "ERROR"
+
+    def test_conflicts(cls, tmp_path: Path) -> None:
+        """Test that conflicts are reported and given to the earliest production."""
+        analysis = cls.analyze(DANGLING_ELSE, tmp_path)
+        table = analysis.create_table()
+        assert analysis.conflicts == [("else_part", "else", [3, 4])]
+        assert table["else_part"]["else"] == 3
+        assert table["else_part"]["$"] == 4
+        assert "else_part on 'else'" in analysis.report()
+
+    def test_language(cls) -> None:
+        """Test that only the expected conflicts are found in the C-- grammar."""
+        grammar = CFG(precompiled=False)
+        assert [conflict[:2] for conflict in grammar.conflicts] == [
+            ("declaration_list", "void"),
+            ("selection_stmt", "else"),
+        ]
+        assert grammar.rhs_productions[3] == ["ε"]
+        assert grammar.table["declaration_list"]["void"] == 2
+        assert grammar.table["statement_list"]["return"] == 24
+
+    def test_coded_table(cls) -> None:
+        """Test that the flat integer-coded table matches the named table."""
+        grammar = CFG(precompiled=False)
+        names = grammar.symbol_names
+        for code, nt in enumerate(grammar.ordered_nt, start=grammar.num_terminals):
+            assert names[code] == nt
+            offset = grammar.row_offsets[code - grammar.num_terminals]
+            for terminal, production in grammar.table[nt].items():
+                cell = grammar.cells[offset + grammar.symbol_codes[terminal]]
+                assert cell == (0 if production == "ERROR" else production)
+        for number, rhs in grammar.rhs_productions.items():
+            symbols = [names[code] for code in grammar.reversed_rhs[number][::-1]]
+            assert symbols == [symbol for symbol in rhs if symbol != "ε"]
@@ -0,0 +1,92 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from src.scanner.incremental import IncrementalScanner
+from src.scanner.scanner import Scanner
+
+SOURCE = """int x;
+/* a comment
+   over two lines */
+float y;
+void main(void) {
+    x = 1;
+    write "hello";
+    y = x * 2.5;
+    return;
+}
+"""
+
+
+class TestIncremental:
+    """Class to bundle tests for the incremental rescanning of edited sources."""
+
+    def edit(
+        cls, scanner: IncrementalScanner, start: int, end: int, text: str
+    ) -> tuple | str:
+        """Create function to return results or error message from edit."""
+        try:
+            return scanner.edit(start, end, text)
+        except Exception as error:
+            return str(error)
+
+    def fresh(cls, text: str, path: Path) -> Scanner:
+        """Create function to write a whole source, to be scanned from scratch."""
+        path.write_text(text, encoding="utf-8")
+        return Scanner(path)
+
+    @pytest.mark.parametrize(
+        ("old", "new"),
+        [
+            ("x = 1;", "x = 1; z = 3;"),
+            ("x = 1;", "z = 1;"),
+            ("int x;", "int x; /* new"),
+            ("/* a comment", "a comment"),
+            ("   over two lines */", "   over */ two lines */"),
+            ('write "hello";', 'write "hello;'),
+            ('write "hello";', 'write "hel\nlo";'),
+            ("y = x * 2.5;", "y = x * 2.;"),
+            ("return;", "RETURN;"),
+            ("float y;\n", ""),
+        ],
+    )
+    def test_same_as_full_scan(
+        cls, old: str, new: str, tmp_path: Path, scan: Callable
+    ) -> None:
+        """Test that a single edit gives the same results as a whole scan."""
+        path = tmp_path / "source.cmm"
+        path.write_text(SOURCE, encoding="utf-8")
+        scanner = IncrementalScanner(path)
+        scanner.scan()
+
+        start = SOURCE.index(old)
+        text = SOURCE.replace(old, new, 1)
+        assert cls.edit(scanner, start, start + len(old), new) == scan(
+            cls.fresh(text, path)
+        )
+
+    def test_edits_after_error(cls, tmp_path: Path, scan: Callable) -> None:
+        """Test that editing keeps working after an edit with a lexical error."""
+        path = tmp_path / "source.cmm"
+        path.write_text(SOURCE, encoding="utf-8")
+        scanner = IncrementalScanner(path)
+        scanner.scan()
+
+        start = SOURCE.index("x = 1;")
+        assert cls.edit(scanner, start, start, "@") == (
+            "ERROR: Invalid character found at line 6"
+        )
+        assert scanner.edit(start, start + 1, "") == scan(cls.fresh(SOURCE, path))
+
+    @pytest.mark.parametrize("filename", ["test.cmm", "test3.cmm", "test6.cmm"])
+    def test_checkpoints(cls, filename: str) -> None:
+        """Test that checkpoints are saved at every line start with their state."""
+        scanner = IncrementalScanner(filename)
+        scanner.scan()
+        text = scanner.text
+        assert scanner.offsets == [0] + [
+            idx + 1 for idx, char in enumerate(text) if char == "\n"
+        ]
+        assert set(scanner.states) <= {0, 5, 7}
+        assert len(scanner.records) >= len(scanner.output)
@@ -0,0 +1,88 @@
+from pathlib import Path
+
+import pytest
+
+from src import language_tables
+from src.parser.cfg import CFG
+from src.scanner.compiled_dfa import CompiledDFA
+from src.scanner.scanner import Scanner
+from src.scanner.tokens import Tokens
+from src.scanner.transition_table import TransitionTable
+
+
+class TestLanguageTables:
+    """Class to bundle tests for the precompiled language tables artifact."""
+
+    def test_freeze_thaw(cls) -> None:
+        """Test that thawed objects keep every attribute of the frozen ones."""
+        automaton = TransitionTable()
+        thawed = language_tables.thaw(
+            TransitionTable.__new__(TransitionTable), language_tables.freeze(automaton)
+        )
+        assert vars(thawed).keys() == vars(automaton).keys()
+        for name, value in vars(automaton).items():
+            restored = getattr(thawed, name)
+            assert type(restored) is type(value)
+            if isinstance(value, language_tables.DICT_KEYS):
+                assert list(restored) == list(value)
+            else:
+                assert restored == value
+
+    def test_scanner_tables(cls) -> None:
+        """Test that scanners get the same tables as building them from the data."""
+        scanner = Scanner()
+        token_helper = Tokens()
+        automaton = TransitionTable()
+        dfa = CompiledDFA(automaton, token_helper)
+        assert scanner.token_helper.token_ids == token_helper.token_ids
+        assert scanner.token_helper.keyword_ids == token_helper.keyword_ids
+        assert scanner.automaton.table == automaton.table
+        assert scanner.dfa.transitions == dfa.transitions
+        assert scanner.dfa.flags == dfa.flags
+        assert scanner.dfa.token_ids == dfa.token_ids
+        assert scanner.dfa.char_classes == dfa.char_classes
+
+    def test_grammar(cls) -> None:
+        """Test that grammars get the same tables as building them from the data."""
+        grammar = CFG()
+        built = CFG(precompiled=False)
+        assert grammar.table == built.table
+        assert grammar.ordered_nt == built.ordered_nt
+        assert grammar.rhs_productions == built.rhs_productions
+
+    def test_read_only(cls) -> None:
+        """Test that objects loaded from the artifact share read-only tables."""
+        first, second = CFG(), CFG()
+        assert first.table is second.table
+        with pytest.raises(TypeError):
+            first.table["declaration_list"]["void"] = 3
+        with pytest.raises(TypeError):
+            first.cells[0] = 1
+        with pytest.raises(TypeError):
+            first.reversed_rhs.append(())
+
+        scanner = Scanner()
+        assert scanner.dfa.flags is Scanner().dfa.flags
+        with pytest.raises(TypeError):
+            scanner.token_helper.token_ids["ID"] = 0
+        with pytest.raises(TypeError):
+            scanner.automaton.table[0]["x"] = 0
+        assert scanner.token_helper.delimiters == Tokens().delimiters
+
+    def test_rebuild(cls, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a missing or stale artifact is rebuilt and saved."""
+        path = tmp_path.joinpath("language_tables.marshal")
+        monkeypatch.setattr(language_tables, "ARTIFACT_PATH", path)
+        monkeypatch.setattr(language_tables, "_loaded", {})
+        artifact = language_tables.load()
+        assert path.exists()
+        assert artifact["hash"] == language_tables.sources_hash()
+
+        path.write_bytes(b"stale")
+        monkeypatch.setattr(language_tables, "_loaded", {})
+        assert language_tables.load() == artifact
+        assert path.read_bytes() != b"stale"
+
+        monkeypatch.setattr(language_tables, "sources_hash", lambda: "changed")
+        monkeypatch.setattr(language_tables, "_loaded", {})
+        assert language_tables.load()["hash"] == "changed"
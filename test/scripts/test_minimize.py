@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from src.scanner.compiled_dfa import CompiledDFA
+from src.scanner.minimize import PACKED_PATH, TableCompressor
+from src.scanner.tokens import Tokens
+from src.scanner.transition_table import TransitionTable, unpack
+
+
+class TestMinimize:
+    """Class to bundle tests for the automaton minimization and table packing."""
+
+    def test_already_minimal(cls) -> None:
+        """Test that no state of the hand-written automaton is merged."""
+        compressor = TableCompressor(TransitionTable())
+        assert compressor.minimize() == list(range(compressor.num_states))
+
+    def test_merge_equivalent_states(cls) -> None:
+        """Test that states with equal categories and moves are merged."""
+        automaton = TransitionTable()
+        # Make '>' behave like '<', so both states become equivalent
+        automaton.table[10] = dict(automaton.table[9])
+        compressor = TableCompressor(automaton)
+        renumber = compressor.minimize()
+        assert renumber[9] == renumber[10] == 9
+        assert renumber[11] == 10
+        assert renumber[0] == 0
+        assert max(renumber) == compressor.num_states - 2
+
+        packed = compressor.compress()
+        assert len(unpack(packed)) == len(automaton.table) - 1
+        assert packed["states"]["error"] == [error - 1 for error in automaton.error]
+
+    def test_categories_are_kept(cls) -> None:
+        """Test that final states are never merged, even with the same moves."""
+        automaton = TransitionTable()
+        compressor = TableCompressor(automaton)
+        categories = {compressor.category(state) for state in automaton.accepted}
+        assert len(categories) == len(automaton.accepted)
+
+    def test_round_trip(cls) -> None:
+        """Test that the packed rows unpack to the original transition table."""
+        automaton = TransitionTable()
+        packed = TableCompressor(automaton).compress()
+        rows = [[int(row[key]) for key in automaton.keys] for row in automaton.table]
+        assert unpack(packed) == rows
+        assert len(packed["next"]) < len(rows) * len(automaton.keys)
+
+    def test_packed_file_is_current(cls) -> None:
+        """Test that the packed file matches the CSV transition table."""
+        packed = json.loads(PACKED_PATH.read_text(encoding="utf-8"))
+        assert packed == TableCompressor(TransitionTable()).compress()
+
+    @pytest.mark.parametrize("attribute", ["transitions", "flags", "token_ids"])
+    def test_load_packed(cls, attribute: str) -> None:
+        """Test that the packed table compiles to the same automaton."""
+        csv_dfa = CompiledDFA(TransitionTable(), Tokens())
+        packed_dfa = CompiledDFA(TransitionTable(PACKED_PATH), Tokens())
+        assert getattr(packed_dfa, attribute) == getattr(csv_dfa, attribute)
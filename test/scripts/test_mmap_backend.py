@@ -0,0 +1,61 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from src.scanner.errors import ScanError
+from src.scanner.scanner import Scanner
+
+
+class TestMmapBackend:
+    """Class to bundle tests for the memory-mapped bytes scanner backend."""
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            b"",
+            b'int x;\r\n/* a\r\n b */ x = "a\r\nb";\r\n',
+            b'string s;\ns = "\xc3\xb1and\xc3\xba";\n/* \xe2\x80\xa6 */ s = 1.5;\n',
+            b"float y;\ny = 1.5;\n \xc3\xa9",
+        ],
+        ids=["empty", "crlf", "non-ascii", "non-ascii error"],
+    )
+    def test_fallbacks(cls, source: bytes, tmp_path: Path, scan: Callable) -> None:
+        """Test sources that are copied, or have multi-byte characters."""
+        path = tmp_path / "source.cmm"
+        path.write_bytes(source)
+        assert scan(Scanner(path, backend="mmap")) == scan(Scanner(path))
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            'string s;\ns = "\u00f1and\u00fa"; /* \u2026 */ s = "\U0001f600";\n',
+            "int x;\n/* caf\u00e9 */ x = 1; /* \u2026 ** */ y = x;\n",
+            'int x;\n/* \u00e9 */ x = "\u00fc;\n',
+            'string s;\ns = "\u00e9"; s = 1 \u00e9;\n',
+        ],
+        ids=["strings", "comments", "unclosed string", "invalid character"],
+    )
+    def test_non_ascii_bodies(
+        cls, source: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that non-ASCII bodies are scanned from bytes, at character offsets."""
+        path = tmp_path / "source.cmm"
+        path.write_text(source, encoding="utf-8")
+
+        def table_tokens() -> None:
+            raise AssertionError("The table backend was used")
+
+        scanners = [
+            Scanner(path, spans=True),
+            Scanner(path, backend="mmap", spans=True),
+        ]
+        monkeypatch.setattr(scanners[1], "table_tokens", table_tokens)
+        results = []
+        for scanner in scanners:
+            try:
+                results.append(scanner.scan())
+            except ScanError as error:
+                results.append((str(error), error.line, error.column, error.offset))
+            results.append((scanner.starts, scanner.lengths))
+        assert results[2:] == results[:2]
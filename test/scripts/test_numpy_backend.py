@@ -0,0 +1,37 @@
+from pathlib import Path
+
+import pytest
+
+from src.scanner import vectorized
+from src.scanner.scanner import Scanner
+
+
+class TestNumpyBackend:
+    """Class to bundle tests for the NumPy-vectorized scanner backend."""
+
+    @pytest.mark.skipif(not vectorized.available(), reason="NumPy is not installed")
+    @pytest.mark.parametrize(
+        "source",
+        [b'int x;\r\n/* a\r\n b */ x = "\xc3\xb1";\r\n', b"float y;\r\ny = 1.5;\r\n @"],
+    )
+    def test_newlines_and_utf8(cls, source: bytes, tmp_path: Path) -> None:
+        """Test that newlines are normalized and non-ASCII text is decoded."""
+        path = tmp_path / "source.cmm"
+        path.write_bytes(source)
+        results = []
+        for backend in ["numpy", "table"]:
+            scanner = Scanner(path, backend=backend)
+            try:
+                results.append(scanner.scan())
+            except Exception as error:
+                results.append(str(error))
+        assert results[0] == results[1]
+
+    def test_fallback_without_numpy(cls, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the table backend is used when NumPy is missing."""
+        monkeypatch.setattr(vectorized, "np", None)
+        with pytest.warns(RuntimeWarning):
+            scanner = Scanner("test0.cmm", backend="numpy")
+        assert scanner.backend == "table"
+        assert scanner.vectorized is None
+        assert scanner.scan() == Scanner("test0.cmm").scan()
@@ -0,0 +1,39 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from benchmarks.source import generate_source
+from src.scanner.parallel import ParallelScanner, split_points
+from src.scanner.scanner import Scanner
+
+
+class TestParallel:
+    """Class to bundle tests for the parallel scan of a single source file."""
+
+    def test_same_as_serial(cls, filename: str, scan: Callable) -> None:
+        """Test that tokens, symbol table numbering and errors match a serial scan."""
+        parallel = ParallelScanner(filename, workers=3, min_chunk_size=1)
+        assert scan(parallel) == scan(Scanner(filename))
+
+    def test_generated_source(cls, tmp_path: Path) -> None:
+        """Test a source split in many chunks that share symbols."""
+        path = tmp_path / "generated.cmm"
+        path.write_text(generate_source(20_000, unique=False), encoding="utf-8")
+        serial = Scanner(path)
+        parallel = ParallelScanner(path, workers=4, min_chunk_size=1)
+        assert len(split_points(path.read_bytes(), 4)) == 4
+        assert parallel.scan() == serial.scan()
+
+    @pytest.mark.parametrize(
+        ("source", "points"),
+        [
+            (b"a;\nb;\nc;\n", [0, 3, 6]),
+            (b'a;\n"b\nc";\nd;\n', [0, 3, 10]),
+            (b"a;\n/* b\n**/ c\n*/ d;\ne;\n", [0, 3, 20]),
+            (b"a;\n/* b\nc;\nd;\n", [0, 3]),
+        ],
+    )
+    def test_split_points(cls, source: bytes, points: list) -> None:
+        """Test that chunks never start inside strings or comments."""
+        assert split_points(source, len(source)) == points
@@ -0,0 +1,135 @@
+import random
+
+import pytest
+
+from src.parser.cfg import CFG
+from src.parser.parser import Parser
+from src.scanner.scanner import Scanner
+
+PROGRAM = "void f(void) { return; }\nvoid main(void) { x = f(a, 1); return; }\n"
+BROKEN = "void main(void) { x = a + ; y = ; read x + 1; z = 1; return; }"
+WORDS = "int void if else while read write return ( ) [ ] { } ; , = + < x main 1"
+
+
+class TestParser:
+    """Class to bundle tests for the integer-coded LL(1) parser core."""
+
+    def parse(cls, source: str, cfg: CFG) -> bool | str:
+        """Create function to return the parse result or its error message."""
+        cmm_scanner = Scanner(source=source)
+        cmm_scanner.scan()
+        try:
+            return Parser(cmm_scanner, cfg).parse()
+        except Exception as error:
+            return str(error)
+
+    def test_reuse_grammar(cls) -> None:
+        """Test that a grammar is left untouched for the next parse."""
+        cfg = CFG()
+        table = cfg.cells.tobytes()
+        assert cls.parse(PROGRAM, cfg) is True
+        assert cls.parse(PROGRAM, cfg) is True
+        assert cfg.cells.tobytes() == table
+
+    @pytest.mark.parametrize(
+        ("source", "message"),
+        [
+            (
+                "void main(void) { x = a + ; return; }",
+                "Error: Expected one of ['(', 'FLOAT', 'ID', 'INTEGER'] for production"
+                " 'term' but received ';' instead.",
+            ),
+            (
+                "void main(void) { return 1 }",
+                "Error: ; is not a non-terminal symbol in production ;. Expected ';' "
+                "but received 'INTEGER' instead. ",
+            ),
+            (
+                "void main(void) { read x + 1; return; }",
+                "Error: Expected one of [';', '=', '['] for production 'var' but "
+                "received '+' instead.",
+            ),
+        ],
+    )
+    def test_error_names(cls, source: str, message: str) -> None:
+        """Test that error messages name symbols instead of their codes."""
+        assert cls.parse(source, CFG()) == message
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "void main(void) { x = a + ; return; }",
+            "void main(void) { return 1 }",
+            "void main(void) { read x + 1; return; }",
+        ],
+    )
+    def test_first_diagnostic(cls, source: str) -> None:
+        """Test that recovering reports the error that would have been raised."""
+        cmm_scanner = Scanner(source=source)
+        cmm_scanner.scan()
+        parser = Parser(cmm_scanner, CFG())
+        assert not parser.parse(max_errors=10)
+        assert parser.diagnostics[0] == cls.parse(source, CFG())
+
+    def test_recovery(cls) -> None:
+        """Test that every error of a program is found in one pass."""
+        cmm_scanner = Scanner(source=BROKEN)
+        cmm_scanner.scan()
+        parser = Parser(cmm_scanner, CFG())
+        assert not parser.parse(max_errors=10)
+        assert [
+            message.split(" for production ")[-1] for message in parser.diagnostics
+        ] == [
+            "'term' but received ';' instead.",
+            "'assignment_stmt' but received ';' instead.",
+            "'var' but received '+' instead.",
+        ]
+        assert not parser.parse(max_errors=2)
+        assert len(parser.diagnostics) == 2
+
+        cmm_scanner = Scanner(source=PROGRAM)
+        cmm_scanner.scan()
+        parser = Parser(cmm_scanner, CFG())
+        assert parser.parse(max_errors=10) is True
+        assert parser.diagnostics == []
+
+    @pytest.mark.parametrize(
+        ("source", "errors"),
+        [
+            (
+                "void main(void) { x = ; y = ; return; }",
+                [
+                    "'assignment_stmt' but received ';' instead.",
+                    "'assignment_stmt' but received ';' instead.",
+                ],
+            ),
+            (
+                "void main(void) { if (x) { y = 2 } z = ; return; }",
+                [
+                    "'term'' but received '}' instead.",
+                    "'assignment_stmt' but received ';' instead.",
+                ],
+            ),
+        ],
+    )
+    def test_recovery_statements(cls, source: str, errors: list) -> None:
+        """Test that recovery resumes at the next statement or closing brace."""
+        cmm_scanner = Scanner(source=source)
+        cmm_scanner.scan()
+        parser = Parser(cmm_scanner, CFG())
+        assert not parser.parse(max_errors=10)
+        assert [
+            message.split(" for production ")[-1] for message in parser.diagnostics
+        ] == errors
+
+    def test_recovery_ends(cls) -> None:
+        """Test that recovery always ends, whatever the tokens are."""
+        cfg = CFG()
+        generator = random.Random(23)
+        for _ in range(200):
+            words = generator.choices(WORDS.split(), k=generator.randint(0, 40))
+            cmm_scanner = Scanner(source=" ".join(words))
+            cmm_scanner.scan()
+            parser = Parser(cmm_scanner, cfg)
+            parser.parse(max_errors=5)
+            assert len(parser.diagnostics) <= 5
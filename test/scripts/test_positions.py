@@ -0,0 +1,71 @@
+import pickle
+
+import pytest
+
+from src.parser.cfg import CFG
+from src.parser.parser import Parser
+from src.scanner.errors import ScanError
+from src.scanner.line_index import LineIndex
+from src.scanner.scanner import Scanner
+
+
+class TestPositions:
+    """Class to bundle tests for token spans and error positions."""
+
+    def test_line_index(cls) -> None:
+        """Test that offsets are resolved to lines and columns."""
+        lines = LineIndex("int x;\n\nfloat y;\n")
+        assert list(lines.starts) == [0, 7, 8, 17]
+        assert lines.locate(0) == (1, 1)
+        assert lines.locate(6) == (1, 7)
+        assert lines.locate(7) == (2, 1)
+        assert lines.locate(14) == (3, 7)
+        assert lines.line(17) == 4
+
+    @pytest.mark.parametrize("backend", Scanner.backends)
+    def test_spans(cls, backend: str) -> None:
+        """Test that every backend saves the characters of every output token."""
+        scanner = Scanner("test3.cmm", backend=backend, spans=True)
+        output = scanner.scan()[0]
+        text = scanner.path.read_text(encoding="utf-8")
+        spans = zip(scanner.starts, scanner.lengths)
+        lexemes = [text[start : start + length] for start, length in spans]
+        assert len(lexemes) == len(output)
+        assert lexemes[:4] == ["int", "miniloc", "(", "float"]
+        assert scanner.location(1) == (1, 5)
+
+    @pytest.mark.parametrize("backend", Scanner.backends)
+    @pytest.mark.parametrize(
+        ("filename", "message", "location"),
+        [
+            ("test8.cmm", "ERROR: Invalid character found at line 1", "1:11"),
+            ("test11.cmm", "ERROR: Invalid complex symbol found at line 5", "5:12"),
+            ("test13.cmm", "ERROR: Incorrectly closed string in line 1", "1:1"),
+        ],
+    )
+    def test_error_location(
+        cls, backend: str, filename: str, message: str, location: str
+    ) -> None:
+        """Test that lexical errors keep their message and know their column."""
+        with pytest.raises(ScanError) as error:
+            Scanner(filename, backend=backend).scan()
+        assert str(error.value) == message
+        assert error.value.location == location
+
+    def test_error_pickle(cls) -> None:
+        """Test that errors keep their position when sent to another process."""
+        error = pickle.loads(pickle.dumps(ScanError("ERROR: message", 3, 4, 20)))
+        assert (str(error), error.line, error.column, error.offset) == (
+            "ERROR: message",
+            3,
+            4,
+            20,
+        )
+
+    def test_parser_location(cls) -> None:
+        """Test that syntax errors report the line and column of the token."""
+        cmm_scanner = Scanner("test14.cmm", spans=True)
+        cmm_parser = Parser(cmm_scanner, CFG())
+        with pytest.raises(Exception) as error:
+            cmm_parser.parse(tokens=cmm_scanner.tokens())
+        assert str(error.value).endswith("Found at line 4:9.")
@@ -0,0 +1,52 @@
+import io
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from src.scanner.scanner import Scanner
+
+EXAMPLE = Path.cwd().joinpath("test", "examples", "test3.cmm")
+
+
+class TestSources:
+    """Class to bundle tests for scanning sources that are not example files."""
+
+    @pytest.mark.parametrize("backend", Scanner.backends)
+    @pytest.mark.parametrize(
+        "source",
+        [
+            lambda: EXAMPLE.read_text(encoding="utf-8"),
+            lambda: EXAMPLE.read_bytes(),
+            lambda: memoryview(EXAMPLE.read_bytes()),
+            lambda: io.BytesIO(EXAMPLE.read_bytes()),
+            lambda: io.StringIO(EXAMPLE.read_text(encoding="utf-8")),
+        ],
+        ids=["str", "bytes", "memoryview", "binary stream", "text stream"],
+    )
+    def test_in_memory(cls, backend: str, source: Callable, scan: Callable) -> None:
+        """Test that in-memory sources give the same results as the file."""
+        scanner = Scanner(source=source(), backend=backend)
+        assert scanner.path is None
+        assert scan(scanner) == Scanner("test3.cmm", backend=backend).scan()
+
+    def test_path(cls) -> None:
+        """Test that a path object is read from anywhere, keeping its name."""
+        scanner = Scanner(EXAMPLE)
+        assert scanner.filename == "test3.cmm"
+        assert scanner.scan() == Scanner("test3.cmm").scan()
+
+    def test_open_file(cls) -> None:
+        """Test that an open binary file is read like the file itself."""
+        with EXAMPLE.open("rb") as file:
+            scanner = Scanner("test3.cmm", source=file)
+        assert scanner.scan() == Scanner("test3.cmm").scan()
+
+    @pytest.mark.parametrize("backend", Scanner.backends)
+    def test_newlines_and_errors(cls, backend: str) -> None:
+        """Test that newlines are normalized and errors know their position."""
+        scanner = Scanner(source="int x;\r\n\r\nx = 1;\r@", backend=backend)
+        with pytest.raises(Exception) as error:
+            scanner.scan()
+        assert str(error.value) == "ERROR: Invalid character found at line 4"
+        assert error.value.location == "4:1"
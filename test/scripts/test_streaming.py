@@ -0,0 +1,38 @@
+import pytest
+
+from src.parser.cfg import CFG
+from src.parser.parser import Parser
+from src.scanner.scanner import Scanner
+
+
+class TestStreaming:
+    """Class to bundle tests for the streaming token API."""
+
+    @pytest.mark.parametrize("filename", ["test0.cmm", "test1.cmm", "test7.cmm"])
+    def test_tokens_match_scan(cls, filename: str) -> None:
+        """Test that the token generator yields the scan output."""
+        streamed = Scanner(filename)
+        tokens = list(streamed.tokens())
+        scanned = Scanner(filename)
+        assert tokens == scanned.scan()[0]
+        assert streamed.output == []
+        assert streamed.id_symbol_table == scanned.id_symbol_table
+
+    @pytest.mark.parametrize("filename", ["test0.cmm", "test1.cmm", "test7.cmm"])
+    def test_parse_stream(cls, filename: str) -> None:
+        """Test that a stream of tokens is parsed like the output list."""
+        cmm_scanner = Scanner(filename)
+        cmm_parser = Parser(cmm_scanner, CFG())
+        assert cmm_parser.parse(tokens=cmm_scanner.tokens())
+
+    def test_syntax_error_before_end(cls) -> None:
+        """Test that a syntax error is reported before the rest is scanned."""
+        cmm_scanner = Scanner("test14.cmm")
+        cmm_parser = Parser(cmm_scanner, CFG())
+        with pytest.raises(Exception) as error:
+            cmm_parser.parse(tokens=cmm_scanner.tokens())
+        assert str(error.value).startswith("Error: Expected one of")
+
+        with pytest.raises(Exception) as error:
+            Scanner("test14.cmm").scan()
+        assert str(error.value) == "ERROR: Invalid character found at line 8"
@@ -0,0 +1,94 @@
+from collections.abc import Callable
+
+import pytest
+
+from src.scanner.scanner import Scanner
+from src.scanner.symbol_table import SpanTable, SymbolTable
+
+
+class TestSymbolTable:
+    """Class to bundle tests for the interning symbol table."""
+
+    def build(cls) -> SymbolTable:
+        """Create function to return a table with a few symbols."""
+        table = SymbolTable()
+        for lexeme in ["x", "y", "x", "z", "y"]:
+            table.add(lexeme)
+        return table
+
+    def test_interning(cls) -> None:
+        """Test that repeated lexemes keep their first entry number."""
+        table = SymbolTable()
+        assert [table.add(lexeme) for lexeme in ["x", "y", "x", "z", "y"]] == [
+            1,
+            2,
+            1,
+            3,
+            2,
+        ]
+
+    def test_reverse_index(cls) -> None:
+        """Test lookups in both directions."""
+        table = cls.build()
+        assert table[2] == "y"
+        assert table.index("z") == 3
+        assert table.index("w") is None
+        with pytest.raises(KeyError):
+            table[4]
+
+    def test_dict_compatibility(cls) -> None:
+        """Test that the table compares and prints like the old dictionaries."""
+        table = cls.build()
+        expected = {1: "x", 2: "y", 3: "z"}
+        assert table == expected
+        assert repr(table) == repr(expected)
+        assert SymbolTable() == {}
+
+    def test_slots(cls) -> None:
+        """Test that tables carry no per-instance dictionary."""
+        assert not hasattr(SymbolTable(), "__dict__")
+
+
+class TestSpanTable:
+    """Class to bundle tests for the symbol table saving spans of the source."""
+
+    def test_interning(cls) -> None:
+        """Test that repeated lexemes keep the span of their first occurrence."""
+        table = SpanTable('"a" "bc" "a" "a"')
+        assert [table.add_span(*span) for span in [(0, 3), (4, 8), (9, 12)]] == [
+            1,
+            2,
+            1,
+        ]
+        assert table == {1: '"a"', 2: '"bc"'}
+        assert repr(table) == repr({1: '"a"', 2: '"bc"'})
+        assert list(table.starts) == [0, 4]
+        assert table.index('"bc"') == 2
+        assert table.index('"b"') is None
+        with pytest.raises(TypeError):
+            table.add('"a"')
+
+    def test_hash_collisions(cls) -> None:
+        """Test that lexemes sharing a hash still get their own entries."""
+        table = SpanTable("-1 -2")
+        assert table.add_span(0, 1) == 1
+        # Pretend that "-1" has the same hash as "-"
+        table.indices[hash("-1")] = 1
+        assert table.add_span(0, 2) == 2
+        assert table.add_span(0, 2) == 2
+        assert table.index("-") == 1
+        assert table == {1: "-", 2: "-1"}
+
+    @pytest.mark.parametrize("chunk_size", [3, 64 * 1024])
+    def test_same_as_copies(
+        cls, filename: str, chunk_size: int, scan: Callable
+    ) -> None:
+        """Test that span tables hold the same lexemes as copied ones."""
+        scanner = Scanner(filename, chunk_size=chunk_size, span_tables=True)
+        assert scan(scanner) == scan(Scanner(filename))
+        assert isinstance(scanner.string_symbol_table, SpanTable)
+
+    def test_table_backend_only(cls) -> None:
+        """Test that other backends reject span tables."""
+        with pytest.raises(ValueError):
+            Scanner("test1.cmm", backend="regex", span_tables=True)
@@ -0,0 +1,110 @@
+import pytest
+
+from src.parser.cfg import CFG
+from src.parser.parser import Parser
+from src.parser.tree import Node, SyntaxTree, TreeVisitor
+from src.scanner.scanner import Scanner
+
+PROGRAM = (
+    "int a[10];\n"
+    "void f(void) { return; }\n"
+    "void main(void) {\n"
+    "    int x;\n"
+    "    x = 1 + 2 * y;\n"
+    "    if (x < 3) write x; else read x;\n"
+    "    return;\n"
+    "}\n"
+)
+
+
+class TestSyntaxTree:
+    """Class to bundle tests for the syntax trees built by the parser."""
+
+    def parse(cls, tree: str) -> tuple[Parser, Scanner]:
+        """Create function to parse the program, building a syntax tree."""
+        cmm_scanner = Scanner(source=PROGRAM)
+        cmm_scanner.scan()
+        parser = Parser(cmm_scanner, CFG())
+        assert parser.parse(tree=tree) is True
+        return parser, cmm_scanner
+
+    def test_concrete_tokens(cls) -> None:
+        """Test that the leaves of the concrete tree are the tokens, in order."""
+        parser, cmm_scanner = cls.parse("concrete")
+        tokens = [node.token for node in parser.tree.root.walk() if node.is_terminal]
+        assert [token for token in tokens if token is not None] == list(
+            range(len(cmm_scanner.output))
+        )
+
+    def test_concrete_productions(cls) -> None:
+        """Test that the children of every non terminal are a production of it."""
+        parser, _ = cls.parse("concrete")
+        cfg = parser.cfg
+        productions = {
+            (production.split("->")[0], tuple(s for s in rhs if s != "ε"))
+            for production, rhs in zip(cfg.productions, cfg.rhs_productions.values())
+        }
+        for node in parser.tree.root.walk():
+            if node.is_terminal:
+                continue
+            children = tuple(child.kind for child in node.children())
+            assert (node.kind, children) in productions
+
+    def test_abstract_shape(cls) -> None:
+        """Test that the abstract tree keeps only statements and expressions."""
+        parser, _ = cls.parse("abstract")
+        root = parser.tree.root
+        assert root.kind == "program"
+        assert [child.kind for child in root.children()] == [
+            "declaration_list",
+            "void",
+            "ID",
+            "void",
+            "compound_stmt",
+        ]
+
+        statements = [node for node in root.walk() if node.kind == "statement"]
+        assert [child.kind for child in statements[0].children()] == [
+            "ID",
+            "=",
+            "arithmetic_expression",
+        ]
+        kinds = {node.kind for node in root.walk()}
+        assert not kinds & {";", "(", ")", "{", "}", "statement_list'"}
+        assert all(
+            node.parent.index < node.index for node in root.walk() if node.parent
+        )
+
+    def test_visitor(cls) -> None:
+        """Test that visitors dispatch on kinds, with quotes written as `_prime`."""
+
+        class Collector(TreeVisitor):
+            def __init__(self) -> None:
+                self.visited = []
+
+            def visit_statement(self, node: Node) -> None:
+                self.visited.append(node.kind)
+                self.generic_visit(node)
+
+            def visit_factor_prime(self, node: Node) -> None:
+                self.visited.append(node.kind)
+
+        parser, _ = cls.parse("concrete")
+        collector = Collector()
+        collector.visit(parser.tree.root)
+        assert collector.visited.count("statement") == 4
+        assert "factor'" in collector.visited
+
+    def test_unknown_tree(cls) -> None:
+        """Test that only known kinds of trees can be built."""
+        cmm_scanner = Scanner(source=PROGRAM)
+        cmm_scanner.scan()
+        with pytest.raises(ValueError):
+            Parser(cmm_scanner, CFG()).parse(tree="dense")
+
+    @pytest.mark.parametrize("tree", ["concrete", "abstract"])
+    def test_node_size(cls, tree: str) -> None:
+        """Test that every node takes a few bytes of arrays, and no object."""
+        parser, _ = cls.parse(tree)
+        assert isinstance(parser.tree, SyntaxTree)
+        assert parser.tree.nbytes / len(parser.tree) < 32
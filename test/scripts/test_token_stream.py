@@ -0,0 +1,58 @@
+import pytest
+
+from src.parser.cfg import CFG
+from src.parser.parser import Parser
+from src.scanner.scanner import Scanner
+from src.scanner.token_stream import TokenStream
+
+
+class TestTokenStream:
+    """Class to bundle tests for the compact token stream."""
+
+    def test_sequence_access(cls) -> None:
+        """Test that tokens are read back as the scanner tuples."""
+        tokens = [(1,), (34, 1), (20,), (35, 70000)]
+        stream = TokenStream(tokens)
+        assert len(stream) == 4
+        assert stream[1] == (34, 1)
+        assert stream[-1] == (35, 70000)
+        assert list(stream) == tokens
+        assert stream[1:3] == tokens[1:3]
+        assert stream == tokens
+        assert repr(stream) == repr(tokens)
+
+    def test_not_tokens(cls) -> None:
+        """Test that a stream only equals sequences of the same token tuples."""
+        stream = TokenStream([(1,), (34, 2)])
+        assert stream != [[9], [9, 9]]
+        assert stream != ["ab", "cd"]
+        assert stream != [(1,), (34, 3)]
+        assert stream != [(1,)]
+
+    @pytest.mark.parametrize("backend", Scanner.backends)
+    def test_offsets(cls, backend: str) -> None:
+        """Test that a scanner saving spans fills the offsets of its stream."""
+        cmm_scanner = Scanner(
+            "test3.cmm", backend=backend, token_stream=True, spans=True
+        )
+        stream = cmm_scanner.scan()[0]
+        text = cmm_scanner.path.read_text(encoding="utf-8")
+        assert stream.offsets is cmm_scanner.starts
+        assert len(stream.offsets) == len(stream)
+        assert text.startswith("miniloc", stream.offsets[1])
+        assert list(stream[1:3].offsets) == list(stream.offsets[1:3])
+        assert Scanner("test3.cmm", token_stream=True).scan()[0].offsets is None
+
+    def test_invalid_kind(cls) -> None:
+        """Test that kinds must fit in the byte array."""
+        with pytest.raises(OverflowError):
+            TokenStream([(256,)])
+
+    @pytest.mark.parametrize("filename", ["test0.cmm", "test1.cmm", "test7.cmm"])
+    def test_scan_and_parse(cls, filename: str) -> None:
+        """Test that a scanner saving a TokenStream gives the same results."""
+        cmm_scanner = Scanner(filename, token_stream=True)
+        results = cmm_scanner.scan()
+        assert isinstance(results[0], TokenStream)
+        assert results == Scanner(filename).scan()
+        assert Parser(cmm_scanner, CFG()).parse()
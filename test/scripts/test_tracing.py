@@ -0,0 +1,77 @@
+import io
+from pathlib import Path
+
+import pytest
+
+from src.parser.cfg import CFG
+from src.parser.parser import Parser
+from src.parser.tracing import FileWriter, RingBuffer, Tracer
+from src.scanner.scanner import Scanner
+
+PROGRAM = "void main(void) { x = 1; return; }"
+
+
+class TestTracing:
+    """Class to bundle tests for the parser tracing levels and sinks."""
+
+    def parse(cls, source: str, tracer: Tracer | None = None) -> bool:
+        """Create function to scan and parse a source with a tracer."""
+        cmm_scanner = Scanner(source=source)
+        cmm_scanner.scan()
+        return Parser(cmm_scanner, CFG(), tracer).parse()
+
+    def test_off_by_default(cls, capsys: pytest.CaptureFixture) -> None:
+        """Test that the parser prints nothing unless tracing is on."""
+        assert cls.parse(PROGRAM)
+        assert capsys.readouterr().out == ""
+
+    @pytest.mark.parametrize(
+        ("level", "matched", "predicted"),
+        [("off", 0, 0), ("summary", 0, 0), ("tokens", 13, 0), ("predictions", 13, 18)],
+    )
+    def test_levels(cls, level: str, matched: int, predicted: int) -> None:
+        """Test that every level adds its events to the ones below it."""
+        sink = RingBuffer(size=100)
+        assert cls.parse(PROGRAM, Tracer(level, sink))
+        events = list(sink.events)
+        assert sum(event.startswith("Matched") for event in events) == matched
+        assert sum(event.startswith("Predicted") for event in events) == predicted
+        assert (events[-1:] == ["Parsing successful. Matched 13 tokens."]) == (
+            level != "off"
+        )
+
+    def test_predictions(cls) -> None:
+        """Test that predictions name the production and its number."""
+        sink = RingBuffer(size=100)
+        cls.parse(PROGRAM, Tracer("predictions", sink))
+        assert sink.events[0] == (
+            "Predicted 1: program->declaration_list void ID ( void ) compound_stmt "
+            "for program on 'void'"
+        )
+        assert sink.events[1] == (
+            "Predicted 3: declaration_list->ε for declaration_list on 'void'"
+        )
+
+    def test_ring_buffer_error(cls) -> None:
+        """Test that only the last events are kept and dumped with the error."""
+        stream = io.StringIO()
+        sink = RingBuffer(size=3, stream=stream)
+        with pytest.raises(Exception) as error:
+            cls.parse("void main(void) { x = ; return; }", Tracer("tokens", sink))
+        assert len(sink.events) == 3
+        assert stream.getvalue().splitlines() == [
+            "Last 3 trace events:",
+            "Matched terminal: ID on production ID",
+            "Matched terminal: = on production =",
+            "Parsing failed. Matched 8 tokens.",
+            str(error.value),
+        ]
+
+    def test_file_writer(cls, tmp_path: Path) -> None:
+        """Test that every event is written to the file once the parse ends."""
+        path = tmp_path.joinpath("trace.txt")
+        assert cls.parse(PROGRAM, Tracer("tokens", FileWriter(path)))
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert lines[0] == "Matched terminal: void on production void"
+        assert lines[-1] == "Parsing successful. Matched 13 tokens."
+        assert len(lines) == 14